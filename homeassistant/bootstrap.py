@@ -21,6 +21,7 @@ from homeassistant.const import (
     REQUIRED_NEXT_PYTHON_VER,
 )
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import template
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
@@ -234,6 +235,9 @@ async def async_from_config_dict(
         )
         return None
 
+    # Compile the templates while the integrations that use them are set up
+    hass.async_create_task(template.async_precompile_templates(hass, config))
+
     await _async_set_up_integrations(hass, config)
 
     stop = monotonic()
@@ -59,9 +59,9 @@ class AbstractConfig(ABC):
 
     async def async_disable_proactive_mode(self):
         """Disable proactive mode."""
-        unsub_func = await self._unsub_proactive_report
-        if unsub_func:
-            unsub_func()
+        reporter = await self._unsub_proactive_report
+        if reporter:
+            reporter.async_stop()
         self._unsub_proactive_report = None
 
     @callback
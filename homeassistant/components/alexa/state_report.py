@@ -6,7 +6,15 @@ import logging
 import aiohttp
 import async_timeout
 
-from homeassistant.const import HTTP_ACCEPTED, MATCH_ALL, STATE_ON
+from homeassistant.const import (
+    EVENT_STATE_CHANGED,
+    HTTP_ACCEPTED,
+    HTTP_INTERNAL_SERVER_ERROR,
+    HTTP_TOO_MANY_REQUESTS,
+    STATE_ON,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
 import homeassistant.util.dt as dt_util
 
 from .const import API_CHANGE, Cause
@@ -15,6 +23,11 @@ from .messages import AlexaResponse
 
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
+# Time to collect state changes before reporting them
+REPORT_WINDOW = 1
+MAX_CONCURRENT_REPORTS = 5
+RETRY_ATTEMPTS = 3
+RETRY_DELAY = 1
 
 
 async def async_enable_proactive_mode(hass, smart_home_config):
@@ -25,49 +38,177 @@ async def async_enable_proactive_mode(hass, smart_home_config):
     # Validate we can get access token.
     await smart_home_config.async_get_access_token()
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
-        if not hass.is_running:
-            return
+    reporter = ChangeReporter(hass, smart_home_config)
+    reporter.async_start()
+    return reporter
 
-        if not new_state:
-            return
 
-        if new_state.domain not in ENTITY_ADAPTERS:
+def _property_values(properties):
+    """Return the values of serialized properties, without the time of sample."""
+    return [
+        (prop["namespace"], prop.get("instance"), prop["name"], prop["value"])
+        for prop in properties
+    ]
+
+
+class ChangeReporter:
+    """Send ChangeReports for the exposed entities to Alexa.
+
+    State changes are collected for a short window, so a burst, like a scene
+    changing many lights, sends one report per entity with its latest state.
+    Reports with the same property values as the last one sent for an
+    endpoint are skipped, and failed reports are retried with a backoff.
+    Reports of an endpoint are sent one at a time, a report still waiting to
+    be sent or retried is dropped once a newer one for its endpoint exists.
+    """
+
+    def __init__(self, hass, config):
+        """Initialize the change reporter."""
+        self.hass = hass
+        self.config = config
+        self.stats = {
+            "sent": 0,
+            "skipped": 0,
+            "coalesced": 0,
+            "superseded": 0,
+            "failed": 0,
+        }
+        self._last_sent = {}
+        # The latest report of each endpoint and the lock its reports send under
+        self._latest = {}
+        self._locks = {}
+        self._pending = {}
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REPORTS)
+        self._unsub_listener = None
+        self._unsub_pending = None
+
+    @callback
+    def async_start(self):
+        """Start listening for state changes."""
+        self._unsub_listener = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed
+        )
+
+    @callback
+    def async_stop(self):
+        """Stop reporting state changes."""
+        if self._unsub_listener is not None:
+            self._unsub_listener()
+            self._unsub_listener = None
+        if self._unsub_pending is not None:
+            self._unsub_pending()
+            self._unsub_pending = None
+        self._pending.clear()
+        self._last_sent.clear()
+        self._latest.clear()
+
+    @callback
+    def _async_state_changed(self, event):
+        """Collect the state change of an exposed entity."""
+        if not self.hass.is_running:
             return
 
-        if not smart_home_config.should_expose(changed_entity):
-            _LOGGER.debug("Not exposing %s because filtered by config", changed_entity)
+        new_state = event.data["new_state"]
+
+        if (
+            not new_state
+            or new_state.domain not in ENTITY_ADAPTERS
+            or not self.config.should_expose(new_state.entity_id)
+        ):
             return
 
         alexa_changed_entity = ENTITY_ADAPTERS[new_state.domain](
-            hass, smart_home_config, new_state
+            self.hass, self.config, new_state
         )
 
         for interface in alexa_changed_entity.interfaces():
             if interface.properties_proactively_reported():
-                await async_send_changereport_message(
-                    hass, smart_home_config, alexa_changed_entity
-                )
+                if new_state.entity_id in self._pending:
+                    self.stats["coalesced"] += 1
+                self._pending[new_state.entity_id] = alexa_changed_entity
+
+                if self._unsub_pending is None:
+                    self._unsub_pending = async_call_later(
+                        self.hass, REPORT_WINDOW, self._async_send_pending
+                    )
                 return
             if (
                 interface.name() == "Alexa.DoorbellEventSource"
                 and new_state.state == STATE_ON
             ):
-                await async_send_doorbell_event_message(
-                    hass, smart_home_config, alexa_changed_entity
+                self.hass.async_create_task(
+                    async_send_doorbell_event_message(
+                        self.hass, self.config, alexa_changed_entity
+                    )
                 )
                 return
 
-    return hass.helpers.event.async_track_state_change(
-        MATCH_ALL, async_entity_state_listener
-    )
+    async def _async_send_pending(self, _now):
+        """Send the ChangeReports collected during the window."""
+        self._unsub_pending = None
+        pending, self._pending = self._pending, {}
+
+        await asyncio.gather(
+            *[self._async_send(alexa_entity) for alexa_entity in pending.values()]
+        )
+        _LOGGER.debug("ChangeReports: %s", self.stats)
+
+    def _is_superseded(self, alexa_entity):
+        """Return if a newer report exists for the endpoint of a report."""
+        return (
+            self._latest.get(alexa_entity.alexa_id()) is not alexa_entity
+            or alexa_entity.entity_id in self._pending
+        )
+
+    async def _async_send(self, alexa_entity):
+        """Send a ChangeReport unless the properties didn't change."""
+        endpoint = alexa_entity.alexa_id()
+        properties = list(alexa_entity.serialize_properties())
+        values = _property_values(properties)
+        self._latest[endpoint] = alexa_entity
+
+        lock = self._locks.setdefault(endpoint, asyncio.Lock())
+        async with lock, self._semaphore:
+            if self._last_sent.get(endpoint) == values:
+                self.stats["skipped"] += 1
+                return
+
+            for attempt in range(RETRY_ATTEMPTS):
+                if attempt:
+                    await asyncio.sleep(RETRY_DELAY * 2 ** (attempt - 1))
+
+                # A stale report sent after a newer one would overwrite it
+                if self._is_superseded(alexa_entity):
+                    self.stats["superseded"] += 1
+                    return
+
+                status = await async_send_changereport_message(
+                    self.hass, self.config, alexa_entity, properties=properties
+                )
+
+                if status == HTTP_ACCEPTED:
+                    self._last_sent[endpoint] = values
+                    self.stats["sent"] += 1
+                    return
+
+                # Only retry when Alexa is unreachable or busy
+                if (
+                    status is not None
+                    and status < HTTP_INTERNAL_SERVER_ERROR
+                    and status != HTTP_TOO_MANY_REQUESTS
+                ):
+                    break
+
+        self.stats["failed"] += 1
 
 
 async def async_send_changereport_message(
-    hass, config, alexa_entity, *, invalidate_access_token=True
+    hass, config, alexa_entity, *, invalidate_access_token=True, properties=None
 ):
     """Send a ChangeReport message for an Alexa entity.
 
+    Return the status of the response, or None if Alexa couldn't be reached.
+
     https://developer.amazon.com/docs/smarthome/state-reporting-for-a-smart-home-skill.html#report-state-with-changereport-events
     """
     token = await config.async_get_access_token()
@@ -79,7 +220,8 @@ async def async_send_changereport_message(
     # this sends all the properties of the Alexa Entity, whether they have
     # changed or not. this should be improved, and properties that have not
     # changed should be moved to the 'context' object
-    properties = list(alexa_entity.serialize_properties())
+    if properties is None:
+        properties = list(alexa_entity.serialize_properties())
 
     payload = {
         API_CHANGE: {"cause": {"type": Cause.APP_INTERACTION}, "properties": properties}
@@ -102,7 +244,7 @@ async def async_send_changereport_message(
 
     except (asyncio.TimeoutError, aiohttp.ClientError):
         _LOGGER.error("Timeout sending report to Alexa")
-        return
+        return None
 
     response_text = await response.text()
 
@@ -110,7 +252,14 @@ async def async_send_changereport_message(
     _LOGGER.debug("Received (%s): %s", response.status, response_text)
 
     if response.status == HTTP_ACCEPTED:
-        return
+        return response.status
+
+    if (
+        response.status >= HTTP_INTERNAL_SERVER_ERROR
+        or response.status == HTTP_TOO_MANY_REQUESTS
+    ):
+        _LOGGER.warning("Alexa couldn't accept the ChangeReport (%s)", response.status)
+        return response.status
 
     response_json = json.loads(response_text)
 
@@ -120,7 +269,11 @@ async def async_send_changereport_message(
     ):
         config.async_invalidate_access_token()
         return await async_send_changereport_message(
-            hass, config, alexa_entity, invalidate_access_token=False
+            hass,
+            config,
+            alexa_entity,
+            invalidate_access_token=False,
+            properties=properties,
         )
 
     _LOGGER.error(
@@ -128,6 +281,7 @@ async def async_send_changereport_message(
         response_json["payload"]["code"],
         response_json["payload"]["description"],
     )
+    return response.status
 
 
 async def async_send_add_or_update_message(hass, config, entity_ids):
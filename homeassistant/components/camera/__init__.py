@@ -4,6 +4,7 @@ import base64
 import collections
 from contextlib import suppress
 from datetime import timedelta
+from functools import partial
 import hashlib
 import logging
 import os
@@ -52,6 +53,7 @@ from homeassistant.helpers.network import get_url
 from homeassistant.loader import bind_hass
 
 from .const import DATA_CAMERA_PREFS, DOMAIN
+from .frame_broker import FrameBroker
 from .prefs import CameraPreferences
 
 # mypy: allow-untyped-calls, allow-untyped-defs
@@ -151,10 +153,11 @@ async def async_request_stream(hass, entity_id, fmt):
 async def async_get_image(hass, entity_id, timeout=10):
     """Fetch an image from a camera entity."""
     camera = _get_camera_from_entity_id(hass, entity_id)
+    max_age = hass.data[DATA_CAMERA_PREFS].get(entity_id).frame_cache_ttl
 
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            image = await camera.async_camera_image()
+            _, image = await camera.frame_broker.async_get_frame(max_age)
 
             if image:
                 return Image(camera.content_type, image)
@@ -183,6 +186,27 @@ async def async_get_still_stream(request, image_cb, content_type, interval):
 
     This method must be run in the event loop.
     """
+    last_image = None
+    sequence = 0
+
+    async def frame_cb():
+        """Return the next image, numbered when it differs from the last one."""
+        nonlocal last_image, sequence
+        img_bytes = await image_cb()
+        if img_bytes != last_image:
+            last_image = img_bytes
+            sequence += 1
+        return sequence, img_bytes
+
+    return await _async_get_frame_stream(request, frame_cb, content_type, interval)
+
+
+async def _async_get_frame_stream(request, frame_cb, content_type, interval):
+    """Generate an HTTP MJPEG stream from numbered camera frames.
+
+    A frame is only written when its sequence number differs from the last
+    written one. This method must be run in the event loop.
+    """
     response = web.StreamResponse()
     response.content_type = "multipart/x-mixed-replace; boundary=--frameboundary"
     await response.prepare(request)
@@ -196,25 +220,26 @@ async def async_get_still_stream(request, image_cb, content_type, interval):
                 "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
                 "utf-8",
             )
-            + img_bytes
-            + b"\r\n"
         )
+        # Written separately to not copy the frame shared with other viewers
+        await response.write(img_bytes)
+        await response.write(b"\r\n")
 
-    last_image = None
+    last_sequence = None
 
     while True:
-        img_bytes = await image_cb()
+        sequence, img_bytes = await frame_cb()
         if not img_bytes:
             break
 
-        if img_bytes != last_image:
+        if sequence != last_sequence:
             await write_to_mjpeg_stream(img_bytes)
 
             # Chrome seems to always ignore first picture,
             # print it twice.
-            if last_image is None:
+            if last_sequence is None:
                 await write_to_mjpeg_stream(img_bytes)
-            last_image = img_bytes
+            last_sequence = sequence
 
         await asyncio.sleep(interval)
 
@@ -331,6 +356,7 @@ class Camera(Entity):
         self.stream_options = {}
         self.content_type = DEFAULT_CONTENT_TYPE
         self.access_tokens: collections.deque = collections.deque([], 2)
+        self.frame_broker = FrameBroker(self)
         self.async_update_token()
 
     @property
@@ -386,9 +412,15 @@ class Camera(Entity):
         return await self.hass.async_add_executor_job(self.camera_image)
 
     async def handle_async_still_stream(self, request, interval):
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
+        """Generate an HTTP MJPEG stream from camera images.
+
+        The frames are shared with the other viewers of the camera.
+        """
+        return await _async_get_frame_stream(
+            request,
+            partial(self.frame_broker.async_get_frame, interval),
+            self.content_type,
+            interval,
         )
 
     async def handle_async_mjpeg_stream(self, request):
@@ -512,9 +544,13 @@ class CameraImageView(CameraView):
 
     async def handle(self, request: web.Request, camera: Camera) -> web.Response:
         """Serve camera image."""
+        prefs = camera.hass.data[DATA_CAMERA_PREFS].get(camera.entity_id)
+
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(10):
-                image = await camera.async_camera_image()
+                _, image = await camera.frame_broker.async_get_frame(
+                    prefs.frame_cache_ttl
+                )
 
             if image:
                 return web.Response(body=image, content_type=camera.content_type)
@@ -629,6 +665,7 @@ async def websocket_get_prefs(hass, connection, msg):
         vol.Required("type"): "camera/update_prefs",
         vol.Required("entity_id"): cv.entity_id,
         vol.Optional("preload_stream"): bool,
+        vol.Optional("frame_cache_ttl"): vol.All(vol.Coerce(float), vol.Range(min=0)),
     }
 )
 async def websocket_update_prefs(hass, connection, msg):
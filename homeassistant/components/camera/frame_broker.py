@@ -0,0 +1,74 @@
+"""Share the frames of a camera between all of its viewers."""
+import asyncio
+import time
+from typing import TYPE_CHECKING, Optional, Tuple
+
+import async_timeout
+
+if TYPE_CHECKING:
+    from . import Camera
+
+# mypy: allow-untyped-calls
+
+# Seconds a single fetch from the camera may take
+FETCH_TIMEOUT = 10
+
+
+class FrameBroker:
+    """Fetch camera frames once and serve them to every viewer.
+
+    Concurrent requests share a single upstream fetch, and a fetched frame is
+    reused as the same bytes object until it is older than the maximum age
+    the caller accepts. Every new frame gets the next sequence number, so
+    viewers detect new frames without comparing their content.
+    """
+
+    def __init__(self, camera: "Camera") -> None:
+        """Initialize the frame broker."""
+        self._camera = camera
+        self._frame: Optional[bytes] = None
+        self._fetched = 0.0
+        self._fetch: Optional[asyncio.Future] = None
+        self.sequence = 0
+        self.fetches = 0
+
+    async def async_get_frame(self, max_age: float) -> Tuple[int, Optional[bytes]]:
+        """Return the sequence number and content of a recent frame.
+
+        A cached frame is returned when it was fetched less than max_age
+        seconds ago, otherwise a new frame is fetched from the camera.
+        """
+        if self._frame is not None and time.monotonic() - self._fetched < max_age:
+            return self.sequence, self._frame
+
+        if self._fetch is None:
+            self._fetch = self._camera.hass.async_create_task(self._async_fetch())
+            self._fetch.add_done_callback(_retrieve_exception)
+
+        # A viewer that goes away must not cancel the fetch of the others
+        return await asyncio.shield(self._fetch)
+
+    async def _async_fetch(self) -> Tuple[int, Optional[bytes]]:
+        """Fetch a frame from the camera."""
+        try:
+            self.fetches += 1
+            async with async_timeout.timeout(FETCH_TIMEOUT):
+                image = await self._camera.async_camera_image()
+        finally:
+            self._fetch = None
+
+        if not image:
+            return self.sequence, image
+
+        # Compared once per fetch instead of once per viewer and frame
+        if image is not self._frame and image != self._frame:
+            self._frame = image
+            self.sequence += 1
+        self._fetched = time.monotonic()
+        return self.sequence, self._frame
+
+
+def _retrieve_exception(fetch: asyncio.Future) -> None:
+    """Mark the exception of a fetch as retrieved when all viewers went away."""
+    if not fetch.cancelled():
+        fetch.exception()
@@ -1,11 +1,12 @@
 """Allows the creation of a sensor that filters state property."""
+from bisect import bisect_left, insort
 from collections import Counter, deque
 from copy import copy
 from datetime import timedelta
 from functools import partial
 import logging
+import math
 from numbers import Number
-import statistics
 from typing import Optional
 
 import voluptuous as vol
@@ -485,15 +486,24 @@ class OutlierFilter(Filter):
         self._radius = radius
         self._stats_internal = Counter()
         self._store_raw = True
+        # The values of the window in order, to find the median with a lookup
+        self._sorted = []
+
+    def _median(self):
+        """Return the median of the values of the window."""
+        count = len(self._sorted)
+        middle = count // 2
+        if count % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
 
     def _filter_state(self, new_state):
         """Implement the outlier filter."""
+        raw_state = new_state.state
+        full = len(self.states) == self.states.maxlen
 
-        median = statistics.median([s.state for s in self.states]) if self.states else 0
-        if (
-            len(self.states) == self.states.maxlen
-            and abs(new_state.state - median) > self._radius
-        ):
+        median = self._median() if self._sorted else 0
+        if full and self._sorted and abs(new_state.state - median) > self._radius:
 
             self._stats_internal["erasures"] += 1
 
@@ -504,6 +514,15 @@ class OutlierFilter(Filter):
                 new_state,
             )
             new_state.state = median
+
+        # The raw state is added to the window after filtering. NaN doesn't
+        # compare to any number, it is kept out of the sorted values.
+        if self.states.maxlen:
+            if full and not math.isnan(self.states[0].state):
+                del self._sorted[bisect_left(self._sorted, self.states[0].state)]
+            if not math.isnan(raw_state):
+                insort(self._sorted, raw_state)
+
         return new_state
 
 
@@ -549,30 +568,52 @@ class TimeSMAFilter(Filter):
         self._time_window = window_size
         self.last_leak = None
         self.queue = deque()
+        # Time weighted sum between the first and the last state of the queue
+        self._queue_sum = 0.0
+        self._leaks = 0
+
+    @staticmethod
+    def _weight(state, next_state):
+        """Return the value of a state weighted by the time until the next one."""
+        return (next_state.timestamp - state.timestamp).total_seconds() * state.state
 
     def _leak(self, left_boundary):
         """Remove timeouted elements."""
         while self.queue:
             if self.queue[0].timestamp + self._time_window <= left_boundary:
                 self.last_leak = self.queue.popleft()
+                if self.queue:
+                    self._queue_sum -= self._weight(self.last_leak, self.queue[0])
+                self._leaks += 1
             else:
-                return
+                break
+
+        if self._leaks >= len(self.queue):
+            # Recompute once per queue worth of leaks to bound rounding drift
+            self._leaks = 0
+            self._queue_sum = 0.0
+            for idx in range(1, len(self.queue)):
+                self._queue_sum += self._weight(self.queue[idx - 1], self.queue[idx])
 
     def _filter_state(self, new_state):
         """Implement the Simple Moving Average filter."""
 
         self._leak(new_state.timestamp)
+        if self.queue:
+            self._queue_sum += self._weight(self.queue[-1], new_state)
         self.queue.append(copy(new_state))
 
-        moving_sum = 0
+        # The window starts with the last state that left it, until the first
+        # state in the queue
         start = new_state.timestamp - self._time_window
-        prev_state = self.last_leak or self.queue[0]
-        for state in self.queue:
-            moving_sum += (state.timestamp - start).total_seconds() * prev_state.state
-            start = state.timestamp
-            prev_state = state
+        first_state = self.queue[0]
+        moving_sum = (first_state.timestamp - start).total_seconds() * (
+            self.last_leak or first_state
+        ).state
 
-        new_state.state = moving_sum / self._time_window.total_seconds()
+        new_state.state = (
+            moving_sum + self._queue_sum
+        ) / self._time_window.total_seconds()
 
         return new_state
 
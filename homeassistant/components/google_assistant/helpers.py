@@ -42,7 +42,7 @@ _LOGGER = logging.getLogger(__name__)
 class AbstractConfig(ABC):
     """Hold the configuration for Google Assistant."""
 
-    _unsub_report_state = None
+    _report_state = None
 
     def __init__(self, hass):
         """Initialize abstract config."""
@@ -74,7 +74,7 @@ class AbstractConfig(ABC):
     @property
     def is_reporting_state(self):
         """Return if we're actively reporting states."""
-        return self._unsub_report_state is not None
+        return self._report_state is not None
 
     @property
     def is_local_sdk_active(self):
@@ -131,20 +131,23 @@ class AbstractConfig(ABC):
         # pylint: disable=import-outside-toplevel
         from .report_state import async_enable_report_state
 
-        if self._unsub_report_state is None:
-            self._unsub_report_state = async_enable_report_state(self.hass, self)
+        if self._report_state is None:
+            self._report_state = async_enable_report_state(self.hass, self)
 
     @callback
     def async_disable_report_state(self):
         """Disable report state."""
-        if self._unsub_report_state is not None:
-            self._unsub_report_state()
-            self._unsub_report_state = None
+        if self._report_state is not None:
+            self._report_state.async_stop()
+            self._report_state = None
 
     async def async_sync_entities(self, agent_user_id: str):
         """Sync all entities to Google."""
         # Remove any pending sync
         self._google_sync_unsub.pop(agent_user_id, lambda: None)()
+        # Syncing follows changes of the exposed entities
+        if self._report_state is not None:
+            self._report_state.async_refresh_entities()
         return await self._async_request_sync_devices(agent_user_id)
 
     async def async_sync_entities_all(self):
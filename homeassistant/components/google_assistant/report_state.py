@@ -1,9 +1,14 @@
 """Google Report State implementation."""
 import logging
+from typing import Dict, Optional
 
-from homeassistant.const import MATCH_ALL
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_call_later
+from homeassistant.const import CLOUD_NEVER_EXPOSED_ENTITIES, MATCH_ALL
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_added_domain,
+    async_track_state_change_event,
+)
 
 from .error import SmartHomeError
 from .helpers import AbstractConfig, GoogleEntity, async_get_entities
@@ -12,6 +17,9 @@ from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Time to collect state changes to report them together
+REPORT_STATE_WINDOW = 1
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,61 +27,178 @@ _LOGGER = logging.getLogger(__name__)
 @callback
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
     """Enable state reporting."""
+    reporter = StateReporter(hass, google_config)
+    reporter.async_start()
+    return reporter
+
+
+class StateReporter:
+    """Report the states of the exposed entities to Google.
+
+    Only state changes of exposed entities are tracked. The last state
+    reported for each entity is kept to skip changes Google doesn't care
+    about, and the changes are collected for a short window to report
+    them together.
+    """
+
+    def __init__(self, hass: HomeAssistant, google_config: AbstractConfig):
+        """Initialize the state reporter."""
+        self.hass = hass
+        self.google_config = google_config
+        self._reported: Dict[str, dict] = {}
+        self._pending: Dict[str, dict] = {}
+        self._unsub_entities: Dict[str, CALLBACK_TYPE] = {}
+        self._unsub_added: Optional[CALLBACK_TYPE] = None
+        self._unsub_initial: Optional[CALLBACK_TYPE] = None
+        self._unsub_pending: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def async_start(self):
+        """Start tracking the exposed entities."""
+        self._unsub_added = async_track_state_added_domain(
+            self.hass, MATCH_ALL, self._async_entity_added
+        )
+        self.async_refresh_entities()
+        self._unsub_initial = async_call_later(
+            self.hass, INITIAL_REPORT_DELAY, self._async_initial_report
+        )
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
-        if not hass.is_running:
-            return
+    @callback
+    def async_stop(self):
+        """Stop reporting states."""
+        for unsub in (self._unsub_added, self._unsub_initial, self._unsub_pending):
+            if unsub is not None:
+                unsub()
+        self._unsub_added = self._unsub_initial = self._unsub_pending = None
+
+        for unsub in self._unsub_entities.values():
+            unsub()
+        self._unsub_entities.clear()
+        self._reported.clear()
+        self._pending.clear()
+
+    @callback
+    def async_refresh_entities(self):
+        """Track the entities that are exposed now."""
+        exposed = {
+            entity.entity_id
+            for entity in async_get_entities(self.hass, self.google_config)
+            if entity.should_expose()
+        }
+
+        for entity_id in set(self._unsub_entities) - exposed:
+            self._unsub_entities.pop(entity_id)()
+            self._reported.pop(entity_id, None)
+            self._pending.pop(entity_id, None)
+
+        for entity_id in exposed - set(self._unsub_entities):
+            self._async_track(entity_id)
+
+    @callback
+    def _async_track(self, entity_id: str):
+        """Track the state changes of an entity."""
+        self._unsub_entities[entity_id] = async_track_state_change_event(
+            self.hass, entity_id, self._async_entity_changed
+        )
 
-        if not new_state:
+    @callback
+    def _async_entity_added(self, event: Event):
+        """Start tracking an entity when it is added and exposed."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+
+        if (
+            entity_id in self._unsub_entities
+            or entity_id in CLOUD_NEVER_EXPOSED_ENTITIES
+            or not self.google_config.should_expose(new_state)
+            or not GoogleEntity(self.hass, self.google_config, new_state).is_supported()
+        ):
             return
 
-        if not google_config.should_expose(new_state):
-            return
+        self._async_track(entity_id)
+        self._async_entity_changed(event)
 
-        entity = GoogleEntity(hass, google_config, new_state)
+    @callback
+    def _async_serialize(self, state: State) -> Optional[dict]:
+        """Serialize the state of an entity, if it can be queried."""
+        entity = GoogleEntity(self.hass, self.google_config, state)
 
         if not entity.is_supported():
-            return
+            return None
 
         try:
-            entity_data = entity.query_serialize()
+            return entity.query_serialize()
         except SmartHomeError as err:
-            _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
+            _LOGGER.debug("Not reporting state for %s: %s", state.entity_id, err.code)
+            return None
+
+    @callback
+    def _async_entity_changed(self, event: Event):
+        """Collect the state change of an exposed entity."""
+        if not self.hass.is_running:
             return
 
-        if old_state:
-            old_entity = GoogleEntity(hass, google_config, old_state)
+        new_state = event.data["new_state"]
 
-            # Only report to Google if data that Google cares about has changed
-            if entity_data == old_entity.query_serialize():
-                return
+        if not new_state or not self.google_config.should_expose(new_state):
+            return
 
-        _LOGGER.debug("Reporting state for %s: %s", changed_entity, entity_data)
+        entity_data = self._async_serialize(new_state)
 
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        if entity_data is None:
+            return
+
+        entity_id = new_state.entity_id
+        last_data = self._reported.get(entity_id)
+
+        if last_data is None and event.data["old_state"]:
+            last_data = self._async_serialize(event.data["old_state"])
+            if last_data is not None:
+                self._reported[entity_id] = last_data
 
-    async def inital_report(_now):
+        # Only report to Google if data that Google cares about has changed
+        if entity_data == last_data:
+            self._pending.pop(entity_id, None)
+            return
+
+        self._pending[entity_id] = entity_data
+
+        if self._unsub_pending is None:
+            self._unsub_pending = async_call_later(
+                self.hass, REPORT_STATE_WINDOW, self._async_report_pending
+            )
+
+    async def _async_report(self, states: Dict[str, dict]):
+        """Report states to Google."""
+        self._reported.update(states)
+        _LOGGER.debug("Reporting state for %s", states)
+        await self.google_config.async_report_state_all({"devices": {"states": states}})
+
+    async def _async_report_pending(self, _now):
+        """Report the state changes collected during the window."""
+        self._unsub_pending = None
+        states, self._pending = self._pending, {}
+
+        if states:
+            await self._async_report(states)
+
+    async def _async_initial_report(self, _now):
         """Report initially all states."""
+        self._unsub_initial = None
         entities = {}
 
-        for entity in async_get_entities(hass, google_config):
-            if not entity.should_expose():
+        for entity_id in self._unsub_entities:
+            state = self.hass.states.get(entity_id)
+
+            if state is None or not self.google_config.should_expose(state):
                 continue
 
             try:
-                entities[entity.entity_id] = entity.query_serialize()
+                entities[entity_id] = GoogleEntity(
+                    self.hass, self.google_config, state
+                ).query_serialize()
             except SmartHomeError:
                 continue
 
-        if not entities:
-            return
-
-        await google_config.async_report_state_all({"devices": {"states": entities}})
-
-    async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
-
-    return hass.helpers.event.async_track_state_change(
-        MATCH_ALL, async_entity_state_listener
-    )
+        if entities:
+            await self._async_report(entities)
@@ -1,7 +1,8 @@
 """Provide the functionality to group entities."""
 import asyncio
+from collections import Counter
 import logging
-from typing import Any, Iterable, List, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import voluptuous as vol
 
@@ -42,6 +43,7 @@ from homeassistant.loader import bind_hass
 
 DOMAIN = "group"
 GROUP_ORDER = "group_order"
+GROUP_EXPAND_CACHE = "group_expand_cache"
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
@@ -126,7 +128,8 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
 
     Async friendly.
     """
-    found_ids: List[str] = []
+    # Ordered set of the entity ids found
+    found_ids: Dict[str, None] = {}
     for entity_id in entity_ids:
         if not isinstance(entity_id, str) or entity_id in (
             ENTITY_MATCH_NONE,
@@ -141,25 +144,83 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
             domain, _ = ha.split_entity_id(entity_id)
 
             if domain == DOMAIN:
-                child_entities = get_entity_ids(hass, entity_id)
-                if entity_id in child_entities:
-                    child_entities = list(child_entities)
-                    child_entities.remove(entity_id)
-                found_ids.extend(
-                    ent_id
-                    for ent_id in expand_entity_ids(hass, child_entities)
-                    if ent_id not in found_ids
-                )
+                found_ids.update(dict.fromkeys(_expand_group(hass, entity_id)))
 
             else:
-                if entity_id not in found_ids:
-                    found_ids.append(entity_id)
+                found_ids[entity_id] = None
 
         except AttributeError:
             # Raised by split_entity_id if entity_id is not a string
             pass
 
-    return found_ids
+    return list(found_ids)
+
+
+def _group_members(hass: HomeAssistantType, entity_id: str) -> Any:
+    """Return the member attribute of a group state, None without a group state."""
+    group = hass.states.get(entity_id)
+
+    if not group:
+        return None
+
+    return group.attributes.get(ATTR_ENTITY_ID)
+
+
+def _expand_group(hass: HomeAssistantType, entity_id: str) -> Tuple[str, ...]:
+    """Return the members of a group with the nested groups replaced by theirs.
+
+    The flattened members are cached with the members of every group they
+    were expanded from, and expanded again once one of them changes.
+    """
+    cache: Dict[str, Tuple[Dict[str, Any], Tuple[str, ...]]] = hass.data.setdefault(
+        GROUP_EXPAND_CACHE, {}
+    )
+    cached = cache.get(entity_id)
+
+    if cached is not None:
+        expanded_from, members = cached
+        for group_id, group_members in expanded_from.items():
+            current = _group_members(hass, group_id)
+            if current is not group_members and current != group_members:
+                break
+        else:
+            return members
+
+    expanded_from = {}
+    found_ids: Dict[str, None] = {}
+    _flatten_group(hass, entity_id, expanded_from, found_ids)
+    members = tuple(found_ids)
+    cache[entity_id] = (expanded_from, members)
+    return members
+
+
+def _flatten_group(
+    hass: HomeAssistantType,
+    entity_id: str,
+    expanded_from: Dict[str, Any],
+    found_ids: Dict[str, None],
+) -> None:
+    """Add the members of a group and of its nested groups to the found ids.
+
+    Groups already expanded are skipped, so groups containing themselves,
+    directly or through other groups, are expanded once.
+    """
+    group_members = expanded_from[entity_id] = _group_members(hass, entity_id)
+
+    for member_id in group_members or ():
+        if not isinstance(member_id, str) or member_id in (
+            ENTITY_MATCH_NONE,
+            ENTITY_MATCH_ALL,
+        ):
+            continue
+
+        member_id = member_id.lower()
+        domain, _ = ha.split_entity_id(member_id)
+
+        if domain != DOMAIN:
+            found_ids[member_id] = None
+        elif member_id not in expanded_from:
+            _flatten_group(hass, member_id, expanded_from, found_ids)
 
 
 @bind_hass
@@ -429,6 +490,10 @@ class Group(Entity):
         self._order = order
         self._assumed_state = False
         self._async_unsub_state_changed = None
+        # The state and assumed state of the members that have a state
+        self._member_states: Dict[str, Tuple[str, bool]] = {}
+        self._state_counts: Counter = Counter()
+        self._assumed_count = 0
 
     @staticmethod
     def create_group(
@@ -567,6 +632,7 @@ class Group(Entity):
             self._async_unsub_state_changed = async_track_state_change_event(
                 self.hass, self.tracking, self._async_state_changed_listener
             )
+            self._async_count_members()
 
     async def async_stop(self):
         """Unregister the group from Home Assistant.
@@ -580,6 +646,7 @@ class Group(Entity):
     async def async_update(self):
         """Query all members and determine current group state."""
         self._state = STATE_UNKNOWN
+        self._async_count_members()
         self._async_update_group_state()
 
     async def async_added_to_hass(self):
@@ -602,84 +669,86 @@ class Group(Entity):
         if self._async_unsub_state_changed is None:
             return
 
+        new_state = event.data.get("new_state")
         self.async_set_context(event.context)
-        self._async_update_group_state(event.data.get("new_state"))
+        self._async_update_member(event.data["entity_id"], new_state)
+        self._async_update_group_state(new_state)
         self.async_write_ha_state()
 
-    @property
-    def _tracking_states(self):
-        """Return the states that the group is tracking."""
-        states = []
+    @callback
+    def _async_count_members(self):
+        """Count the states of all members.
+
+        This method must be run in the event loop.
+        """
+        self._member_states = {}
+        self._state_counts = Counter()
+        self._assumed_count = 0
 
         for entity_id in self.tracking:
-            state = self.hass.states.get(entity_id)
+            self._async_update_member(entity_id, self.hass.states.get(entity_id))
+
+    @callback
+    def _async_update_member(self, entity_id, new_state):
+        """Update the counts with the new state of a member.
 
-            if state is not None:
-                states.append(state)
+        This method must be run in the event loop.
+        """
+        old = self._member_states.pop(entity_id, None)
 
-        return states
+        if old is not None:
+            self._state_counts[old[0]] -= 1
+            self._assumed_count -= old[1]
+
+        if new_state is None:
+            return
+
+        assumed = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        self._member_states[entity_id] = (new_state.state, assumed)
+        self._state_counts[new_state.state] += 1
+        self._assumed_count += assumed
+
+    def _mode_count(self, count):
+        """Apply the mode of the group to the number of matching members."""
+        if self.mode is all:
+            return count == len(self._member_states)
+
+        return count > 0
 
     @callback
     def _async_update_group_state(self, tr_state=None):
-        """Update group state.
+        """Update group state from the counts of the member states.
 
-        Optionally you can provide the only state changed since last update
-        allowing this method to take shortcuts.
+        Optionally you can provide the only state changed since last update,
+        used to determine the type of the group without going over the members.
 
         This method must be run in the event loop.
         """
-        # To store current states of group entities. Might not be needed.
-        states = None
-        gr_state = self._state
-        gr_on = self.group_on
-        gr_off = self.group_off
-
         # We have not determined type of group yet
-        if gr_on is None:
+        if self.group_on is None:
+            gr_on, gr_off = None, None
+
             if tr_state is None:
-                states = self._tracking_states
+                for entity_id in self.tracking:
+                    member = self._member_states.get(entity_id)
+                    if member is None:
+                        continue
 
-                for state in states:
-                    gr_on, gr_off = _get_group_on_off(state.state)
+                    gr_on, gr_off = _get_group_on_off(member[0])
                     if gr_on is not None:
                         break
             else:
                 gr_on, gr_off = _get_group_on_off(tr_state.state)
 
-            if gr_on is not None:
-                self.group_on, self.group_off = gr_on, gr_off
-
-        # We cannot determine state of the group
-        if gr_on is None:
-            return
-
-        if tr_state is None or (
-            (gr_state == gr_on and tr_state.state == gr_off)
-            or (gr_state == gr_off and tr_state.state == gr_on)
-            or tr_state.state not in (gr_on, gr_off)
-        ):
-            if states is None:
-                states = self._tracking_states
+            # We cannot determine state of the group
+            if gr_on is None:
+                return
 
-            if self.mode(state.state == gr_on for state in states):
-                self._state = gr_on
-            else:
-                self._state = gr_off
+            self.group_on, self.group_off = gr_on, gr_off
 
-        elif tr_state.state in (gr_on, gr_off):
-            self._state = tr_state.state
-
-        if (
-            tr_state is None
-            or self._assumed_state
-            and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
-        ):
-            if states is None:
-                states = self._tracking_states
-
-            self._assumed_state = self.mode(
-                state.attributes.get(ATTR_ASSUMED_STATE) for state in states
-            )
+        if self._mode_count(self._state_counts[self.group_on]):
+            self._state = self.group_on
+        else:
+            self._state = self.group_off
 
-        elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
-            self._assumed_state = True
+        self._assumed_state = self._mode_count(self._assumed_count)
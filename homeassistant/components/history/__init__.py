@@ -1,19 +1,23 @@
 """Provide pre-made queries on top of the recorder component."""
+import asyncio
 from collections import defaultdict
 from datetime import timedelta
 from itertools import groupby
 import json
 import logging
+import threading
 import time
 from typing import Optional, cast
 
 from aiohttp import web
+import async_timeout
 from sqlalchemy import and_, bindparam, func
 from sqlalchemy.ext import baked
 import voluptuous as vol
 
 from homeassistant.components import recorder
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder import statistics
 from homeassistant.components.recorder.models import (
     States,
     process_timestamp,
@@ -27,8 +31,9 @@ from homeassistant.const import (
     CONF_INCLUDE,
     HTTP_BAD_REQUEST,
 )
-from homeassistant.core import Context, State, split_entity_id
+from homeassistant.core import EXECUTOR_DATABASE, Context, State, split_entity_id
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -88,6 +93,13 @@ QUERY_STATES = [
 
 HISTORY_BAKERY = "history_bakery"
 
+# Maximum number of states held in a chunk of the history stream
+STREAM_CHUNK_SIZE = 1000
+# Number of encoded chunks waiting to be written to the client
+STREAM_QUEUE_SIZE = 4
+# Seconds a chunk may take to be written before the client is dropped
+STREAM_WRITE_TIMEOUT = 30
+
 
 def get_significant_states(hass, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
@@ -115,6 +127,37 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
+    query = _significant_states_query(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        significant_changes_only,
+    )
+    states = execute(query)
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_json(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+    )
+
+
+def _significant_states_query(
+    hass, session, start_time, end_time, entity_ids, filters, significant_changes_only
+):
+    """Return the query for the significant states sorted by entity and time."""
     baked_query = hass.data[HISTORY_BAKERY](
         lambda session: session.query(*QUERY_STATES)
     )
@@ -138,25 +181,8 @@ def _get_significant_states(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
-    )
-
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
-
-    return _sorted_states_to_json(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
+    return baked_query(session).params(
+        start_time=start_time, end_time=end_time, entity_ids=entity_ids
     )
 
 
@@ -416,6 +442,103 @@ def _sorted_states_to_json(
     return {key: val for key, val in result.items() if val}
 
 
+def _stream_significant_states(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    chunk_size=STREAM_CHUNK_SIZE,
+):
+    """Yield the significant states during a period in columnar chunks.
+
+    Each chunk holds consecutive states of a single entity:
+    {'entity_id': 'light.kitchen', 'timestamps': [...], 'states': [...],
+     'attributes': [[index, {...}], ...]}
+
+    Attributes are only included when they differ from the previous state
+    of the entity, index is the position of that state within the chunk.
+    Rows are fetched from the database in batches, so at most chunk_size
+    states are held in memory regardless of the length of the period.
+    """
+    initial_states = {}
+    if include_start_time_state:
+        run = recorder.run_information_from_instance(hass, start_time)
+        for state in _get_states_with_session(
+            hass, session, start_time, entity_ids, run=run, filters=filters
+        ):
+            # pylint: disable=protected-access
+            initial_states[state.entity_id] = state._row
+
+    query = _significant_states_query(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        significant_changes_only,
+    ).with_post_criteria(lambda q: q.yield_per(chunk_size))
+
+    chunk = None
+    prev_attributes = None
+
+    for row, timestamp in _timestamped_rows(query, initial_states, start_time):
+        if chunk is None or row.entity_id != chunk["entity_id"]:
+            if chunk is not None:
+                yield chunk
+            chunk = _new_stream_chunk(row.entity_id)
+            prev_attributes = None
+        elif len(chunk["states"]) >= chunk_size:
+            yield chunk
+            chunk = _new_stream_chunk(row.entity_id)
+
+        # Compare the raw JSON to avoid decoding unchanged attributes
+        if row.attributes != prev_attributes:
+            chunk["attributes"].append([len(chunk["states"]), _decode_attributes(row)])
+            prev_attributes = row.attributes
+
+        chunk["timestamps"].append(timestamp)
+        chunk["states"].append(row.state)
+
+    if chunk is not None:
+        yield chunk
+
+
+def _timestamped_rows(query, initial_states, start_time):
+    """Yield rows grouped by entity with the state at start time first."""
+    start_timestamp = start_time.timestamp()
+
+    for ent_id, group in groupby(query, lambda row: row.entity_id):
+        initial_row = initial_states.pop(ent_id, None)
+        if initial_row is not None:
+            yield initial_row, start_timestamp
+
+        for row in group:
+            yield row, process_timestamp(row.last_updated).timestamp()
+
+    # Entities without changes during the period
+    for initial_row in initial_states.values():
+        yield initial_row, start_timestamp
+
+
+def _new_stream_chunk(entity_id):
+    """Return an empty columnar chunk for an entity."""
+    return {"entity_id": entity_id, "timestamps": [], "states": [], "attributes": []}
+
+
+def _decode_attributes(row):
+    """Decode the attributes of a state row."""
+    try:
+        return json.loads(row.attributes)
+    except ValueError:
+        _LOGGER.exception("Error converting attributes of %s", row.entity_id)
+        return {}
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = get_states(hass, utc_point_in_time, (entity_id,), run)
@@ -433,6 +556,8 @@ async def async_setup(hass, config):
     use_include_order = conf.get(CONF_ORDER)
 
     hass.http.register_view(HistoryPeriodView(filters, use_include_order))
+    hass.http.register_view(HistoryStreamView(filters))
+    hass.http.register_view(HistoryStatisticsView())
     hass.components.frontend.async_register_built_in_panel(
         "history", "history", "hass:poll-box"
     )
@@ -456,36 +581,15 @@ class HistoryPeriodView(HomeAssistantView):
         self, request: web.Request, datetime: Optional[str] = None
     ) -> web.Response:
         """Return history over a period of time."""
-        datetime_ = None
-        if datetime:
-            datetime_ = dt_util.parse_datetime(datetime)
-
-            if datetime_ is None:
-                return self.json_message("Invalid datetime", HTTP_BAD_REQUEST)
+        try:
+            start_time, end_time = _period_from_request(request, datetime)
+        except ValueError as err:
+            return self.json_message(str(err), HTTP_BAD_REQUEST)
 
-        now = dt_util.utcnow()
-
-        one_day = timedelta(days=1)
-        if datetime_:
-            start_time = dt_util.as_utc(datetime_)
-        else:
-            start_time = now - one_day
-
-        if start_time > now:
+        if start_time > dt_util.utcnow():
             return self.json([])
 
-        end_time = request.query.get("end_time")
-        if end_time:
-            end_time = dt_util.parse_datetime(end_time)
-            if end_time:
-                end_time = dt_util.as_utc(end_time)
-            else:
-                return self.json_message("Invalid end_time", HTTP_BAD_REQUEST)
-        else:
-            end_time = start_time + one_day
-        entity_ids = request.query.get("filter_entity_id")
-        if entity_ids:
-            entity_ids = entity_ids.lower().split(",")
+        entity_ids = _entity_ids_from_request(request)
         include_start_time_state = "skip_initial_state" not in request.query
         significant_changes_only = (
             request.query.get("significant_changes_only", "1") != "0"
@@ -497,7 +601,8 @@ class HistoryPeriodView(HomeAssistantView):
 
         return cast(
             web.Response,
-            await hass.async_add_executor_job(
+            await hass.async_add_lane_executor_job(
+                EXECUTOR_DATABASE,
                 self._sorted_significant_states_json,
                 hass,
                 start_time,
@@ -556,6 +661,204 @@ class HistoryPeriodView(HomeAssistantView):
         return self.json(result)
 
 
+class HistoryStreamView(HomeAssistantView):
+    """Stream history over a period of time in columnar chunks."""
+
+    url = "/api/history/stream"
+    name = "api:history:stream"
+    extra_urls = ["/api/history/stream/{datetime}"]
+
+    def __init__(self, filters):
+        """Initialize the history stream view."""
+        self.filters = filters
+
+    async def get(
+        self, request: web.Request, datetime: Optional[str] = None
+    ) -> web.StreamResponse:
+        """Stream history as newline delimited JSON chunks."""
+        try:
+            start_time, end_time = _period_from_request(request, datetime)
+        except ValueError as err:
+            return self.json_message(str(err), HTTP_BAD_REQUEST)
+
+        entity_ids = _entity_ids_from_request(request)
+        include_start_time_state = "skip_initial_state" not in request.query
+        significant_changes_only = (
+            request.query.get("significant_changes_only", "1") != "0"
+        )
+
+        hass = request.app["hass"]
+        to_write = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        # Set when the client is gone so the executor job stops reading rows
+        cancel = threading.Event()
+
+        def write_chunk(data):
+            """Hand an encoded chunk to the event loop, wait if the queue is full."""
+            if not cancel.is_set():
+                asyncio.run_coroutine_threadsafe(to_write.put(data), hass.loop).result()
+
+        response = web.StreamResponse()
+        response.content_type = "application/x-ndjson"
+        await response.prepare(request)
+
+        if start_time > dt_util.utcnow():
+            await response.write_eof()
+            return response
+
+        # Streams wait for their clients while holding a database thread, the
+        # key keeps them to a share of the lane
+        job = hass.async_add_lane_executor_job(
+            EXECUTOR_DATABASE,
+            self._stream_significant_states_json,
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            write_chunk,
+            cancel,
+            key=DOMAIN,
+        )
+
+        try:
+            while True:
+                data = await to_write.get()
+                if data is None:
+                    break
+                async with async_timeout.timeout(STREAM_WRITE_TIMEOUT):
+                    await response.write(data)
+        except asyncio.TimeoutError:
+            _LOGGER.warning("Client stopped reading the history stream")
+            # The connection can't be written to anymore, the response ends
+            # like after a disconnect
+            request.transport.abort()
+            return response
+        finally:
+            if not job.done():
+                cancel.set()
+                # Unblock the executor job if it waits for room in the queue
+                while not to_write.empty():
+                    to_write.get_nowait()
+
+        await job
+        await response.write_eof()
+        return response
+
+    def _stream_significant_states_json(
+        self,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        write_chunk,
+        cancel,
+    ):
+        """Fetch significant states from the database and encode them."""
+        timer_start = time.perf_counter()
+        count = 0
+
+        try:
+            with session_scope(hass=hass) as session:
+                for chunk in _stream_significant_states(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    self.filters,
+                    include_start_time_state,
+                    significant_changes_only,
+                    STREAM_CHUNK_SIZE,
+                ):
+                    if cancel.is_set():
+                        return
+                    count += len(chunk["states"])
+                    write_chunk(
+                        (json.dumps(chunk, cls=JSONEncoder) + "\n").encode("UTF-8")
+                    )
+        finally:
+            write_chunk(None)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug("Streamed %d states in %fs", count, elapsed)
+
+
+class HistoryStatisticsView(HomeAssistantView):
+    """Handle requests for the long-term statistics of numeric sensors."""
+
+    url = "/api/history/statistics"
+    name = "api:history:statistics"
+    extra_urls = ["/api/history/statistics/{datetime}"]
+
+    async def get(
+        self, request: web.Request, datetime: Optional[str] = None
+    ) -> web.Response:
+        """Return the statistics over a period of time."""
+        try:
+            start_time, end_time = _period_from_request(request, datetime)
+        except ValueError as err:
+            return self.json_message(str(err), HTTP_BAD_REQUEST)
+
+        period = request.query.get("period", statistics.PERIOD_HOUR)
+        if period not in statistics.PERIODS:
+            return self.json_message("Invalid period", HTTP_BAD_REQUEST)
+
+        hass = request.app["hass"]
+
+        return self.json(
+            await hass.async_add_lane_executor_job(
+                EXECUTOR_DATABASE,
+                statistics.statistics_during_period,
+                hass,
+                start_time,
+                end_time,
+                _entity_ids_from_request(request),
+                period,
+            )
+        )
+
+
+def _period_from_request(request, datetime):
+    """Return the UTC start and end time of a history request.
+
+    Raise ValueError if the request holds an invalid time.
+    """
+    one_day = timedelta(days=1)
+
+    if datetime:
+        datetime_ = dt_util.parse_datetime(datetime)
+
+        if datetime_ is None:
+            raise ValueError("Invalid datetime")
+
+        start_time = dt_util.as_utc(datetime_)
+    else:
+        start_time = dt_util.utcnow() - one_day
+
+    end_time = request.query.get("end_time")
+    if end_time:
+        end_time = dt_util.parse_datetime(end_time)
+        if end_time is None:
+            raise ValueError("Invalid end_time")
+        end_time = dt_util.as_utc(end_time)
+    else:
+        end_time = start_time + one_day
+
+    return start_time, end_time
+
+
+def _entity_ids_from_request(request):
+    """Return the entity ids a history request is filtered on."""
+    entity_ids = request.query.get("filter_entity_id")
+    if entity_ids:
+        entity_ids = entity_ids.lower().split(",")
+    return entity_ids
+
+
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
     filters = Filters()
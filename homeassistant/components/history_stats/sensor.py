@@ -1,7 +1,9 @@
 """Component to make instant statistics about your history."""
+from bisect import bisect_right
 import datetime
 import logging
 import math
+from typing import List, Optional, Tuple
 
 import voluptuous as vol
 
@@ -16,7 +18,7 @@ from homeassistant.const import (
     PERCENTAGE,
     TIME_HOURS,
 )
-from homeassistant.core import CoreState, callback
+from homeassistant.core import EXECUTOR_DATABASE, CoreState, callback
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
@@ -123,22 +125,26 @@ class HistoryStatsSensor(Entity):
         self.value = None
         self.count = None
 
+        self.hass = hass
+        # State changes since the start of the history, as timestamp and if the
+        # entity was in the measured state, loaded once and followed by events
+        self._history_start: Optional[float] = None
+        self._history: List[Tuple[float, bool]] = []
+        self._loading = False
+        self._history_changed = False
+        # State changes seen before the history is loaded
+        self._pending_changes: List[Tuple[float, bool]] = []
+
     async def async_added_to_hass(self):
         """Create listeners when the entity is added."""
 
         @callback
         def start_refresh(*args):
             """Register state tracking."""
-
-            @callback
-            def force_refresh(*args):
-                """Force the component to refresh."""
-                self.async_schedule_update_ha_state(True)
-
-            force_refresh()
+            self.async_schedule_update_ha_state(True)
             self.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, [self._entity_id], force_refresh
+                    self.hass, [self._entity_id], self._async_state_changed
                 )
             )
 
@@ -193,7 +199,63 @@ class HistoryStatsSensor(Entity):
         """Return the icon to use in the frontend, if any."""
         return ICON
 
-    def update(self):
+    @callback
+    def _async_state_changed(self, event):
+        """Add a state change to the history and refresh."""
+        new_state = event.data["new_state"]
+
+        # Like the recorder history, only count changes of the state itself
+        if new_state is not None and new_state.last_changed == new_state.last_updated:
+            change = (
+                new_state.last_changed.timestamp(),
+                new_state.state == self._entity_state,
+            )
+            if self._loading or self._history_start is None:
+                self._pending_changes.append(change)
+            else:
+                self._history.append(change)
+            self._history_changed = True
+
+        self.async_schedule_update_ha_state(True)
+
+    def _load_history(self, start):
+        """Load the state changes since start from the recorder."""
+        history_list = history.state_changes_during_period(
+            self.hass, start, None, str(self._entity_id)
+        )
+
+        return [
+            (item.last_changed.timestamp(), item.state == self._entity_state)
+            for item in history_list.get(self._entity_id, [])
+        ]
+
+    async def _async_load_history(self, start, start_timestamp):
+        """Replace the history by the state changes recorded since start."""
+        self._loading = True
+        try:
+            changes = await self.hass.async_add_lane_executor_job(
+                EXECUTOR_DATABASE, self._load_history, start
+            )
+        finally:
+            self._loading = False
+
+        # Keep the changes the recorder didn't write yet
+        last_time = changes[-1][0] if changes else start_timestamp
+        changes.extend(
+            change for change in self._pending_changes if change[0] > last_time
+        )
+        self._pending_changes = []
+        self._history_start = start_timestamp
+        self._history = changes
+
+    def _trim_history(self, start, start_timestamp):
+        """Drop the state changes before the start, keeping the state at start."""
+        index = bisect_right(self._history, (start.timestamp(), True))
+        if index:
+            self._history[:index] = [(start.timestamp(), self._history[index - 1][1])]
+        self._history_start = start_timestamp
+
+    async def async_update(self):
         """Get the latest data and updates the states."""
         # Get previous values of start and end
         p_start, p_end = self._period
@@ -216,34 +278,37 @@ class HistoryStatsSensor(Entity):
         p_end_timestamp = math.floor(dt_util.as_timestamp(p_end))
         now_timestamp = math.floor(dt_util.as_timestamp(now))
 
-        # If period has not changed and current time after the period end...
+        # If period has not changed, current time after the period end and no
+        # state changed...
         if (
             start_timestamp == p_start_timestamp
             and end_timestamp == p_end_timestamp
             and end_timestamp <= now_timestamp
+            and not self._history_changed
         ):
             # Don't compute anything as the value cannot have changed
             return
+        self._history_changed = False
 
-        # Get history between start and end
-        history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
-        )
+        # Only query the recorder when the period starts before the history
+        if self._history_start is None or start_timestamp < self._history_start:
+            await self._async_load_history(start, start_timestamp)
+        elif start_timestamp > self._history_start:
+            self._trim_history(start, start_timestamp)
 
-        if self._entity_id not in history_list.keys():
+        if not self._history:
             return
 
-        # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state == self._entity_state
+        # The first change is the state at the start of the history
+        last_state = False
         last_time = start_timestamp
         elapsed = 0
         count = 0
 
         # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state == self._entity_state
-            current_time = item.last_changed.timestamp()
+        for current_time, current_state in self._history:
+            if current_time >= end.timestamp():
+                break
 
             if last_state:
                 elapsed += current_time - last_time
@@ -272,7 +337,7 @@ class HistoryStatsSensor(Entity):
         # Parse start
         if self._start is not None:
             try:
-                start_rendered = self._start.render()
+                start_rendered = self._start.async_render()
             except (TemplateError, TypeError) as ex:
                 HistoryStatsHelper.handle_template_exception(ex, "start")
                 return
@@ -291,7 +356,7 @@ class HistoryStatsSensor(Entity):
         # Parse end
         if self._end is not None:
             try:
-                end_rendered = self._end.render()
+                end_rendered = self._end.async_render()
             except (TemplateError, TypeError) as ex:
                 HistoryStatsHelper.handle_template_exception(ex, "end")
                 return
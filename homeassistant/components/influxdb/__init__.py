@@ -26,7 +26,11 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.helpers import event as event_helper, state as state_helper
+from homeassistant.helpers import (
+    discovery,
+    event as event_helper,
+    state as state_helper,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.helpers.entityfilter import (
@@ -45,13 +49,16 @@ from .const import (
     COMPONENT_CONFIG_SCHEMA_CONNECTION,
     CONF_API_VERSION,
     CONF_BUCKET,
+    CONF_BUFFER_SIZE,
     CONF_COMPONENT_CONFIG,
     CONF_COMPONENT_CONFIG_DOMAIN,
     CONF_COMPONENT_CONFIG_GLOB,
     CONF_DB_NAME,
     CONF_DEFAULT_MEASUREMENT,
+    CONF_EXPORTER,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
+    CONF_MAX_IN_FLIGHT,
     CONF_ORG,
     CONF_OVERRIDE_MEASUREMENT,
     CONF_PASSWORD,
@@ -67,10 +74,14 @@ from .const import (
     CONF_VERIFY_SSL,
     CONNECTION_ERROR,
     DEFAULT_API_VERSION,
+    DEFAULT_BUFFER_SIZE,
     DEFAULT_HOST_V2,
+    DEFAULT_MAX_IN_FLIGHT,
     DEFAULT_SSL_V2,
     DOMAIN,
     EVENT_NEW_STATE,
+    EXPORTER_ASYNC,
+    EXPORTER_THREAD,
     INFLUX_CONF_FIELDS,
     INFLUX_CONF_MEASUREMENT,
     INFLUX_CONF_ORG,
@@ -92,6 +103,7 @@ from .const import (
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .exporter import InfluxExporter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -153,6 +165,15 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        vol.Optional(CONF_EXPORTER, default=EXPORTER_THREAD): vol.In(
+            [EXPORTER_THREAD, EXPORTER_ASYNC]
+        ),
+        vol.Optional(CONF_BUFFER_SIZE, default=DEFAULT_BUFFER_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_MAX_IN_FLIGHT, default=DEFAULT_MAX_IN_FLIGHT): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_OVERRIDE_MEASUREMENT): cv.string,
         vol.Optional(CONF_TAGS, default={}): vol.Schema({cv.string: cv.string}),
@@ -446,6 +467,15 @@ def setup(hass, config):
         return True
 
     event_to_json = _generate_event_to_json(conf)
+
+    if conf[CONF_EXPORTER] == EXPORTER_ASYNC:
+        # The exporter makes its own requests
+        influx.close()
+        exporter = hass.data[DOMAIN] = InfluxExporter(hass, conf, event_to_json)
+        hass.add_job(exporter.async_start)
+        discovery.load_platform(hass, "sensor", DOMAIN, {}, config)
+        return True
+
     max_tries = conf.get(CONF_RETRY_COUNT)
     instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
     instance.start()
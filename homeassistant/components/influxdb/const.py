@@ -30,6 +30,9 @@ CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
+CONF_EXPORTER = "exporter"
+CONF_BUFFER_SIZE = "buffer_size"
+CONF_MAX_IN_FLIGHT = "max_in_flight"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -56,6 +59,9 @@ DEFAULT_FIELD = "value"
 DEFAULT_RANGE_START = "-15m"
 DEFAULT_RANGE_STOP = "now()"
 DEFAULT_FUNCTION_FLUX = "|> limit(n: 1)"
+DEFAULT_BUFFER_SIZE = 10000
+DEFAULT_MAX_IN_FLIGHT = 2
+DEFAULT_PORT_V1 = 8086
 
 INFLUX_CONF_MEASUREMENT = "measurement"
 INFLUX_CONF_TAGS = "tags"
@@ -74,7 +80,12 @@ RETRY_DELAY = 20
 QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
+# Seconds the exporter may take to write the remaining lines when stopping
+EXPORTER_STOP_TIMEOUT = 10
 BATCH_BUFFER_SIZE = 100
+EXPORTER_THREAD = "thread"
+EXPORTER_ASYNC = "async"
+EXPORTER_BATCH_SIZE = 1000
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -117,6 +128,8 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+EXPORTER_WRITE_ERROR = "Could not write %d lines to influx due to '%s'."
+EXPORTER_STOP_DROPPED = "Dropped %d lines that could not be written before stopping."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
@@ -0,0 +1,284 @@
+"""Write state changes to InfluxDB as compressed line protocol batches."""
+import asyncio
+from collections import deque
+from contextlib import suppress
+import gzip
+import logging
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+import async_timeout
+from influxdb.line_protocol import make_lines
+
+from homeassistant.const import CONF_URL, EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    API_VERSION_2,
+    BATCH_TIMEOUT,
+    CLIENT_ERROR_V1,
+    CLIENT_ERROR_V2,
+    CODE_INVALID_INPUTS,
+    CONF_API_VERSION,
+    CONF_BUCKET,
+    CONF_BUFFER_SIZE,
+    CONF_DB_NAME,
+    CONF_HOST,
+    CONF_MAX_IN_FLIGHT,
+    CONF_ORG,
+    CONF_PASSWORD,
+    CONF_PATH,
+    CONF_PORT,
+    CONF_PRECISION,
+    CONF_RETRY_COUNT,
+    CONF_SSL,
+    CONF_TOKEN,
+    CONF_USERNAME,
+    CONF_VERIFY_SSL,
+    CONNECTION_ERROR,
+    DEFAULT_PORT_V1,
+    EXPORTER_BATCH_SIZE,
+    EXPORTER_STOP_DROPPED,
+    EXPORTER_STOP_TIMEOUT,
+    EXPORTER_WRITE_ERROR,
+    RESUMED_MESSAGE,
+    RETRY_DELAY,
+    TIMEOUT,
+    WROTE_MESSAGE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Precision names used by the line protocol and the V1 API
+LINE_PRECISIONS = {"ns": "n", "us": "u", "ms": "ms", "s": "s"}
+
+
+def _write_request(conf: Dict) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+    """Return the url, query parameters and headers of write requests."""
+    headers = {"Content-Encoding": "gzip", "Content-Type": "text/plain"}
+    precision = conf.get(CONF_PRECISION)
+
+    if conf[CONF_API_VERSION] == API_VERSION_2:
+        params = {"org": conf[CONF_ORG], "bucket": conf[CONF_BUCKET]}
+        if precision:
+            params["precision"] = precision
+        headers["Authorization"] = f"Token {conf[CONF_TOKEN]}"
+        return f"{conf[CONF_URL]}/api/v2/write", params, headers
+
+    scheme = "https" if conf.get(CONF_SSL) else "http"
+    host = conf.get(CONF_HOST, "localhost")
+    port = conf.get(CONF_PORT, DEFAULT_PORT_V1)
+    path = conf.get(CONF_PATH, "").strip("/")
+    url = f"{scheme}://{host}:{port}/{path + '/' if path else ''}write"
+
+    params = {"db": conf[CONF_DB_NAME]}
+    if precision:
+        params["precision"] = LINE_PRECISIONS[precision]
+    if CONF_USERNAME in conf:
+        # Sent as a header, query parameters end up in the logs of proxies
+        headers["Authorization"] = aiohttp.BasicAuth(
+            conf[CONF_USERNAME], conf[CONF_PASSWORD]
+        ).encode()
+    return url, params, headers
+
+
+class InfluxExporter:
+    """Export state changes to InfluxDB without holding on to the events.
+
+    Every state change is converted to line protocol when it is fired and
+    waits in a ring buffer until it is written. Once the buffer is full, the
+    oldest lines are dropped to make room. Batches are written gzip
+    compressed by a limited number of concurrent requests, and lines stay in
+    the buffer while all of them are busy.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        conf: Dict,
+        event_to_json: Callable[[Event], Optional[Dict[str, Any]]],
+    ) -> None:
+        """Initialize the exporter."""
+        self.hass = hass
+        self._event_to_json = event_to_json
+        self._url, self._params, self._headers = _write_request(conf)
+        self._verify_ssl = conf[CONF_VERIFY_SSL]
+        precision = conf.get(CONF_PRECISION)
+        self._precision = LINE_PRECISIONS[precision] if precision else None
+        self._max_tries = conf[CONF_RETRY_COUNT] + 1
+        self._client_error = (
+            CLIENT_ERROR_V2
+            if conf[CONF_API_VERSION] == API_VERSION_2
+            else CLIENT_ERROR_V1
+        )
+        self._max_in_flight = conf[CONF_MAX_IN_FLIGHT]
+        self.buffer_size = conf[CONF_BUFFER_SIZE]
+        self._buffer: Deque[Tuple[float, bytes]] = deque()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._writes: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._unsub: Optional[Callable[[], None]] = None
+        self.written = 0
+        self.dropped = 0
+        self.write_errors = 0
+
+    @property
+    def buffered(self) -> int:
+        """Return the number of lines waiting to be written."""
+        return len(self._buffer)
+
+    @property
+    def lag(self) -> float:
+        """Return how many seconds the oldest buffered line has been waiting."""
+        if not self._buffer:
+            return 0
+        return time.monotonic() - self._buffer[0][0]
+
+    @callback
+    def async_start(self) -> None:
+        """Start exporting state changes."""
+        self._slots = asyncio.Semaphore(self._max_in_flight)
+        self._wakeup = asyncio.Event()
+        self._unsub = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_event_listener
+        )
+        # Not tracked by hass, this task runs until the exporter is stopped
+        self._task = self.hass.loop.create_task(self._async_run())
+        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self.async_stop)
+
+    async def async_stop(self, event: Optional[Event] = None) -> None:
+        """Stop exporting and write the remaining lines.
+
+        The remaining lines get a single attempt and EXPORTER_STOP_TIMEOUT
+        seconds to be written, the lines not written by then are dropped.
+        """
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        self._max_tries = 1
+        dropped = self.dropped
+        try:
+            async with async_timeout.timeout(EXPORTER_STOP_TIMEOUT):
+                while self._buffer:
+                    await self._async_write_batch()
+                if self._writes:
+                    await asyncio.wait(self._writes)
+        except asyncio.TimeoutError:
+            for task in self._writes:
+                task.cancel()
+            if self._writes:
+                await asyncio.wait(self._writes)
+            self.dropped += len(self._buffer)
+            self._buffer.clear()
+
+        if self.dropped > dropped:
+            _LOGGER.warning(EXPORTER_STOP_DROPPED, self.dropped - dropped)
+
+    @callback
+    def _async_event_listener(self, event: Event) -> None:
+        """Convert a state change to line protocol and buffer it."""
+        json = self._event_to_json(event)
+        if not json:
+            return
+
+        line = make_lines({"points": [json]}, self._precision).encode("utf-8")
+        if len(self._buffer) >= self.buffer_size:
+            self._buffer.popleft()
+            self.dropped += 1
+        self._buffer.append((time.monotonic(), line))
+
+        if len(self._buffer) >= EXPORTER_BATCH_SIZE:
+            assert self._wakeup is not None
+            self._wakeup.set()
+
+    async def _async_run(self) -> None:
+        """Write batches whenever a batch is full or the batch timeout passed."""
+        assert self._wakeup is not None
+        while True:
+            if len(self._buffer) < EXPORTER_BATCH_SIZE:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), BATCH_TIMEOUT)
+            self._wakeup.clear()
+            if self._buffer:
+                await self._async_write_batch()
+
+    async def _async_write_batch(self) -> None:
+        """Take a batch from the buffer once a request can be made."""
+        assert self._slots is not None
+        # Lines stay in the buffer, where old lines are dropped, while the
+        # maximum number of requests are in flight
+        await self._slots.acquire()
+        if not self._buffer:
+            self._slots.release()
+            return
+
+        batch = [
+            self._buffer.popleft()[1]
+            for _ in range(min(len(self._buffer), EXPORTER_BATCH_SIZE))
+        ]
+        task = self.hass.async_create_task(self._async_write(batch))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _async_write(self, batch: List[bytes]) -> None:
+        """Write a batch of lines, with retry."""
+        assert self._slots is not None
+        try:
+            body = await self.hass.async_add_executor_job(
+                gzip.compress, b"".join(batch)
+            )
+            session = async_get_clientsession(self.hass, self._verify_ssl)
+            error = None
+
+            for retry in range(self._max_tries):
+                if retry:
+                    await asyncio.sleep(RETRY_DELAY)
+                try:
+                    async with session.post(
+                        self._url,
+                        params=self._params,
+                        headers=self._headers,
+                        data=body,
+                        timeout=TIMEOUT,
+                    ) as resp:
+                        if resp.status < 300:
+                            self._async_written(len(batch))
+                            return
+                        text = await resp.text()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                    error = CONNECTION_ERROR % err
+                    continue
+
+                if resp.status == CODE_INVALID_INPUTS:
+                    _LOGGER.error(EXPORTER_WRITE_ERROR, len(batch), text)
+                    self.dropped += len(batch)
+                    return
+                error = self._client_error % text
+
+            if not self.write_errors:
+                _LOGGER.error(error)
+            self.write_errors += len(batch)
+            self.dropped += len(batch)
+        except asyncio.CancelledError:
+            self.dropped += len(batch)
+            raise
+        finally:
+            self._slots.release()
+
+    @callback
+    def _async_written(self, count: int) -> None:
+        """Update the counters after a successful write."""
+        self.written += count
+        if self.write_errors:
+            _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
+            self.write_errors = 0
+        _LOGGER.debug(WROTE_MESSAGE, count)
@@ -1,5 +1,6 @@
 """InfluxDB component which allows you to get data from an Influx database."""
 import logging
+import time
 from typing import Dict
 
 import voluptuous as vol
@@ -12,6 +13,7 @@ from homeassistant.const import (
     CONF_VALUE_TEMPLATE,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNKNOWN,
+    TIME_SECONDS,
 )
 from homeassistant.exceptions import PlatformNotReady, TemplateError
 import homeassistant.helpers.config_validation as cv
@@ -41,6 +43,7 @@ from .const import (
     DEFAULT_GROUP_FUNCTION,
     DEFAULT_RANGE_START,
     DEFAULT_RANGE_STOP,
+    DOMAIN,
     INFLUX_CONF_VALUE,
     INFLUX_CONF_VALUE_V2,
     LANGUAGE_FLUX,
@@ -143,6 +146,17 @@ PLATFORM_SCHEMA = vol.All(
 
 def setup_platform(hass, config, add_entities, discovery_info=None):
     """Set up the InfluxDB component."""
+    if discovery_info is not None:
+        exporter = hass.data[DOMAIN]
+        add_entities(
+            [
+                InfluxExporterThroughputSensor(exporter),
+                InfluxExporterLagSensor(exporter),
+                InfluxExporterDroppedSensor(exporter),
+            ]
+        )
+        return
+
     try:
         influx = get_influx_connection(config, test_read=True)
     except ConnectionError as exc:
@@ -168,6 +182,91 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, lambda _: influx.close())
 
 
+class InfluxExporterSensor(Entity):
+    """Base class for the sensors of the InfluxDB exporter."""
+
+    def __init__(self, exporter):
+        """Initialize the sensor."""
+        self._exporter = exporter
+
+    @property
+    def icon(self):
+        """Return the icon to use in the frontend."""
+        return "mdi:database-export"
+
+
+class InfluxExporterThroughputSensor(InfluxExporterSensor):
+    """Number of lines written per second since the last update."""
+
+    def __init__(self, exporter):
+        """Initialize the sensor."""
+        super().__init__(exporter)
+        self._state = None
+        self._written = exporter.written
+        self._updated = time.monotonic()
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return "InfluxDB exporter throughput"
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit of measurement of this entity."""
+        return "lines/s"
+
+    @property
+    def state(self):
+        """Return the state of the sensor."""
+        return self._state
+
+    def update(self):
+        """Compute the throughput since the last update."""
+        now = time.monotonic()
+        written = self._exporter.written
+        self._state = round((written - self._written) / (now - self._updated), 1)
+        self._written = written
+        self._updated = now
+
+
+class InfluxExporterLagSensor(InfluxExporterSensor):
+    """Time the oldest line waiting to be written has been buffered."""
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return "InfluxDB exporter lag"
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit of measurement of this entity."""
+        return TIME_SECONDS
+
+    @property
+    def state(self):
+        """Return the state of the sensor."""
+        return round(self._exporter.lag, 1)
+
+
+class InfluxExporterDroppedSensor(InfluxExporterSensor):
+    """Number of lines dropped because the buffer was full or writes failed."""
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return "InfluxDB exporter dropped lines"
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit of measurement of this entity."""
+        return "lines"
+
+    @property
+    def state(self):
+        """Return the state of the sensor."""
+        return self._exporter.dropped
+
+
 class InfluxSensor(Entity):
     """Implementation of a Influxdb sensor."""
 
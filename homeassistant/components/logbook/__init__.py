@@ -1,15 +1,20 @@
 """Event parser and human readable log generator."""
+import asyncio
+from collections import OrderedDict, namedtuple
 from datetime import timedelta
 from itertools import groupby
 import json
 import logging
 import re
+import threading
 
+from aiohttp import web
+import async_timeout
 import sqlalchemy
 from sqlalchemy.orm import aliased
 import voluptuous as vol
 
-from homeassistant.components import sun
+from homeassistant.components import sun, websocket_api
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
@@ -29,6 +34,7 @@ from homeassistant.const import (
     ATTR_ICON,
     ATTR_NAME,
     ATTR_SERVICE,
+    ATTR_UNIT_OF_MEASUREMENT,
     EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
@@ -41,6 +47,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     DOMAIN as HA_DOMAIN,
+    EXECUTOR_DATABASE,
     callback,
     split_entity_id,
     valid_entity_id,
@@ -55,6 +62,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
@@ -72,12 +80,23 @@ CONF_ENTITIES = "entities"
 CONTINUOUS_DOMAINS = ["proximity", "sensor"]
 
 DOMAIN = "logbook"
+DATA_FILTERS = "logbook_filters"
 
 GROUP_BY_MINUTES = 15
 
 EMPTY_JSON_OBJECT = "{}"
 UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
+# Number of contexts remembered to describe what caused an entry
+CONTEXT_LOOKUP_SIZE = 4096
+
+# Number of entries sent at once by the logbook streams
+STREAM_CHUNK_SIZE = 100
+# Live entries a slow HTTP stream client may fall behind before it is ended
+STREAM_LIVE_QUEUE_SIZE = 1024
+# Seconds entries may take to be written before the HTTP stream client is dropped
+STREAM_WRITE_TIMEOUT = 30
+
 CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA}, extra=vol.ALLOW_EXTRA
 )
@@ -159,7 +178,10 @@ async def async_setup(hass, config):
         filters = None
         entities_filter = None
 
+    hass.data[DATA_FILTERS] = (filters, entities_filter)
     hass.http.register_view(LogbookView(conf, filters, entities_filter))
+    hass.http.register_view(LogbookStreamView(filters, entities_filter))
+    hass.components.websocket_api.async_register_command(ws_event_stream)
 
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
@@ -194,34 +216,14 @@ class LogbookView(HomeAssistantView):
 
     async def get(self, request, datetime=None):
         """Retrieve logbook entries."""
-        if datetime:
-            datetime = dt_util.parse_datetime(datetime)
-
-            if datetime is None:
-                return self.json_message("Invalid datetime", HTTP_BAD_REQUEST)
-        else:
-            datetime = dt_util.start_of_local_day()
-
-        period = request.query.get("period")
-        if period is None:
-            period = 1
-        else:
-            period = int(period)
-
-        entity_id = request.query.get("entity")
-
-        end_time = request.query.get("end_time")
-        if end_time is None:
-            start_day = dt_util.as_utc(datetime) - timedelta(days=period - 1)
-            end_day = start_day + timedelta(days=period)
-        else:
-            start_day = datetime
-            end_day = dt_util.parse_datetime(end_time)
-            if end_day is None:
-                return self.json_message("Invalid end_time", HTTP_BAD_REQUEST)
+        try:
+            start_day, end_day = _period_from_request(request, datetime)
+        except ValueError as err:
+            return self.json_message(str(err), HTTP_BAD_REQUEST)
 
         hass = request.app["hass"]
 
+        entity_id = request.query.get("entity")
         entity_matches_only = "entity_matches_only" in request.query
 
         def json_events():
@@ -238,7 +240,198 @@ class LogbookView(HomeAssistantView):
                 )
             )
 
-        return await hass.async_add_executor_job(json_events)
+        return await hass.async_add_lane_executor_job(EXECUTOR_DATABASE, json_events)
+
+
+class LogbookStreamView(HomeAssistantView):
+    """Stream logbook entries as they are read from the database.
+
+    With the live query parameter, the stream continues with the entries of
+    new events until the client disconnects.
+    """
+
+    url = "/api/logbook/stream"
+    name = "api:logbook:stream"
+    extra_urls = ["/api/logbook/stream/{datetime}"]
+
+    def __init__(self, filters, entities_filter):
+        """Initialize the logbook stream view."""
+        self.filters = filters
+        self.entities_filter = entities_filter
+
+    async def get(self, request, datetime=None):
+        """Stream logbook entries as newline delimited JSON."""
+        try:
+            start_day, end_day = _period_from_request(request, datetime)
+        except ValueError as err:
+            return self.json_message(str(err), HTTP_BAD_REQUEST)
+
+        hass = request.app["hass"]
+        entity_id = request.query.get("entity")
+        entity_matches_only = "entity_matches_only" in request.query
+        live = "live" in request.query
+
+        try:
+            stream = LogbookEventStream(
+                hass,
+                entity_id,
+                self.filters,
+                self.entities_filter,
+                entity_matches_only,
+            )
+        except InvalidEntityFormatError as err:
+            return self.json_message(str(err), HTTP_BAD_REQUEST)
+
+        response = web.StreamResponse()
+        response.content_type = "application/x-ndjson"
+        await response.prepare(request)
+
+        async def write_entries(entries):
+            """Write entries to the response, drop clients that stopped reading."""
+            data = "".join(
+                json.dumps(entry, cls=JSONEncoder) + "\n" for entry in entries
+            ).encode("UTF-8")
+            try:
+                async with async_timeout.timeout(STREAM_WRITE_TIMEOUT):
+                    await response.write(data)
+            except asyncio.TimeoutError:
+                _LOGGER.warning("Client stopped reading the logbook stream")
+                request.transport.abort()
+                raise ConnectionResetError("Logbook stream write timed out") from None
+
+        if not live:
+            try:
+                await stream.async_stream_past(start_day, end_day, write_entries)
+            except ConnectionResetError:
+                return response
+            await response.write_eof()
+            return response
+
+        live_entries = asyncio.Queue()
+
+        @callback
+        def queue_entries(entries):
+            """Queue live entries, end the stream if the client falls behind."""
+            if live_entries.qsize() < STREAM_LIVE_QUEUE_SIZE:
+                live_entries.put_nowait(entries)
+                return
+            stream.async_unsubscribe()
+            live_entries.put_nowait(None)
+
+        try:
+            await stream.async_stream(start_day, end_day, queue_entries, write_entries)
+            while True:
+                entries = await live_entries.get()
+                if entries is None:
+                    _LOGGER.warning("Client fell behind the live logbook stream")
+                    break
+                await write_entries(entries)
+        except ConnectionResetError:
+            return response
+        finally:
+            stream.async_unsubscribe()
+
+        await response.write_eof()
+        return response
+
+
+def _period_from_request(request, datetime):
+    """Return the start and end time requested, raise ValueError if invalid."""
+    if datetime:
+        datetime = dt_util.parse_datetime(datetime)
+
+        if datetime is None:
+            raise ValueError("Invalid datetime")
+    else:
+        datetime = dt_util.start_of_local_day()
+
+    period = request.query.get("period")
+    if period is None:
+        period = 1
+    else:
+        period = int(period)
+
+    end_time = request.query.get("end_time")
+    if end_time is None:
+        start_day = dt_util.as_utc(datetime) - timedelta(days=period - 1)
+        end_day = start_day + timedelta(days=period)
+    else:
+        start_day = datetime
+        end_day = dt_util.parse_datetime(end_time)
+        if end_day is None:
+            raise ValueError("Invalid end_time")
+
+    return start_day, end_day
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/event_stream",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_id"): str,
+        vol.Optional("entity_matches_only", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_event_stream(hass, connection, msg):
+    """Stream the logbook entries of a period to a websocket subscription.
+
+    Without an end time, or with an end time in the future, the stream
+    continues with the entries of new events until it is unsubscribed. The
+    entries are sent in event messages which have partial set to true until
+    all entries of the past have been sent.
+    """
+    msg_id = msg["id"]
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time is None:
+        connection.send_error(msg_id, "invalid_start_time", "Invalid start_time")
+        return
+
+    end_time = None
+    if "end_time" in msg:
+        end_time = dt_util.parse_datetime(msg["end_time"])
+        if end_time is None:
+            connection.send_error(msg_id, "invalid_end_time", "Invalid end_time")
+            return
+
+    filters, entities_filter = hass.data[DATA_FILTERS]
+    try:
+        stream = LogbookEventStream(
+            hass,
+            msg.get("entity_id"),
+            filters,
+            entities_filter,
+            msg["entity_matches_only"],
+        )
+    except InvalidEntityFormatError as err:
+        connection.send_error(msg_id, "invalid_entity_id", str(err))
+        return
+
+    async def send_partial(entries):
+        """Send entries of the past once the client can take more messages."""
+        await connection.async_wait_writable()
+        connection.send_message(
+            websocket_api.event_message(msg_id, {"events": entries, "partial": True})
+        )
+
+    @callback
+    def send_entries(entries):
+        """Send the last entries of the past or live entries."""
+        connection.send_message(
+            websocket_api.event_message(msg_id, {"events": entries, "partial": False})
+        )
+
+    connection.subscriptions[msg_id] = stream.async_unsubscribe
+    connection.send_result(msg_id)
+
+    if end_time is not None and end_time <= dt_util.utcnow():
+        await stream.async_stream_past(start_time, end_time, send_partial)
+        if connection.subscriptions.pop(msg_id, None) is not None:
+            send_entries([])
+        return
+
+    await stream.async_stream(start_time, end_time, send_entries, send_partial)
 
 
 def humanify(hass, events, entity_attr_cache, context_lookup):
@@ -415,114 +608,326 @@ def _get_events(
     entity_matches_only=False,
 ):
     """Get events for a period of time."""
-    entity_attr_cache = EntityAttributeCache(hass)
-    context_lookup = {None: None}
-    entity_id_lower = None
-    apply_sql_entities_filter = True
-
-    def yield_events(query):
-        """Yield Events that are not filtered away."""
-        for row in query.yield_per(1000):
-            event = LazyEventPartialState(row)
-            context_lookup.setdefault(event.context_id, event)
-            if _keep_event(hass, event, entities_filter):
+    stream = LogbookEventStream(
+        hass, entity_id, filters, entities_filter, entity_matches_only
+    )
+    with session_scope(hass=hass) as session:
+        return list(stream.yield_entries(session, start_day, end_day))
+
+
+class ContextLookup:
+    """Remember the first event of the most recent contexts.
+
+    Only the last CONTEXT_LOOKUP_SIZE contexts are kept, which bounds the
+    memory used for long periods while the events caused by a context
+    usually follow it closely.
+    """
+
+    def __init__(self, size=CONTEXT_LOOKUP_SIZE):
+        """Initialize the context lookup."""
+        self._size = size
+        self._events = OrderedDict()
+
+    def add(self, context_id, event):
+        """Remember the event if it is the first one of the context."""
+        if context_id is None or context_id in self._events:
+            return
+        self._events[context_id] = event
+        if len(self._events) > self._size:
+            self._events.popitem(last=False)
+
+    def get(self, context_id):
+        """Return the first event of the context or None."""
+        return self._events.get(context_id)
+
+
+class LogbookEventStream:
+    """Humanify logbook events of the past and then of live events.
+
+    The past and live entries share the context lookup, so that live entries
+    can be described by the events which caused them.
+    """
+
+    def __init__(self, hass, entity_id, filters, entities_filter, entity_matches_only):
+        """Initialize the stream, raise InvalidEntityFormatError if invalid."""
+        self.hass = hass
+        self.filters = filters
+        self.entity_matches_only = entity_matches_only
+        self.entity_id = None
+        self.context_lookup = ContextLookup()
+        self.entity_attr_cache = EntityAttributeCache(hass)
+        self._apply_sql_entities_filter = True
+        self._unsubs = []
+        self._cancel = threading.Event()
+        self._live_events = None
+        self._on_live = None
+
+        if entity_id is not None:
+            self.entity_id = entity_id.lower()
+            if not valid_entity_id(self.entity_id):
+                raise InvalidEntityFormatError(
+                    f"Invalid entity id encountered: {self.entity_id}. "
+                    "Format should be <domain>.<object_id>"
+                )
+            entities_filter = generate_filter([], [self.entity_id], [], [])
+            self._apply_sql_entities_filter = False
+
+        self.entities_filter = entities_filter
+
+    def yield_entries(self, session, start_day, end_day):
+        """Yield the entries of a period as the events are read."""
+        query = _events_query(
+            self.hass,
+            session,
+            start_day,
+            end_day,
+            self.entity_id,
+            self.filters if self._apply_sql_entities_filter else None,
+            self.entity_matches_only,
+        )
+        events = (LazyEventPartialState(row) for row in query.yield_per(1000))
+        return humanify(
+            self.hass,
+            self._yield_kept_events(events),
+            self.entity_attr_cache,
+            self.context_lookup,
+        )
+
+    def _yield_kept_events(self, events):
+        """Yield the events that are not filtered away."""
+        for event in events:
+            self.context_lookup.add(event.context_id, event)
+            if _keep_event(self.hass, event, self.entities_filter):
                 yield event
 
-    if entity_id is not None:
-        entity_id_lower = entity_id.lower()
-        if not valid_entity_id(entity_id_lower):
-            raise InvalidEntityFormatError(
-                f"Invalid entity id encountered: {entity_id_lower}. "
-                "Format should be <domain>.<object_id>"
+    async def async_stream_past(self, start_day, end_day, send):
+        """Read the entries of a period in the executor and send them in chunks.
+
+        The reading waits for every chunk to be sent and stops when the stream
+        is unsubscribed.
+        """
+        cancel = self._cancel
+
+        async def async_send(entries):
+            """Send the entries unless the stream was cancelled."""
+            if not cancel.is_set():
+                await send(entries)
+
+        def send_chunks():
+            """Read the entries and hand the chunks to the event loop."""
+            with session_scope(hass=self.hass) as session:
+                chunk = []
+                for entry in self.yield_entries(session, start_day, end_day):
+                    if cancel.is_set():
+                        return
+                    chunk.append(entry)
+                    if len(chunk) == STREAM_CHUNK_SIZE:
+                        asyncio.run_coroutine_threadsafe(
+                            async_send(chunk), self.hass.loop
+                        ).result()
+                        chunk = []
+                if chunk:
+                    asyncio.run_coroutine_threadsafe(
+                        async_send(chunk), self.hass.loop
+                    ).result()
+
+        try:
+            # All logbook streams share a key, so clients that read slowly
+            # can't take every database thread
+            await self.hass.async_add_lane_executor_job(
+                EXECUTOR_DATABASE, send_chunks, key=DOMAIN
             )
-        entities_filter = generate_filter([], [entity_id_lower], [], [])
-        apply_sql_entities_filter = False
-
-    with session_scope(hass=hass) as session:
-        old_state = aliased(States, name="old_state")
-
-        query = (
-            session.query(
-                Events.event_type,
-                Events.event_data,
-                Events.time_fired,
-                Events.context_id,
-                Events.context_user_id,
-                States.state,
-                States.entity_id,
-                States.domain,
-                States.attributes,
+        finally:
+            cancel.set()
+
+    async def async_stream(self, start_day, end_day, on_live, send_past):
+        """Send the entries since start_day and then the entries of live events.
+
+        The entries of the past are sent with send_past until now, or until
+        end_day if it is earlier. Live events are held back until then and
+        on_live is called with their entries once, even if there are none.
+        After that on_live is called with the entries of every live event
+        until the stream is unsubscribed.
+        """
+        self._on_live = on_live
+        self._live_events = []
+        for event_type in (*ALL_EVENT_TYPES, *self.hass.data.get(DOMAIN, {})):
+            self._unsubs.append(
+                self.hass.bus.async_listen(event_type, self._async_live_event)
             )
-            .order_by(Events.time_fired)
-            .outerjoin(States, (Events.event_id == States.event_id))
-            .outerjoin(old_state, (States.old_state_id == old_state.state_id))
-            # The below filter, removes state change events that do not have
-            # and old_state, new_state, or the old and
-            # new state.
-            #
-            .filter(
-                (Events.event_type != EVENT_STATE_CHANGED)
-                | (
-                    (States.state_id.isnot(None))
-                    & (old_state.state_id.isnot(None))
-                    & (States.state.isnot(None))
-                    & (States.state != old_state.state)
+
+        now = dt_util.utcnow()
+        if end_day is None or end_day > now:
+            end_day = now
+
+        await self.async_stream_past(start_day, end_day, send_past)
+
+        live_events, self._live_events = self._live_events, None
+        if self._unsubs:
+            on_live(
+                self._humanify_live(
+                    event for event in live_events if event.time_fired >= end_day
                 )
             )
-            #
-            # Prefilter out continuous domains that have
-            # ATTR_UNIT_OF_MEASUREMENT as its much faster in sql.
-            #
-            .filter(
-                (Events.event_type != EVENT_STATE_CHANGED)
-                | sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS))
-                | sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON))
+
+    @callback
+    def async_unsubscribe(self):
+        """Stop streaming the entries of the past and of live events."""
+        self._cancel.set()
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def _async_live_event(self, event):
+        """Handle a live event."""
+        event = _lazy_event_from_live_event(
+            event, self.entity_id, self.entity_matches_only
+        )
+        if event is None:
+            return
+
+        if self._live_events is not None:
+            self._live_events.append(event)
+            return
+
+        entries = self._humanify_live([event])
+        if entries:
+            self._on_live(entries)
+
+    def _humanify_live(self, events):
+        """Return the entries of live events."""
+        return list(
+            humanify(
+                self.hass,
+                self._yield_kept_events(events),
+                self.entity_attr_cache,
+                self.context_lookup,
+            )
+        )
+
+
+def _events_query(
+    hass, session, start_day, end_day, entity_id_lower, filters, entity_matches_only
+):
+    """Return the query of the logbook events of a period."""
+    old_state = aliased(States, name="old_state")
+
+    query = (
+        session.query(
+            Events.event_type,
+            Events.event_data,
+            Events.time_fired,
+            Events.context_id,
+            Events.context_user_id,
+            States.state,
+            States.entity_id,
+            States.domain,
+            States.attributes,
+        )
+        .order_by(Events.time_fired)
+        .outerjoin(States, (Events.event_id == States.event_id))
+        .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        # The below filter, removes state change events that do not have
+        # and old_state, new_state, or the old and
+        # new state.
+        #
+        .filter(
+            (Events.event_type != EVENT_STATE_CHANGED)
+            | (
+                (States.state_id.isnot(None))
+                & (old_state.state_id.isnot(None))
+                & (States.state.isnot(None))
+                & (States.state != old_state.state)
             )
-            .filter(
-                Events.event_type.in_(ALL_EVENT_TYPES + list(hass.data.get(DOMAIN, {})))
+        )
+        #
+        # Prefilter out continuous domains that have
+        # ATTR_UNIT_OF_MEASUREMENT as its much faster in sql.
+        # Only states recorded before the has_unit_of_measurement
+        # column was added need to search the attributes.
+        #
+        .filter(
+            (Events.event_type != EVENT_STATE_CHANGED)
+            | sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS))
+            | sqlalchemy.not_(States.has_unit_of_measurement)
+            | (
+                States.has_unit_of_measurement.is_(None)
+                & sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON))
             )
-            .filter((Events.time_fired > start_day) & (Events.time_fired < end_day))
         )
+        .filter(
+            Events.event_type.in_(ALL_EVENT_TYPES + list(hass.data.get(DOMAIN, {})))
+        )
+        .filter((Events.time_fired > start_day) & (Events.time_fired < end_day))
+    )
 
-        if entity_id_lower is not None:
-            if entity_matches_only:
-                # When entity_matches_only is provided, contexts and events that do not
-                # contain the entity_id are not included in the logbook response.
-                entity_id_json = ENTITY_ID_JSON_TEMPLATE.format(entity_id_lower)
-                query = query.filter(
-                    (
-                        (States.last_updated == States.last_changed)
-                        & (States.entity_id == entity_id_lower)
-                    )
-                    | (
-                        States.state_id.is_(None)
-                        & Events.event_data.contains(entity_id_json)
-                    )
+    if entity_id_lower is not None:
+        if entity_matches_only:
+            # When entity_matches_only is provided, contexts and events that do not
+            # contain the entity_id are not included in the logbook response.
+            entity_id_json = ENTITY_ID_JSON_TEMPLATE.format(entity_id_lower)
+            query = query.filter(
+                (
+                    (States.last_updated == States.last_changed)
+                    & (States.entity_id == entity_id_lower)
                 )
-            else:
-                query = query.filter(
-                    (
-                        (States.last_updated == States.last_changed)
-                        & (States.entity_id == entity_id_lower)
-                    )
-                    | (States.state_id.is_(None))
+                | (
+                    States.state_id.is_(None)
+                    & Events.event_data.contains(entity_id_json)
                 )
+            )
         else:
             query = query.filter(
-                (States.last_updated == States.last_changed)
+                (
+                    (States.last_updated == States.last_changed)
+                    & (States.entity_id == entity_id_lower)
+                )
                 | (States.state_id.is_(None))
             )
+    else:
+        query = query.filter(
+            (States.last_updated == States.last_changed) | (States.state_id.is_(None))
+        )
 
-        if apply_sql_entities_filter and filters:
-            entity_filter = filters.entity_filter()
-            if entity_filter is not None:
-                query = query.filter(
-                    entity_filter | (Events.event_type != EVENT_STATE_CHANGED)
-                )
+    if filters:
+        entity_filter = filters.entity_filter()
+        if entity_filter is not None:
+            query = query.filter(
+                entity_filter | (Events.event_type != EVENT_STATE_CHANGED)
+            )
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
-        )
+    return query
+
+
+def _lazy_event_from_live_event(event, entity_id, entity_matches_only):
+    """Return the lazy event of a live event, None if the logbook skips it.
+
+    This applies the same filters as the logbook query.
+    """
+    if event.event_type != EVENT_STATE_CHANGED:
+        if (
+            entity_id is not None
+            and entity_matches_only
+            and event.data.get(ATTR_ENTITY_ID) != entity_id
+        ):
+            return None
+        return LazyEventPartialState.from_live_event(event)
+
+    old_state = event.data.get("old_state")
+    new_state = event.data.get("new_state")
+    if old_state is None or new_state is None or old_state.state == new_state.state:
+        return None
+
+    if entity_id is not None and new_state.entity_id != entity_id:
+        return None
+
+    if (
+        new_state.domain in CONTINUOUS_DOMAINS
+        and ATTR_UNIT_OF_MEASUREMENT in new_state.attributes
+    ):
+        return None
+
+    return LazyEventPartialState.from_live_event(event, new_state)
 
 
 def _keep_event(hass, event, entities_filter):
@@ -698,6 +1103,22 @@ def _entity_name_from_event(entity_id, event, entity_attr_cache):
     ) or split_entity_id(entity_id)[1].replace("_", " ")
 
 
+_LiveEventRow = namedtuple(
+    "_LiveEventRow",
+    [
+        "event_type",
+        "event_data",
+        "time_fired",
+        "context_id",
+        "context_user_id",
+        "state",
+        "entity_id",
+        "domain",
+        "attributes",
+    ],
+)
+
+
 class LazyEventPartialState:
     """A lazy version of core Event with limited State joined in."""
 
@@ -731,6 +1152,28 @@ class LazyEventPartialState:
         self.context_user_id = self._row.context_user_id
         self.time_fired_minute = self._row.time_fired.minute
 
+    @classmethod
+    def from_live_event(cls, event, state=None):
+        """Create a lazy event from a live event and its new state."""
+        row = _LiveEventRow(
+            event_type=event.event_type,
+            event_data=EMPTY_JSON_OBJECT,
+            time_fired=event.time_fired,
+            context_id=event.context.id,
+            context_user_id=event.context.user_id,
+            state=state and state.state,
+            entity_id=state and state.entity_id,
+            domain=state and state.domain,
+            attributes=EMPTY_JSON_OBJECT,
+        )
+        lazy_event = cls(row)
+        # Decoded data is used when present, the row only holds placeholders
+        if state is None:
+            lazy_event._event_data = event.data
+        else:
+            lazy_event._attributes = dict(state.attributes)
+        return lazy_event
+
     @property
     def attributes_icon(self):
         """Extract the icon from the decoded attributes or json."""
@@ -647,12 +647,15 @@ class MQTT:
         """Initialize Home Assistant MQTT client."""
         # We don't import on the top because some integrations
         # should be able to optionally rely on MQTT.
-        import paho.mqtt.client as mqtt  # pylint: disable=import-outside-toplevel
+        # pylint: disable=import-outside-toplevel
+        import paho.mqtt.client as mqtt
+        from paho.mqtt.matcher import MQTTMatcher
 
         self.hass = hass
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: List[Subscription] = []
+        self._subscription_index = MQTTMatcher()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -840,6 +843,7 @@ class MQTT:
 
         subscription = Subscription(topic, msg_callback, qos, encoding)
         self.subscriptions.append(subscription)
+        self._async_index_subscription(subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -853,7 +857,7 @@ class MQTT:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if self._async_unindex_subscription(subscription):
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -863,6 +867,40 @@ class MQTT:
 
         return async_remove
 
+    @callback
+    def _async_index_subscription(self, subscription: Subscription) -> None:
+        """Add a subscription to the topic filter index."""
+        try:
+            self._subscription_index[subscription.topic].append(subscription)
+        except KeyError:
+            self._subscription_index[subscription.topic] = [subscription]
+
+    @callback
+    def _async_unindex_subscription(self, subscription: Subscription) -> bool:
+        """Remove a subscription from the topic filter index.
+
+        Return if other subscriptions remain on the same topic filter.
+        """
+        subscriptions = self._subscription_index[subscription.topic]
+        subscriptions.remove(subscription)
+        if subscriptions:
+            return True
+        del self._subscription_index[subscription.topic]
+        return False
+
+    @callback
+    def _async_matching_subscriptions(self, topic: str) -> List[Subscription]:
+        """Return the subscriptions with a topic filter matching topic.
+
+        The index is a prefix tree on topic levels with wildcard nodes, so
+        the lookup cost grows with the topic depth, not with the number of
+        subscriptions.
+        """
+        matches: List[Subscription] = []
+        for subscriptions in self._subscription_index.iter_match(topic):
+            matches.extend(subscriptions)
+        return matches
+
     async def _async_unsubscribe(self, topic: str) -> None:
         """Unsubscribe from a topic.
 
@@ -952,10 +990,7 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        for subscription in self.subscriptions:
-            if not _match_topic(subscription.topic, msg.topic):
-                continue
-
+        for subscription in self._async_matching_subscriptions(msg.topic):
             payload: SubscribePayloadType = msg.payload
             if subscription.encoding is not None:
                 try:
@@ -1050,20 +1085,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _match_topic(subscription: str, topic: str) -> bool:
-    """Test if topic matches subscription."""
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-    try:
-        next(matcher.iter_match(topic))
-        return True
-    except StopIteration:
-        return False
-
-
 class MqttAttributes(Entity):
     """Mixin used for platforms that support JSON attributes."""
 
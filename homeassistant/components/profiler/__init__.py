@@ -0,0 +1,97 @@
+"""Profile the event loop and the integrations running in it."""
+import cProfile
+import time
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import discovery
+
+from .const import (
+    CONF_SLOW_CALLBACK_DURATION,
+    DATA_MONITOR,
+    DATA_PROFILE,
+    DEFAULT_SLOW_CALLBACK_DURATION,
+    DOMAIN,
+    PROFILE_FILENAME,
+)
+from .monitor import RuntimeMonitor
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(
+                    CONF_SLOW_CALLBACK_DURATION, default=DEFAULT_SLOW_CALLBACK_DURATION
+                ): vol.All(vol.Coerce(float), vol.Range(min=0))
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Set up the Profiler integration."""
+    conf = config.get(DOMAIN, {})
+    monitor = RuntimeMonitor(
+        hass,
+        conf.get(CONF_SLOW_CALLBACK_DURATION, DEFAULT_SLOW_CALLBACK_DURATION),
+    )
+    monitor.async_start()
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, monitor.async_stop)
+    hass.data[DOMAIN] = {DATA_MONITOR: monitor, DATA_PROFILE: None}
+
+    websocket_api.async_register_command(hass, websocket_stats)
+    websocket_api.async_register_command(hass, websocket_start)
+    websocket_api.async_register_command(hass, websocket_stop)
+
+    hass.async_create_task(
+        discovery.async_load_platform(hass, "sensor", DOMAIN, {}, config)
+    )
+    return True
+
+
+@callback
+@websocket_api.websocket_command({vol.Required("type"): "profiler/stats"})
+@websocket_api.require_admin
+def websocket_stats(hass, connection, msg):
+    """Return the loop lag and the time spent in listeners and jobs."""
+    connection.send_result(msg["id"], hass.data[DOMAIN][DATA_MONITOR].async_stats())
+
+
+@callback
+@websocket_api.websocket_command({vol.Required("type"): "profiler/start"})
+@websocket_api.require_admin
+def websocket_start(hass, connection, msg):
+    """Start profiling the functions run by the event loop."""
+    if hass.data[DOMAIN][DATA_PROFILE] is not None:
+        connection.send_error(
+            msg["id"], "already_running", "The profiler is already running"
+        )
+        return
+
+    profile = cProfile.Profile()
+    profile.enable()
+    hass.data[DOMAIN][DATA_PROFILE] = profile
+    connection.send_result(msg["id"])
+
+
+@callback
+@websocket_api.websocket_command({vol.Required("type"): "profiler/stop"})
+@websocket_api.require_admin
+@websocket_api.async_response
+async def websocket_stop(hass, connection, msg):
+    """Stop profiling and write the profile to the configuration directory."""
+    profile = hass.data[DOMAIN][DATA_PROFILE]
+    if profile is None:
+        connection.send_error(msg["id"], "not_running", "The profiler is not running")
+        return
+
+    profile.disable()
+    hass.data[DOMAIN][DATA_PROFILE] = None
+    filename = hass.config.path(PROFILE_FILENAME.format(int(time.time())))
+    await hass.async_add_executor_job(profile.dump_stats, filename)
+    connection.send_result(msg["id"], {"filename": filename})
@@ -0,0 +1,18 @@
+"""Constants for the Profiler integration."""
+DOMAIN = "profiler"
+
+CONF_SLOW_CALLBACK_DURATION = "slow_callback_duration"
+
+DATA_MONITOR = "monitor"
+DATA_PROFILE = "profile"
+
+DEFAULT_SLOW_CALLBACK_DURATION = 0.1  # seconds
+
+# The loop lag is sampled every interval, percentiles cover the last samples
+LAG_INTERVAL = 1  # seconds
+LAG_SAMPLES = 600
+
+# Number of listeners with the most time spent returned by the stats
+MAX_LISTENERS = 25
+
+PROFILE_FILENAME = "profile.{}.cprof"
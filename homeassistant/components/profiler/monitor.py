@@ -0,0 +1,230 @@
+"""Measure the event loop lag and the time spent in listeners and jobs."""
+import asyncio
+from collections import defaultdict, deque
+import functools
+import logging
+import threading
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from homeassistant.core import (
+    JOB_EXECUTOR,
+    JOB_TASK,
+    HomeAssistant,
+    callback,
+    is_callback,
+)
+
+from .const import LAG_INTERVAL, LAG_SAMPLES, MAX_LISTENERS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _module_integration(module: Optional[str]) -> str:
+    """Return the integration a module belongs to."""
+    if module is None:
+        return "unknown"
+    parts = module.split(".")
+    if parts[:2] == ["homeassistant", "components"] and len(parts) > 2:
+        return parts[2]
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    if parts[0] == "homeassistant":
+        return "core"
+    return parts[0]
+
+
+def _job_name(target: Any) -> str:
+    """Return the name of a listener."""
+    module = getattr(target, "__module__", None)
+    name = getattr(target, "__qualname__", None) or repr(target)
+    return f"{module}.{name}" if module else name
+
+
+def _percentile(samples: List[float], percent: int) -> float:
+    """Return a percentile of sorted samples."""
+    return samples[min(len(samples) - 1, len(samples) * percent // 100)]
+
+
+class JobStats:
+    """Number of runs of a job and the time they took."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float) -> None:
+        """Add a run of the job."""
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the stats as a dictionary."""
+        return {"count": self.count, "total": self.total, "max": self.max}
+
+
+class RuntimeMonitor:
+    """Sample the event loop lag and time the listeners, jobs and tasks.
+
+    The lag is how late a timer scheduled every interval runs. Listeners
+    and jobs are timed by wrapping them when they are scheduled, callbacks
+    taking longer than the slow callback duration are logged.
+    """
+
+    def __init__(self, hass: HomeAssistant, slow_callback_duration: float) -> None:
+        """Initialize the monitor."""
+        self.hass = hass
+        self.slow_callback_duration = slow_callback_duration
+        self.lag: Deque[float] = deque(maxlen=LAG_SAMPLES)
+        self.listeners: Dict[str, JobStats] = defaultdict(JobStats)
+        self.executor: Dict[str, JobStats] = defaultdict(JobStats)
+        self.tasks: Dict[str, int] = defaultdict(int)
+        self.slow_callbacks = 0
+        # Jobs run by the executor update their stats from its threads
+        self._lock = threading.Lock()
+        self._probe: Optional[asyncio.TimerHandle] = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start monitoring."""
+        self.hass.job_wrapper = self._wrap
+        self._schedule_probe()
+
+    @callback
+    def async_stop(self, event: Any = None) -> None:
+        """Stop monitoring."""
+        if self.hass.job_wrapper == self._wrap:
+            self.hass.job_wrapper = None
+        if self._probe is not None:
+            self._probe.cancel()
+            self._probe = None
+
+    @callback
+    def _schedule_probe(self) -> None:
+        """Schedule the next sample of the loop lag."""
+        expected = self.hass.loop.time() + LAG_INTERVAL
+        self._probe = self.hass.loop.call_at(expected, self._async_sample, expected)
+
+    @callback
+    def _async_sample(self, expected: float) -> None:
+        """Record how late the probe runs."""
+        self.lag.append(max(0.0, self.hass.loop.time() - expected))
+        self._schedule_probe()
+
+    @callback
+    def async_lag_percentiles(self) -> Dict[str, Optional[float]]:
+        """Return percentiles of the loop lag in seconds."""
+        samples = sorted(self.lag)
+        if not samples:
+            return {"p50": None, "p95": None, "p99": None, "max": None}
+        return {
+            "p50": _percentile(samples, 50),
+            "p95": _percentile(samples, 95),
+            "p99": _percentile(samples, 99),
+            "max": samples[-1],
+        }
+
+    @callback
+    def async_stats(self) -> Dict[str, Any]:
+        """Return all the measurements."""
+        listeners = sorted(
+            self.listeners.items(), key=lambda item: item[1].total, reverse=True
+        )[:MAX_LISTENERS]
+        with self._lock:
+            executor = {
+                integration: stats.as_dict()
+                for integration, stats in self.executor.items()
+            }
+            listener_stats = [
+                {"listener": name, **stats.as_dict()} for name, stats in listeners
+            ]
+        return {
+            "loop_lag": self.async_lag_percentiles(),
+            "slow_callbacks": self.slow_callbacks,
+            "listeners": listener_stats,
+            "executor": executor,
+            "executor_lanes": self.hass.async_executor_lane_stats(),
+            "tasks": {
+                "running": len(asyncio.all_tasks(self.hass.loop)),
+                "created": dict(self.tasks),
+            },
+        }
+
+    def _wrap(self, kind: str, target: Any) -> Any:
+        """Wrap a job to measure it."""
+        if kind == JOB_TASK:
+            frame = getattr(target, "cr_frame", None)
+            module = frame.f_globals.get("__name__") if frame is not None else None
+            self.tasks[_module_integration(module)] += 1
+            return target
+
+        check_target = target
+        while isinstance(check_target, functools.partial):
+            check_target = check_target.func
+
+        if kind == JOB_EXECUTOR:
+            return self._wrap_thread(
+                target,
+                self.executor[
+                    _module_integration(getattr(check_target, "__module__", None))
+                ],
+            )
+
+        name = _job_name(check_target)
+        stats = self.listeners[name]
+
+        if asyncio.iscoroutinefunction(check_target):
+
+            async def timed_coroutine(*args: Any) -> Any:
+                """Run a coroutine listener, measuring the time until it is done."""
+                start = perf_counter()
+                try:
+                    return await target(*args)
+                finally:
+                    stats.add(perf_counter() - start)
+
+            return timed_coroutine
+
+        if is_callback(check_target):
+
+            @callback
+            def timed_callback(*args: Any) -> Any:
+                """Run a callback listener, measuring the time it blocks the loop."""
+                start = perf_counter()
+                try:
+                    return target(*args)
+                finally:
+                    duration = perf_counter() - start
+                    stats.add(duration)
+                    if duration > self.slow_callback_duration:
+                        self.slow_callbacks += 1
+                        _LOGGER.warning(
+                            "Listener %s blocked the event loop for %.3f seconds",
+                            name,
+                            duration,
+                        )
+
+            return timed_callback
+
+        return self._wrap_thread(target, stats)
+
+    def _wrap_thread(self, target: Callable, stats: JobStats) -> Callable:
+        """Wrap a job run by the executor."""
+
+        def timed_job(*args: Any) -> Any:
+            """Run a job, measuring the time it takes."""
+            start = perf_counter()
+            try:
+                return target(*args)
+            finally:
+                duration = perf_counter() - start
+                with self._lock:
+                    stats.add(duration)
+
+        return timed_job
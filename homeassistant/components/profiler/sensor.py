@@ -0,0 +1,83 @@
+"""Sensors of the event loop health."""
+from homeassistant.helpers.entity import Entity
+
+from .const import DATA_MONITOR, DOMAIN
+from .monitor import RuntimeMonitor
+
+LAG_PERCENTILES = ("p50", "p95", "p99")
+
+
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Set up the Profiler sensors."""
+    if discovery_info is None:
+        return
+
+    monitor = hass.data[DOMAIN][DATA_MONITOR]
+    async_add_entities(
+        [EventLoopLagSensor(monitor, percentile) for percentile in LAG_PERCENTILES]
+        + [SlowCallbacksSensor(monitor)],
+        True,
+    )
+
+
+class EventLoopLagSensor(Entity):
+    """Percentile of how late the event loop runs scheduled callbacks."""
+
+    def __init__(self, monitor: RuntimeMonitor, percentile: str) -> None:
+        """Initialize the sensor."""
+        self._monitor = monitor
+        self._percentile = percentile
+        self._state = None
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"Event loop lag {self._percentile}"
+
+    @property
+    def state(self):
+        """Return the loop lag in milliseconds."""
+        return self._state
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit of measurement."""
+        return "ms"
+
+    @property
+    def icon(self):
+        """Return the icon of the sensor."""
+        return "mdi:timer-sand"
+
+    async def async_update(self):
+        """Get the latest percentile."""
+        lag = self._monitor.async_lag_percentiles()[self._percentile]
+        self._state = None if lag is None else round(lag * 1000, 1)
+
+
+class SlowCallbacksSensor(Entity):
+    """Number of callbacks that blocked the event loop for too long."""
+
+    def __init__(self, monitor: RuntimeMonitor) -> None:
+        """Initialize the sensor."""
+        self._monitor = monitor
+        self._state = None
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return "Slow callbacks"
+
+    @property
+    def state(self):
+        """Return the number of slow callbacks."""
+        return self._state
+
+    @property
+    def icon(self):
+        """Return the icon of the sensor."""
+        return "mdi:timer-alert"
+
+    async def async_update(self):
+        """Get the latest count."""
+        self._state = self._monitor.slow_callbacks
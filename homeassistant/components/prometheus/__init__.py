@@ -1,9 +1,13 @@
 """Support for Prometheus metrics export."""
+import gzip
 import logging
 import string
+import threading
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
+from prometheus_client.openmetrics import exposition as openmetrics_exposition
+from prometheus_client.utils import floatToGoString
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -47,6 +51,13 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+
+COUNTER = "counter"
+GAUGE = "gauge"
+
+CONTENT_TYPE_OPENMETRICS = "application/openmetrics-text"
+OPENMETRICS_EOF = b"# EOF\n"
+
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
@@ -77,8 +88,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass, config):
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -101,10 +110,86 @@ def setup(hass, config):
         default_metric,
     )
 
+    hass.http.register_view(PrometheusView(prometheus_client, metrics))
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
     return True
 
 
+def _escape(value, quote=True):
+    """Escape a label value or help text for the exposition."""
+    value = value.replace("\\", r"\\").replace("\n", r"\n")
+    if quote:
+        value = value.replace('"', r"\"")
+    return value
+
+
+def _accepts(header, value):
+    """Return if a value is listed in an Accept style header."""
+    for part in header.split(","):
+        media, _, params = part.partition(";")
+        if media.strip() == value and params.replace(" ", "") != "q=0":
+            return True
+    return False
+
+
+class MetricFamily:
+    """Samples of a metric with their exposition lines cached per entity."""
+
+    def __init__(self, name, kind, documentation, extra_labels):
+        """Initialize the metric family."""
+        self.name = name
+        self.kind = kind
+        self.documentation = documentation
+        self.extra_labels = extra_labels
+        self.sample_name = f"{name}_total" if kind == COUNTER else name
+        self.fragments = {}
+        self._samples = {}
+
+    def set(self, entity_id, value, **extra):
+        """Set the value of the sample of an entity."""
+        samples = self._samples.setdefault(entity_id, {})
+        samples[tuple(extra[label] for label in self.extra_labels)] = float(value)
+
+    def inc(self, entity_id, **extra):
+        """Increment the value of the sample of an entity."""
+        samples = self._samples.setdefault(entity_id, {})
+        key = tuple(extra[label] for label in self.extra_labels)
+        samples[key] = samples.get(key, 0.0) + 1
+
+    def header(self, openmetrics):
+        """Return the help and type lines of the family."""
+        if openmetrics:
+            name = self.name
+            documentation = _escape(self.documentation)
+        else:
+            name = self.sample_name
+            documentation = _escape(self.documentation, quote=False)
+        return f"# HELP {name} {documentation}\n# TYPE {name} {self.kind}\n"
+
+    def update(self, entity_id, labels):
+        """Format the samples of an entity again."""
+        samples = self._samples.get(entity_id)
+        if samples is None:
+            return
+
+        lines = []
+        for extra_values, value in samples.items():
+            sample_labels = labels
+            if extra_values:
+                sample_labels = sorted(
+                    labels
+                    + [
+                        (label, _escape(str(extra_value)))
+                        for label, extra_value in zip(self.extra_labels, extra_values)
+                    ]
+                )
+            label_text = ",".join(f'{key}="{value}"' for key, value in sample_labels)
+            lines.append(
+                f"{self.sample_name}{{{label_text}}} {floatToGoString(value)}\n"
+            )
+        self.fragments[entity_id] = "".join(lines)
+
+
 class PrometheusMetrics:
     """Model all of the metrics which should be exposed to Prometheus."""
 
@@ -138,6 +223,10 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics = {}
         self._climate_units = climate_units
+        self._entity_labels = {}
+        self._dirty = set()
+        # State changes are handled by the executor while scrapes render
+        self._lock = threading.Lock()
 
     def handle_event(self, event):
         """Listen for new messages on the bus, and add them to Prometheus."""
@@ -152,59 +241,93 @@ class PrometheusMetrics:
         if not self._filter(state.entity_id):
             return
 
-        handler = f"_handle_{domain}"
+        with self._lock:
+            self._update_labels(state)
 
-        if hasattr(self, handler) and state.state != STATE_UNAVAILABLE:
-            getattr(self, handler)(state)
+            handler = f"_handle_{domain}"
 
-        labels = self._labels(state)
-        state_change = self._metric(
-            "state_change", self.prometheus_cli.Counter, "The number of state changes"
-        )
-        state_change.labels(**labels).inc()
+            if hasattr(self, handler) and state.state != STATE_UNAVAILABLE:
+                getattr(self, handler)(state)
 
-        entity_available = self._metric(
-            "entity_available",
-            self.prometheus_cli.Gauge,
-            "Entity is available (not in the unavailable state)",
-        )
-        entity_available.labels(**labels).set(float(state.state != STATE_UNAVAILABLE))
+            state_change = self._metric(
+                "state_change", COUNTER, "The number of state changes"
+            )
+            state_change.inc(entity_id)
 
-        last_updated_time_seconds = self._metric(
-            "last_updated_time_seconds",
-            self.prometheus_cli.Gauge,
-            "The last_updated timestamp",
+            entity_available = self._metric(
+                "entity_available",
+                GAUGE,
+                "Entity is available (not in the unavailable state)",
+            )
+            entity_available.set(entity_id, float(state.state != STATE_UNAVAILABLE))
+
+            last_updated_time_seconds = self._metric(
+                "last_updated_time_seconds",
+                GAUGE,
+                "The last_updated timestamp",
+            )
+            last_updated_time_seconds.set(entity_id, state.last_updated.timestamp())
+
+            self._dirty.add(entity_id)
+
+    def _update_labels(self, state):
+        """Store the labels of an entity, escaped for the exposition."""
+        friendly_name = str(state.attributes.get("friendly_name"))
+        current = self._entity_labels.get(state.entity_id)
+        if current is not None and current[0] == friendly_name:
+            return
+
+        self._entity_labels[state.entity_id] = (
+            friendly_name,
+            [
+                ("domain", _escape(state.domain)),
+                ("entity", _escape(state.entity_id)),
+                ("friendly_name", _escape(friendly_name)),
+            ],
         )
-        last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
 
     def _handle_attributes(self, state):
         for key, value in state.attributes.items():
             metric = self._metric(
                 f"{state.domain}_attr_{key.lower()}",
-                self.prometheus_cli.Gauge,
+                GAUGE,
                 f"{key} attribute of {state.domain} entity",
             )
 
             try:
                 value = float(value)
-                metric.labels(**self._labels(state)).set(value)
+                metric.set(state.entity_id, value)
             except (ValueError, TypeError):
                 pass
 
-    def _metric(self, metric, factory, documentation, extra_labels=None):
-        labels = ["entity", "friendly_name", "domain"]
-        if extra_labels is not None:
-            labels.extend(extra_labels)
-
+    def _metric(self, metric, kind, documentation, extra_labels=None):
         try:
             return self._metrics[metric]
         except KeyError:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
-            self._metrics[metric] = factory(full_metric_name, documentation, labels)
+            self._metrics[metric] = MetricFamily(
+                full_metric_name, kind, documentation, extra_labels or []
+            )
             return self._metrics[metric]
 
+    def render(self, openmetrics=False):
+        """Return the exposition of the entity metrics.
+
+        Only the lines of the entities that changed since the last call are
+        formatted again, the others are reused.
+        """
+        output = []
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            for family in self._metrics.values():
+                for entity_id in dirty:
+                    family.update(entity_id, self._entity_labels[entity_id][1])
+                output.append(family.header(openmetrics))
+                output.extend(family.fragments.values())
+        return "".join(output)
+
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
         return "".join(
@@ -229,65 +352,53 @@ class PrometheusMetrics:
             value = 0
         return value
 
-    @staticmethod
-    def _labels(state):
-        return {
-            "entity": state.entity_id,
-            "domain": state.domain,
-            "friendly_name": state.attributes.get("friendly_name"),
-        }
-
     def _battery(self, state):
         if "battery_level" in state.attributes:
             metric = self._metric(
                 "battery_level_percent",
-                self.prometheus_cli.Gauge,
+                GAUGE,
                 "Battery level as a percentage of its capacity",
             )
             try:
                 value = float(state.attributes["battery_level"])
-                metric.labels(**self._labels(state)).set(value)
+                metric.set(state.entity_id, value)
             except ValueError:
                 pass
 
     def _handle_binary_sensor(self, state):
         metric = self._metric(
             "binary_sensor_state",
-            self.prometheus_cli.Gauge,
+            GAUGE,
             "State of the binary sensor (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        metric.set(state.entity_id, value)
 
     def _handle_input_boolean(self, state):
         metric = self._metric(
             "input_boolean_state",
-            self.prometheus_cli.Gauge,
+            GAUGE,
             "State of the input boolean (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        metric.set(state.entity_id, value)
 
     def _handle_device_tracker(self, state):
         metric = self._metric(
             "device_tracker_state",
-            self.prometheus_cli.Gauge,
+            GAUGE,
             "State of the device tracker (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        metric.set(state.entity_id, value)
 
     def _handle_person(self, state):
-        metric = self._metric(
-            "person_state", self.prometheus_cli.Gauge, "State of the person (0/1)"
-        )
+        metric = self._metric("person_state", GAUGE, "State of the person (0/1)")
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        metric.set(state.entity_id, value)
 
     def _handle_light(self, state):
-        metric = self._metric(
-            "light_state", self.prometheus_cli.Gauge, "Load level of a light (0..1)"
-        )
+        metric = self._metric("light_state", GAUGE, "Load level of a light (0..1)")
 
         try:
             if "brightness" in state.attributes and state.state == STATE_ON:
@@ -295,16 +406,14 @@ class PrometheusMetrics:
             else:
                 value = self.state_as_number(state)
             value = value * 100
-            metric.labels(**self._labels(state)).set(value)
+            metric.set(state.entity_id, value)
         except ValueError:
             pass
 
     def _handle_lock(self, state):
-        metric = self._metric(
-            "lock_state", self.prometheus_cli.Gauge, "State of the lock (0/1)"
-        )
+        metric = self._metric("lock_state", GAUGE, "State of the lock (0/1)")
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        metric.set(state.entity_id, value)
 
     def _handle_climate(self, state):
         temp = state.attributes.get(ATTR_TEMPERATURE)
@@ -313,10 +422,10 @@ class PrometheusMetrics:
                 temp = fahrenheit_to_celsius(temp)
             metric = self._metric(
                 "temperature_c",
-                self.prometheus_cli.Gauge,
+                GAUGE,
                 "Temperature in degrees Celsius",
             )
-            metric.labels(**self._labels(state)).set(temp)
+            metric.set(state.entity_id, temp)
 
         current_temp = state.attributes.get(ATTR_CURRENT_TEMPERATURE)
         if current_temp:
@@ -324,22 +433,22 @@ class PrometheusMetrics:
                 current_temp = fahrenheit_to_celsius(current_temp)
             metric = self._metric(
                 "current_temperature_c",
-                self.prometheus_cli.Gauge,
+                GAUGE,
                 "Current Temperature in degrees Celsius",
             )
-            metric.labels(**self._labels(state)).set(current_temp)
+            metric.set(state.entity_id, current_temp)
 
         current_action = state.attributes.get(ATTR_HVAC_ACTION)
         if current_action:
             metric = self._metric(
                 "climate_action",
-                self.prometheus_cli.Gauge,
+                GAUGE,
                 "HVAC action",
                 ["action"],
             )
             for action in CURRENT_HVAC_ACTIONS:
-                metric.labels(**dict(self._labels(state), action=action)).set(
-                    float(action == current_action)
+                metric.set(
+                    state.entity_id, float(action == current_action), action=action
                 )
 
     def _handle_humidifier(self, state):
@@ -347,19 +456,19 @@ class PrometheusMetrics:
         if humidifier_target_humidity_percent:
             metric = self._metric(
                 "humidifier_target_humidity_percent",
-                self.prometheus_cli.Gauge,
+                GAUGE,
                 "Target Relative Humidity",
             )
-            metric.labels(**self._labels(state)).set(humidifier_target_humidity_percent)
+            metric.set(state.entity_id, humidifier_target_humidity_percent)
 
         metric = self._metric(
             "humidifier_state",
-            self.prometheus_cli.Gauge,
+            GAUGE,
             "State of the humidifier (0/1)",
         )
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            metric.set(state.entity_id, value)
         except ValueError:
             pass
 
@@ -368,14 +477,12 @@ class PrometheusMetrics:
         if current_mode and available_modes:
             metric = self._metric(
                 "humidifier_mode",
-                self.prometheus_cli.Gauge,
+                GAUGE,
                 "Humidifier Mode",
                 ["mode"],
             )
             for mode in available_modes:
-                metric.labels(**dict(self._labels(state), mode=mode)).set(
-                    float(mode == current_mode)
-                )
+                metric.set(state.entity_id, float(mode == current_mode), mode=mode)
 
     def _handle_sensor(self, state):
         unit = self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
@@ -386,15 +493,13 @@ class PrometheusMetrics:
                 break
 
         if metric is not None:
-            _metric = self._metric(
-                metric, self.prometheus_cli.Gauge, f"Sensor data measured in {unit}"
-            )
+            _metric = self._metric(metric, GAUGE, f"Sensor data measured in {unit}")
 
             try:
                 value = self.state_as_number(state)
                 if unit == TEMP_FAHRENHEIT:
                     value = fahrenheit_to_celsius(value)
-                _metric.labels(**self._labels(state)).set(value)
+                _metric.set(state.entity_id, value)
             except ValueError:
                 pass
 
@@ -446,13 +551,11 @@ class PrometheusMetrics:
         return units.get(unit, default)
 
     def _handle_switch(self, state):
-        metric = self._metric(
-            "switch_state", self.prometheus_cli.Gauge, "State of the switch (0/1)"
-        )
+        metric = self._metric("switch_state", GAUGE, "State of the switch (0/1)")
 
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            metric.set(state.entity_id, value)
         except ValueError:
             pass
 
@@ -464,11 +567,11 @@ class PrometheusMetrics:
     def _handle_automation(self, state):
         metric = self._metric(
             "automation_triggered_count",
-            self.prometheus_cli.Counter,
+            COUNTER,
             "Count of times an automation has been triggered",
         )
 
-        metric.labels(**self._labels(state)).inc()
+        metric.inc(state.entity_id)
 
 
 class PrometheusView(HomeAssistantView):
@@ -477,15 +580,44 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, prometheus_cli, metrics):
         """Initialize Prometheus view."""
         self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        return web.Response(
-            body=self.prometheus_cli.generate_latest(),
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
+        openmetrics = _accepts(
+            request.headers.get(hdrs.ACCEPT, ""), CONTENT_TYPE_OPENMETRICS
+        )
+        compress = _accepts(request.headers.get(hdrs.ACCEPT_ENCODING, ""), "gzip")
+        body = await request.app["hass"].async_add_executor_job(
+            self._render, openmetrics, compress
         )
+
+        headers = {
+            hdrs.CONTENT_TYPE: openmetrics_exposition.CONTENT_TYPE_LATEST
+            if openmetrics
+            else CONTENT_TYPE_TEXT_PLAIN,
+            hdrs.VARY: "Accept, Accept-Encoding",
+        }
+        if compress:
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
+        return web.Response(body=body, headers=headers)
+
+    def _render(self, openmetrics, compress):
+        """Render the metrics in the requested format."""
+        entities = self.metrics.render(openmetrics).encode("utf-8")
+        if openmetrics:
+            registry = openmetrics_exposition.generate_latest(
+                self.prometheus_cli.REGISTRY
+            )
+            body = registry[: -len(OPENMETRICS_EOF)] + entities + OPENMETRICS_EOF
+        else:
+            body = self.prometheus_cli.generate_latest() + entities
+
+        if compress:
+            return gzip.compress(body)
+        return body
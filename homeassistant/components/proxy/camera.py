@@ -242,7 +242,7 @@ class ProxyCamera(Camera):
             job = _resize_image
         else:
             job = _crop_image
-        image = await self.hass.async_add_executor_job(
+        image = await self.hass.async_add_process_job(
             job, image.content, self._image_opts
         )
 
@@ -279,6 +279,6 @@ class ProxyCamera(Camera):
             job = _resize_image
         else:
             job = _crop_image
-        return await self.hass.async_add_executor_job(
+        return await self.hass.async_add_process_job(
             job, image.content, self._stream_opts
         )
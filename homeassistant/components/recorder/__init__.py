@@ -2,14 +2,14 @@
 import asyncio
 from collections import namedtuple
 import concurrent.futures
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import queue
 import threading
 import time
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
+from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select, text
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
 import voluptuous as vol
@@ -21,20 +21,21 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
 )
 from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.helpers import discovery
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
-from . import migration, purge
+from . import migration, purge, statistics
 from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
 from .models import Base, Events, RecorderRuns, States
 from .util import session_scope, validate_or_move_away_sqlite_database
@@ -60,6 +61,10 @@ DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 KEEPALIVE_TIME = 30
 
+# Dialects where explicitly assigned primary keys keep the autoincrement
+# counters in sync, which batched writes rely on.
+BATCH_WRITE_DIALECTS = ("sqlite", "mysql", "postgresql")
+
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
@@ -68,6 +73,9 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BATCH_WRITES = "batch_writes"
+CONF_STATISTICS_KEEP_DAYS = "statistics_keep_days"
+CONF_SHORT_TERM_STATISTICS = "short_term_statistics"
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
     {vol.Optional(CONF_EVENT_TYPES): vol.All(cv.ensure_list, [cv.string])}
@@ -94,6 +102,11 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(CONF_COMMIT_INTERVAL, default=1): vol.All(
                         vol.Coerce(int), vol.Range(min=0)
                     ),
+                    vol.Optional(CONF_BATCH_WRITES, default=False): cv.boolean,
+                    vol.Optional(CONF_STATISTICS_KEEP_DAYS, default=365): vol.All(
+                        vol.Coerce(int), vol.Range(min=1)
+                    ),
+                    vol.Optional(CONF_SHORT_TERM_STATISTICS, default=False): cv.boolean,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -158,6 +171,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_purge = conf[CONF_AUTO_PURGE]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    batch_writes = conf[CONF_BATCH_WRITES]
+    statistics_keep_days = conf[CONF_STATISTICS_KEEP_DAYS]
+    short_term_statistics = conf[CONF_SHORT_TERM_STATISTICS]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_integrity_check = conf[CONF_DB_INTEGRITY_CHECK]
@@ -178,10 +194,18 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         entity_filter=entity_filter,
         exclude_t=exclude_t,
         db_integrity_check=db_integrity_check,
+        batch_writes=batch_writes,
+        statistics_keep_days=statistics_keep_days,
+        short_term_statistics=short_term_statistics,
     )
     instance.async_initialize()
     instance.start()
 
+    if batch_writes:
+        hass.async_create_task(
+            discovery.async_load_platform(hass, "sensor", DOMAIN, {}, config)
+        )
+
     async def async_handle_purge_service(service):
         """Handle calls to the purge service."""
         instance.do_adhoc_purge(**service.data)
@@ -194,12 +218,21 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 
 PurgeTask = namedtuple("PurgeTask", ["keep_days", "repack"])
+StatisticsTask = namedtuple("StatisticsTask", ["period", "start"])
 
 
 class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
 
+class CommitTask:
+    """An object to insert into the recorder queue to commit the event session."""
+
+
+class KeepAliveTask:
+    """An object to insert into the recorder queue to keep the connection alive."""
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -215,6 +248,9 @@ class Recorder(threading.Thread):
         entity_filter: Callable[[str], bool],
         exclude_t: List[str],
         db_integrity_check: bool,
+        batch_writes: bool = False,
+        statistics_keep_days: int = 365,
+        short_term_statistics: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -229,6 +265,9 @@ class Recorder(threading.Thread):
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
         self.db_integrity_check = db_integrity_check
+        self.batch_writes = batch_writes
+        self.statistics_keep_days = statistics_keep_days
+        self.short_term_statistics = short_term_statistics
         self.async_db_ready = asyncio.Future()
         self._queue_watch = threading.Event()
         self.engine: Any = None
@@ -237,9 +276,11 @@ class Recorder(threading.Thread):
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
 
-        self._timechanges_seen = 0
-        self._keepalive_count = 0
         self._old_state_ids = {}
+        self._pending_batch: List[Tuple[Events, Optional[States]]] = []
+        self._next_event_id: Optional[int] = None
+        self._next_state_id: Optional[int] = None
+        self.last_batch_size = 0
         self.event_session = None
         self.get_session = None
         self._completed_database_setup = False
@@ -249,6 +290,38 @@ class Recorder(threading.Thread):
         """Initialize the recorder."""
         self.hass.bus.async_listen(MATCH_ALL, self.event_listener)
 
+        unsubs = [
+            async_track_time_interval(
+                self.hass, self._async_keep_alive, timedelta(seconds=KEEPALIVE_TIME)
+            )
+        ]
+        if self.commit_interval:
+            unsubs.append(
+                async_track_time_interval(
+                    self.hass,
+                    self._async_commit,
+                    timedelta(seconds=self.commit_interval),
+                )
+            )
+
+        @callback
+        def async_stop_intervals(event):
+            """Stop queueing commits and keepalives."""
+            for unsub in unsubs:
+                unsub()
+
+        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop_intervals)
+
+    @callback
+    def _async_keep_alive(self, now):
+        """Queue a keepalive."""
+        self.queue.put(KeepAliveTask())
+
+    @callback
+    def _async_commit(self, now):
+        """Queue a commit of the events received since the last one."""
+        self.queue.put(CommitTask())
+
     def do_adhoc_purge(self, **kwargs):
         """Trigger an adhoc purge retaining keep_days worth of data."""
         keep_days = kwargs.get(ATTR_KEEP_DAYS, self.keep_days)
@@ -343,6 +416,31 @@ class Recorder(threading.Thread):
                 async_purge, hour=4, minute=12, second=0
             )
 
+        @callback
+        def async_compile_statistics(now):
+            """Trigger compiling the statistics of the periods that just ended."""
+            if self.short_term_statistics:
+                self.queue.put(
+                    StatisticsTask(
+                        statistics.PERIOD_5MINUTE,
+                        statistics.period_start(statistics.PERIOD_5MINUTE, now),
+                    )
+                )
+            if now.minute < 5:
+                self.queue.put(
+                    StatisticsTask(
+                        statistics.PERIOD_HOUR,
+                        statistics.period_start(statistics.PERIOD_HOUR, now),
+                    )
+                )
+
+        # Compile statistics shortly after every period ended
+        self.hass.helpers.event.track_utc_time_change(
+            async_compile_statistics,
+            minute=range(0, 60, 5) if self.short_term_statistics else 0,
+            second=10,
+        )
+
         self.event_session = self.get_session()
         # Use a session for the event read loop
         # with a commit every time the event time
@@ -358,19 +456,19 @@ class Recorder(threading.Thread):
                 if not purge.purge_old_data(self, event.keep_days, event.repack):
                     self.queue.put(PurgeTask(event.keep_days, event.repack))
                 continue
+            if isinstance(event, StatisticsTask):
+                # Schedule a new task if missed periods are left to compile
+                if not statistics.compile_statistics(self, event.period, event.start):
+                    self.queue.put(StatisticsTask(event.period, event.start))
+                continue
             if isinstance(event, WaitTask):
                 self._queue_watch.set()
                 continue
-            if event.event_type == EVENT_TIME_CHANGED:
-                self._keepalive_count += 1
-                if self._keepalive_count >= KEEPALIVE_TIME:
-                    self._keepalive_count = 0
-                    self._send_keep_alive()
-                if self.commit_interval:
-                    self._timechanges_seen += 1
-                    if self._timechanges_seen >= self.commit_interval:
-                        self._timechanges_seen = 0
-                        self._commit_event_session_or_retry()
+            if isinstance(event, KeepAliveTask):
+                self._send_keep_alive()
+                continue
+            if isinstance(event, CommitTask):
+                self._commit_event_session_or_retry()
                 continue
             if event.event_type in self.exclude_t:
                 continue
@@ -380,45 +478,175 @@ class Recorder(threading.Thread):
                 if not self.entity_filter(entity_id):
                     continue
 
-            try:
+            if self.batch_writes:
+                self._add_event_to_batch(event)
+            else:
+                self._add_event_to_session(event)
+
+            # If they do not have a commit interval
+            # than we commit right away
+            if not self.commit_interval:
+                self._commit_event_session_or_retry()
+
+    def _add_event_to_session(self, event):
+        """Add an event and its state to the session, flushing each row."""
+        dbevent = None
+        try:
+            if event.event_type == EVENT_STATE_CHANGED:
+                # The event data is stored in the states table
+                dbevent = Events.from_event(event, event_data="{}")
+            else:
                 dbevent = Events.from_event(event)
-                if event.event_type == EVENT_STATE_CHANGED:
-                    dbevent.event_data = "{}"
-                self.event_session.add(dbevent)
+            self.event_session.add(dbevent)
+            self.event_session.flush()
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error adding event: %s", err)
+
+        if dbevent and event.event_type == EVENT_STATE_CHANGED:
+            try:
+                dbstate = States.from_event(event)
+                has_new_state = event.data.get("new_state")
+                dbstate.old_state_id = self._old_state_ids.get(dbstate.entity_id)
+                if not has_new_state:
+                    dbstate.state = None
+                dbstate.event_id = dbevent.event_id
+                self.event_session.add(dbstate)
                 self.event_session.flush()
+                if has_new_state:
+                    self._old_state_ids[dbstate.entity_id] = dbstate.state_id
+                elif dbstate.entity_id in self._old_state_ids:
+                    del self._old_state_ids[dbstate.entity_id]
             except (TypeError, ValueError):
-                _LOGGER.warning("Event is not JSON serializable: %s", event)
+                _LOGGER.warning(
+                    "State is not JSON serializable: %s",
+                    event.data.get("new_state"),
+                )
             except Exception as err:  # pylint: disable=broad-except
                 # Must catch the exception to prevent the loop from collapsing
-                _LOGGER.exception("Error adding event: %s", err)
-
-            if dbevent and event.event_type == EVENT_STATE_CHANGED:
-                try:
-                    dbstate = States.from_event(event)
-                    has_new_state = event.data.get("new_state")
-                    dbstate.old_state_id = self._old_state_ids.get(dbstate.entity_id)
-                    if not has_new_state:
-                        dbstate.state = None
-                    dbstate.event_id = dbevent.event_id
-                    self.event_session.add(dbstate)
-                    self.event_session.flush()
-                    if has_new_state:
-                        self._old_state_ids[dbstate.entity_id] = dbstate.state_id
-                    elif dbstate.entity_id in self._old_state_ids:
-                        del self._old_state_ids[dbstate.entity_id]
-                except (TypeError, ValueError):
-                    _LOGGER.warning(
-                        "State is not JSON serializable: %s",
-                        event.data.get("new_state"),
+                _LOGGER.exception("Error adding state change: %s", err)
+
+    def _add_event_to_batch(self, event):
+        """Add an event and its state to the batch written on the next commit."""
+        try:
+            if event.event_type == EVENT_STATE_CHANGED:
+                # The event data is stored in the states table
+                dbevent = Events.from_event(event, event_data="{}")
+            else:
+                dbevent = Events.from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error adding event: %s", err)
+            return
+
+        dbstate = None
+        if event.event_type == EVENT_STATE_CHANGED:
+            try:
+                dbstate = States.from_event(event)
+                if not event.data.get("new_state"):
+                    dbstate.state = None
+            except (TypeError, ValueError):
+                _LOGGER.warning(
+                    "State is not JSON serializable: %s",
+                    event.data.get("new_state"),
+                )
+                dbstate = None
+            except Exception as err:  # pylint: disable=broad-except
+                # Must catch the exception to prevent the loop from collapsing
+                _LOGGER.exception("Error adding state change: %s", err)
+                dbstate = None
+
+        self._pending_batch.append((dbevent, dbstate))
+
+    def _write_pending_batch(self) -> Tuple[int, int, Dict[str, Optional[int]]]:
+        """Write the pending batch with one bulk insert per table.
+
+        Primary keys are assigned here instead of being fetched back row by
+        row, so the event_id and old_state_id links can be resolved before
+        the rows are inserted with executemany. Returns the next free ids and
+        the latest state id per entity, to be applied once committed.
+        """
+        if self._next_event_id is None:
+            self._next_event_id = self._max_row_id(Events.event_id) + 1
+            self._next_state_id = self._max_row_id(States.state_id) + 1
+
+        event_id = self._next_event_id
+        state_id = self._next_state_id
+        latest_state_ids: Dict[str, Optional[int]] = {}
+        dbevents = []
+        dbstates = []
+
+        for dbevent, dbstate in self._pending_batch:
+            dbevent.event_id = event_id
+            event_id += 1
+            dbevents.append(dbevent)
+
+            if dbstate is None:
+                continue
+
+            entity_id = dbstate.entity_id
+            dbstate.state_id = state_id
+            dbstate.event_id = dbevent.event_id
+            if entity_id in latest_state_ids:
+                dbstate.old_state_id = latest_state_ids[entity_id]
+            else:
+                dbstate.old_state_id = self._old_state_ids.get(entity_id)
+            state_id += 1
+            dbstates.append(dbstate)
+
+            if dbstate.state is None:
+                latest_state_ids[entity_id] = None
+            else:
+                latest_state_ids[entity_id] = dbstate.state_id
+
+        if dbevents:
+            self.event_session.bulk_save_objects(dbevents)
+        if dbstates:
+            self.event_session.bulk_save_objects(dbstates)
+
+        if self.engine.dialect.name == "postgresql":
+            # Explicit ids do not advance the serial sequences
+            for table, column, last_id in (
+                ("events", "event_id", event_id - 1),
+                ("states", "state_id", state_id - 1),
+            ):
+                if last_id:
+                    self.event_session.execute(
+                        text(
+                            f"SELECT setval(pg_get_serial_sequence('{table}', "
+                            f"'{column}'), :last_id)"
+                        ),
+                        {"last_id": last_id},
                     )
-                except Exception as err:  # pylint: disable=broad-except
-                    # Must catch the exception to prevent the loop from collapsing
-                    _LOGGER.exception("Error adding state change: %s", err)
 
-            # If they do not have a commit interval
-            # than we commit right away
-            if not self.commit_interval:
-                self._commit_event_session_or_retry()
+        return event_id, state_id, latest_state_ids
+
+    def _max_row_id(self, column) -> int:
+        """Return the highest id in use for a primary key column."""
+        return self.event_session.query(func.max(column)).scalar() or 0
+
+    def _complete_pending_batch(
+        self,
+        next_event_id: int,
+        next_state_id: int,
+        latest_state_ids: Dict[str, Optional[int]],
+    ):
+        """Track the ids of a committed batch."""
+        self.last_batch_size = len(self._pending_batch)
+        self._pending_batch = []
+        self._next_event_id = next_event_id
+        self._next_state_id = next_state_id
+
+        for entity_id, state_id in latest_state_ids.items():
+            if state_id is None:
+                self._old_state_ids.pop(entity_id, None)
+            else:
+                self._old_state_ids[entity_id] = state_id
 
     def _send_keep_alive(self):
         try:
@@ -462,6 +690,8 @@ class Recorder(threading.Thread):
             except Exception as err:  # pylint: disable=broad-except
                 # Must catch the exception to prevent the loop from collapsing
                 _LOGGER.exception("Error saving events: %s", err)
+                if self._pending_batch:
+                    self._commit_pending_batch_by_row()
                 return
 
         _LOGGER.error(
@@ -470,7 +700,36 @@ class Recorder(threading.Thread):
         )
         self._reopen_event_session()
 
+    def _commit_pending_batch_by_row(self):
+        """Commit the rows of a failed batch one by one to drop only bad rows."""
+        batch, self._pending_batch = self._pending_batch, []
+        dropped = 0
+
+        for row in batch:
+            # Read the next free ids from the database again after a rollback
+            self._next_event_id = None
+            self._next_state_id = None
+            self._pending_batch = [row]
+            try:
+                self._commit_event_session()
+            except Exception:  # pylint: disable=broad-except
+                # Must catch the exception to prevent the loop from collapsing
+                dropped += 1
+                self._pending_batch = []
+
+        if dropped:
+            _LOGGER.error("Dropped %s events that could not be saved", dropped)
+
     def _reopen_event_session(self):
+        if self._pending_batch:
+            _LOGGER.error(
+                "Dropping %s events that could not be saved", len(self._pending_batch)
+            )
+            self._pending_batch = []
+        # Read the next free ids from the database again after a rollback
+        self._next_event_id = None
+        self._next_state_id = None
+
         try:
             self.event_session.rollback()
         except Exception as err:  # pylint: disable=broad-except
@@ -490,13 +749,19 @@ class Recorder(threading.Thread):
             _LOGGER.exception("Error while creating new event session: %s", err)
 
     def _commit_event_session(self):
+        batch = None
         try:
+            if self._pending_batch:
+                batch = self._write_pending_batch()
             self.event_session.commit()
         except Exception as err:
             _LOGGER.error("Error executing query: %s", err)
             self.event_session.rollback()
             raise
 
+        if batch is not None:
+            self._complete_pending_batch(*batch)
+
     @callback
     def event_listener(self, event):
         """Listen for new events and put them in the process queue."""
@@ -578,6 +843,14 @@ class Recorder(threading.Thread):
         Base.metadata.create_all(self.engine)
         self.get_session = scoped_session(sessionmaker(bind=self.engine))
 
+        if self.batch_writes and self.engine.dialect.name not in BATCH_WRITE_DIALECTS:
+            _LOGGER.warning(
+                "Batch writes are not supported for %s databases, "
+                "writing events one by one",
+                self.engine.dialect.name,
+            )
+            self.batch_writes = False
+
     def _close_connection(self):
         """Close the connection."""
         self.engine.dispose()
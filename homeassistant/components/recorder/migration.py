@@ -6,7 +6,7 @@ from sqlalchemy.engine import reflection
 from sqlalchemy.exc import InternalError, OperationalError, SQLAlchemyError
 
 from .const import DOMAIN
-from .models import SCHEMA_VERSION, Base, SchemaChanges
+from .models import SCHEMA_VERSION, Base, SchemaChanges, Statistics, StatisticsShortTerm
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -277,6 +277,15 @@ def _apply_update(engine, new_version, old_version):
         _drop_index(engine, "states", "ix_states_entity_id")
         _create_index(engine, "events", "ix_events_event_type_time_fired")
         _drop_index(engine, "events", "ix_events_event_type")
+    elif new_version == 10:
+        # Long-term statistics compiled from the states table
+        Base.metadata.create_all(
+            engine, tables=[Statistics.__table__, StatisticsShortTerm.__table__]
+        )
+    elif new_version == 11:
+        # Lets the logbook exclude continuous entities without a LIKE scan
+        # of the attributes
+        _add_columns(engine, "states", ["has_unit_of_measurement BOOLEAN"])
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -6,6 +6,7 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
@@ -16,6 +17,7 @@ from sqlalchemy import (
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
@@ -24,7 +26,7 @@ import homeassistant.util.dt as dt_util
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 9
+SCHEMA_VERSION = 11
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,8 +36,17 @@ TABLE_EVENTS = "events"
 TABLE_STATES = "states"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
+TABLE_STATISTICS = "statistics"
+TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 
-ALL_TABLES = [TABLE_EVENTS, TABLE_STATES, TABLE_RECORDER_RUNS, TABLE_SCHEMA_CHANGES]
+ALL_TABLES = [
+    TABLE_EVENTS,
+    TABLE_STATES,
+    TABLE_RECORDER_RUNS,
+    TABLE_SCHEMA_CHANGES,
+    TABLE_STATISTICS,
+    TABLE_STATISTICS_SHORT_TERM,
+]
 
 
 class Events(Base):  # type: ignore
@@ -59,11 +70,13 @@ class Events(Base):  # type: ignore
     )
 
     @staticmethod
-    def from_event(event):
+    def from_event(event, event_data=None):
         """Create an event database object from a native event."""
+        if event_data is None:
+            event_data = json.dumps(event.data, cls=JSONEncoder)
         return Events(
             event_type=event.event_type,
-            event_data=json.dumps(event.data, cls=JSONEncoder),
+            event_data=event_data,
             origin=str(event.origin),
             time_fired=event.time_fired,
             context_id=event.context.id,
@@ -106,6 +119,8 @@ class States(Base):  # type: ignore
     last_updated = Column(DateTime(timezone=True), default=dt_util.utcnow, index=True)
     created = Column(DateTime(timezone=True), default=dt_util.utcnow)
     old_state_id = Column(Integer)
+    # Set when the state has a unit of measurement, NULL for older rows
+    has_unit_of_measurement = Column(Boolean)
 
     __table_args__ = (
         # Used for fetching the state of entities at a specific time
@@ -126,12 +141,16 @@ class States(Base):  # type: ignore
             dbstate.state = ""
             dbstate.domain = split_entity_id(entity_id)[0]
             dbstate.attributes = "{}"
+            dbstate.has_unit_of_measurement = False
             dbstate.last_changed = event.time_fired
             dbstate.last_updated = event.time_fired
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
             dbstate.attributes = json.dumps(dict(state.attributes), cls=JSONEncoder)
+            dbstate.has_unit_of_measurement = (
+                ATTR_UNIT_OF_MEASUREMENT in state.attributes
+            )
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
@@ -157,6 +176,50 @@ class States(Base):  # type: ignore
             return None
 
 
+class StatisticsBase:
+    """Aggregated numeric states of an entity over a period."""
+
+    id = Column(Integer, primary_key=True)
+    statistic_id = Column(String(255))
+    start = Column(DateTime(timezone=True))
+    mean = Column(Float)
+    min = Column(Float)
+    max = Column(Float)
+    # Value at the end of the period, None if it was not numeric
+    last = Column(Float)
+    created = Column(DateTime(timezone=True), default=dt_util.utcnow)
+
+    def as_dict(self):
+        """Return a dict representation of the statistic."""
+        return {
+            "start": process_timestamp_to_utc_isoformat(self.start),
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "last": self.last,
+        }
+
+
+class Statistics(Base, StatisticsBase):  # type: ignore
+    """Hourly statistics, kept longer than the states they are compiled from."""
+
+    __tablename__ = TABLE_STATISTICS
+
+    __table_args__ = (
+        Index("ix_statistics_statistic_id_start", "statistic_id", "start"),
+    )
+
+
+class StatisticsShortTerm(Base, StatisticsBase):  # type: ignore
+    """Five minute statistics, purged together with the states."""
+
+    __tablename__ = TABLE_STATISTICS_SHORT_TERM
+
+    __table_args__ = (
+        Index("ix_statistics_short_term_statistic_id_start", "statistic_id", "start"),
+    )
+
+
 class RecorderRuns(Base):  # type: ignore
     """Representation of recorder run."""
 
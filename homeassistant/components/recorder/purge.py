@@ -3,67 +3,75 @@ from datetime import timedelta
 import logging
 import time
 
+from sqlalchemy import func
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 import homeassistant.util.dt as dt_util
 
+from . import statistics
 from .models import Events, RecorderRuns, States
-from .util import execute, session_scope
+from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum number of rows deleted by a single statement, below the
+# default limit of 999 bound parameters of SQLite
+MAX_ROWS_TO_PURGE = 998
+# Seconds a purge pass may take before handing back to the recorder queue
+PURGE_TIME_BUDGET = 1
+
 
 def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
     """Purge events and states older than purge_days ago.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Rows are deleted in batches of at most MAX_ROWS_TO_PURGE ids, each batch
+    in its own transaction so table locks are only held briefly. Once a pass
+    has run for PURGE_TIME_BUDGET seconds it returns False, so the recorder
+    can process its queue before the next pass continues.
     """
     purge_before = dt_util.utcnow() - timedelta(days=purge_days)
     _LOGGER.debug("Purging states and events before target %s", purge_before)
 
-    try:
-        with session_scope(session=instance.get_session()) as session:
-            # Purge a max of 1 hour, based on the oldest states or events record
-            batch_purge_before = purge_before
-
-            query = session.query(States).order_by(States.last_updated.asc()).limit(1)
-            states = execute(query, to_native=True, validate_entity_ids=False)
-            if states:
-                batch_purge_before = min(
-                    batch_purge_before,
-                    states[0].last_updated + timedelta(hours=1),
-                )
+    timer_start = time.perf_counter()
+    deleted_rows = 0
 
-            query = session.query(Events).order_by(Events.time_fired.asc()).limit(1)
-            events = execute(query, to_native=True)
-            if events:
-                batch_purge_before = min(
-                    batch_purge_before,
-                    events[0].time_fired + timedelta(hours=1),
+    try:
+        while True:
+            with session_scope(session=instance.get_session()) as session:
+                # States reference events, so they are purged first
+                batch_rows = _purge_states_batch(session, purge_before)
+                if not batch_rows:
+                    batch_rows = _purge_events_batch(session, purge_before)
+
+            if not batch_rows:
+                break
+
+            deleted_rows += batch_rows
+            elapsed = time.perf_counter() - timer_start
+
+            if elapsed >= PURGE_TIME_BUDGET:
+                # Return false as we are not done yet, the next pass
+                # continues after the recorder caught up with its queue.
+                # Counting the backlog runs once per pass, after a full
+                # budget of deletes, so it adds little to the purge.
+                _LOGGER.info(
+                    "Purged %s rows in %fs (%d rows/s), %s rows remaining",
+                    deleted_rows,
+                    elapsed,
+                    deleted_rows / elapsed,
+                    _count_rows_to_purge(instance, purge_before),
                 )
-
-            _LOGGER.debug("Purging states and events before %s", batch_purge_before)
-
-            deleted_rows = (
-                session.query(States)
-                .filter(States.last_updated < batch_purge_before)
-                .delete(synchronize_session=False)
-            )
-            _LOGGER.debug("Deleted %s states", deleted_rows)
-
-            deleted_rows = (
-                session.query(Events)
-                .filter(Events.time_fired < batch_purge_before)
-                .delete(synchronize_session=False)
-            )
-            _LOGGER.debug("Deleted %s events", deleted_rows)
-
-            # If states or events purging isn't processing the purge_before yet,
-            # return false, as we are not done yet.
-            if batch_purge_before != purge_before:
-                _LOGGER.debug("Purging hasn't fully completed yet")
                 return False
 
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.info(
+            "Purged %s rows in %fs (%d rows/s), no rows remaining",
+            deleted_rows,
+            elapsed,
+            deleted_rows / elapsed if elapsed else 0,
+        )
+
+        with session_scope(session=instance.get_session()) as session:
             # Recorder runs is small, no need to batch run it
             deleted_rows = (
                 session.query(RecorderRuns)
@@ -72,6 +80,16 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
             )
             _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
+            # Statistics are small as well, short-term ones go with the states
+            deleted_rows = statistics.purge_statistics(
+                session, statistics.PERIOD_5MINUTE, purge_before
+            ) + statistics.purge_statistics(
+                session,
+                statistics.PERIOD_HOUR,
+                dt_util.utcnow() - timedelta(days=instance.statistics_keep_days),
+            )
+            _LOGGER.debug("Deleted %s statistics", deleted_rows)
+
         if repack:
             # Execute sqlite or postgresql vacuum command to free up space on disk
             if instance.engine.driver in ("pysqlite", "postgresql"):
@@ -80,7 +98,10 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
             # Optimize mysql / mariadb tables to free up space on disk
             elif instance.engine.driver in ("mysqldb", "pymysql"):
                 _LOGGER.debug("Optimizing SQL DB to free space")
-                instance.engine.execute("OPTIMIZE TABLE states, events, recorder_runs")
+                instance.engine.execute(
+                    "OPTIMIZE TABLE states, events, recorder_runs, "
+                    "statistics, statistics_short_term"
+                )
 
     except OperationalError as err:
         # Retry when one of the following MySQL errors occurred:
@@ -100,3 +121,56 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
     except SQLAlchemyError as err:
         _LOGGER.warning("Error purging history: %s", err)
     return True
+
+
+def _purge_states_batch(session, purge_before) -> int:
+    """Delete a batch of states older than purge_before."""
+    state_ids = [
+        row.state_id
+        for row in session.query(States.state_id)
+        .filter(States.last_updated < purge_before)
+        .limit(MAX_ROWS_TO_PURGE)
+    ]
+    if not state_ids:
+        return 0
+
+    deleted_rows = (
+        session.query(States)
+        .filter(States.state_id.in_(state_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s states", deleted_rows)
+    return deleted_rows
+
+
+def _purge_events_batch(session, purge_before) -> int:
+    """Delete a batch of events older than purge_before."""
+    event_ids = [
+        row.event_id
+        for row in session.query(Events.event_id)
+        .filter(Events.time_fired < purge_before)
+        .limit(MAX_ROWS_TO_PURGE)
+    ]
+    if not event_ids:
+        return 0
+
+    deleted_rows = (
+        session.query(Events)
+        .filter(Events.event_id.in_(event_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s events", deleted_rows)
+    return deleted_rows
+
+
+def _count_rows_to_purge(instance, purge_before) -> int:
+    """Return the number of states and events left to purge."""
+    with session_scope(session=instance.get_session()) as session:
+        return (
+            session.query(func.count(States.state_id))
+            .filter(States.last_updated < purge_before)
+            .scalar()
+            + session.query(func.count(Events.event_id))
+            .filter(Events.time_fired < purge_before)
+            .scalar()
+        )
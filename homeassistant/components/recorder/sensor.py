@@ -0,0 +1,77 @@
+"""Sensors reporting the load on the recorder write path."""
+from datetime import timedelta
+
+from homeassistant.helpers.entity import Entity
+
+from .const import DATA_INSTANCE
+
+SCAN_INTERVAL = timedelta(seconds=10)
+
+UNIT_EVENTS = "events"
+
+
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Set up the recorder sensors."""
+    if discovery_info is None:
+        return
+
+    instance = hass.data[DATA_INSTANCE]
+    async_add_entities(
+        [RecorderQueueDepthSensor(instance), RecorderBatchSizeSensor(instance)]
+    )
+
+
+class RecorderSensor(Entity):
+    """Base class for recorder sensors."""
+
+    def __init__(self, instance):
+        """Initialize the sensor."""
+        self._instance = instance
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit the value is expressed in."""
+        return UNIT_EVENTS
+
+    @property
+    def icon(self):
+        """Return the icon to use in the frontend."""
+        return "mdi:database"
+
+
+class RecorderQueueDepthSensor(RecorderSensor):
+    """Number of events waiting in the recorder queue."""
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return "Recorder queue depth"
+
+    @property
+    def unique_id(self):
+        """Return a unique ID."""
+        return "recorder_queue_depth"
+
+    @property
+    def state(self):
+        """Return the state of the sensor."""
+        return self._instance.queue.qsize()
+
+
+class RecorderBatchSizeSensor(RecorderSensor):
+    """Number of events written by the last non-empty batched commit."""
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return "Recorder batch size"
+
+    @property
+    def unique_id(self):
+        """Return a unique ID."""
+        return "recorder_batch_size"
+
+    @property
+    def state(self):
+        """Return the state of the sensor."""
+        return self._instance.last_batch_size
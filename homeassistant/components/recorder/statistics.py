@@ -0,0 +1,243 @@
+"""Compile and query long-term statistics of numeric sensors."""
+from datetime import timedelta
+from itertools import groupby
+import logging
+import time
+
+from sqlalchemy import func
+from sqlalchemy.exc import SQLAlchemyError
+
+import homeassistant.util.dt as dt_util
+
+from .models import States, Statistics, StatisticsShortTerm, process_timestamp
+from .util import execute, session_scope
+
+_LOGGER = logging.getLogger(__name__)
+
+STATISTICS_DOMAINS = ("sensor",)
+
+PERIOD_HOUR = "hour"
+PERIOD_5MINUTE = "5minute"
+
+PERIODS = {
+    PERIOD_HOUR: (Statistics, timedelta(hours=1)),
+    PERIOD_5MINUTE: (StatisticsShortTerm, timedelta(minutes=5)),
+}
+
+# Number of state rows fetched from the database at once while compiling
+COMPILE_BATCH_SIZE = 1000
+# Seconds a run may spend on missed periods before handing back to the
+# recorder queue
+COMPILE_TIME_BUDGET = 1
+
+
+def compile_statistics(instance, period: str, start) -> bool:
+    """Compile statistics of numeric sensors up to the period starting at start.
+
+    Periods missed since the last compiled one, e.g. while Home Assistant was
+    stopped, are compiled first so the last values carry forward over them.
+    Once a run has spent COMPILE_TIME_BUDGET seconds on them it returns
+    False, so the recorder can process its queue before the next run
+    continues.
+    """
+    table, duration = PERIODS[period]
+
+    try:
+        with session_scope(session=instance.get_session()) as session:
+            last_start = session.query(func.max(table.start)).scalar()
+    except SQLAlchemyError as err:
+        _LOGGER.warning("Error compiling statistics: %s", err)
+        return True
+
+    if last_start is None:
+        next_start = start
+    else:
+        next_start = process_timestamp(last_start) + duration
+        if next_start > start:
+            _LOGGER.debug("Statistics for %s already compiled", start)
+            return True
+
+    timer_start = time.perf_counter()
+    while next_start <= start:
+        if not _compile_period(instance, period, next_start):
+            return True
+        next_start += duration
+        if (
+            next_start <= start
+            and time.perf_counter() - timer_start >= COMPILE_TIME_BUDGET
+        ):
+            return False
+
+    return True
+
+
+def _compile_period(instance, period: str, start) -> bool:
+    """Compile statistics of numeric sensors for the period starting at start.
+
+    For every entity the time weighted mean, the minimum and maximum of the
+    numeric states and the value at the end of the period are stored. An
+    entity without state changes during the period keeps the last value of
+    the previous period, as long as it still has a numeric state.
+    """
+    table, duration = PERIODS[period]
+    end = start + duration
+    timer_start = time.perf_counter()
+
+    try:
+        with session_scope(session=instance.get_session()) as session:
+            previous = {
+                row.statistic_id: row.last
+                for row in session.query(table.statistic_id, table.last).filter(
+                    table.start == start - duration
+                )
+            }
+
+            query = (
+                session.query(States.entity_id, States.state, States.last_updated)
+                .filter(States.domain.in_(STATISTICS_DOMAINS))
+                .filter(States.last_updated >= start)
+                .filter(States.last_updated < end)
+                .order_by(States.entity_id, States.last_updated)
+                .yield_per(COMPILE_BATCH_SIZE)
+            )
+
+            count = 0
+            for entity_id, rows in groupby(query, lambda row: row.entity_id):
+                stats = _aggregate(previous.pop(entity_id, None), rows, start, end)
+                if stats is not None:
+                    session.add(table(statistic_id=entity_id, start=start, **stats))
+                    count += 1
+
+            # Entities that did not change keep their value over the period,
+            # unless they were removed or are no longer numeric
+            for entity_id, last in previous.items():
+                if last is not None and _has_numeric_state(instance.hass, entity_id):
+                    session.add(
+                        table(
+                            statistic_id=entity_id,
+                            start=start,
+                            mean=last,
+                            min=last,
+                            max=last,
+                            last=last,
+                        )
+                    )
+                    count += 1
+
+    except SQLAlchemyError as err:
+        _LOGGER.warning("Error compiling statistics: %s", err)
+        return False
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug(
+            "Compiled %s statistics of %d entities for %s in %fs",
+            period,
+            count,
+            start,
+            elapsed,
+        )
+    return True
+
+
+def _has_numeric_state(hass, entity_id) -> bool:
+    """Return if the current state of an entity is a number."""
+    state = hass.states.get(entity_id)
+    if state is None:
+        return False
+    try:
+        float(state.state)
+    except ValueError:
+        return False
+    return True
+
+
+def _aggregate(initial, rows, start, end):
+    """Return the aggregates of the state rows of one entity.
+
+    initial is the numeric value at the start of the period or None. Non
+    numeric states are gaps which do not count towards the mean.
+    """
+    value = initial
+    since = start
+    weighted_sum = 0.0
+    duration = 0.0
+    minimum = maximum = initial
+
+    for row in rows:
+        changed = process_timestamp(row.last_updated)
+        if value is not None:
+            elapsed = (changed - since).total_seconds()
+            weighted_sum += value * elapsed
+            duration += elapsed
+
+        try:
+            value = float(row.state)
+        except (TypeError, ValueError):
+            value = None
+        else:
+            minimum = value if minimum is None else min(minimum, value)
+            maximum = value if maximum is None else max(maximum, value)
+        since = changed
+
+    if value is not None:
+        elapsed = (end - since).total_seconds()
+        weighted_sum += value * elapsed
+        duration += elapsed
+
+    if minimum is None:
+        return None
+
+    if duration:
+        mean = weighted_sum / duration
+    else:
+        mean = (minimum + maximum) / 2
+
+    return {"mean": mean, "min": minimum, "max": maximum, "last": value}
+
+
+def purge_statistics(session, period: str, purge_before) -> int:
+    """Delete the statistics of the periods starting before purge_before."""
+    table = PERIODS[period][0]
+    return (
+        session.query(table)
+        .filter(table.start < purge_before)
+        .delete(synchronize_session=False)
+    )
+
+
+def statistics_during_period(
+    hass, start_time, end_time=None, statistic_ids=None, period=PERIOD_HOUR
+):
+    """Return the statistics of the periods between start_time and end_time.
+
+    The result maps each statistic id to its list of statistics sorted by
+    start time.
+    """
+    table = PERIODS[period][0]
+
+    with session_scope(hass=hass) as session:
+        query = session.query(table).filter(table.start >= start_time)
+        if end_time is not None:
+            query = query.filter(table.start < end_time)
+        if statistic_ids is not None:
+            query = query.filter(table.statistic_id.in_(statistic_ids))
+        query = query.order_by(table.statistic_id, table.start)
+
+        return {
+            statistic_id: [row.as_dict() for row in rows]
+            for statistic_id, rows in groupby(
+                execute(query), lambda row: row.statistic_id
+            )
+        }
+
+
+def period_start(period: str, now):
+    """Return the start of the last period that ended before now."""
+    duration = PERIODS[period][1]
+    now = dt_util.as_utc(now).replace(second=0, microsecond=0)
+    if period == PERIOD_HOUR:
+        end = now.replace(minute=0)
+    else:
+        end = now.replace(minute=now.minute - now.minute % 5)
+    return end - duration
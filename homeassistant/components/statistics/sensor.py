@@ -1,7 +1,8 @@
 """Support for statistics for sensor values."""
+from bisect import bisect_left, insort
 from collections import deque
 import logging
-import statistics
+import math
 
 import voluptuous as vol
 
@@ -97,7 +98,10 @@ class StatisticsSensor(Entity):
         self._max_age = max_age
         self._precision = precision
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
+        if self.is_binary:
+            self.states = deque(maxlen=self._sampling_size)
+        else:
+            self.states = SampleWindow(self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
 
         self.count = 0
@@ -153,7 +157,11 @@ class StatisticsSensor(Entity):
             if self.is_binary:
                 self.states.append(new_state.state)
             else:
-                self.states.append(float(new_state.state))
+                value = float(new_state.state)
+                # NaN and infinity would break the sorted and running statistics
+                if not math.isfinite(value):
+                    raise ValueError
+                self.states.append(value)
 
             self.ages.append(new_state.last_updated)
         except ValueError:
@@ -248,24 +256,24 @@ class StatisticsSensor(Entity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count >= 1:  # require only one data point
+                self.mean = round(self.states.mean, self._precision)
+                self.median = round(self.states.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count >= 2:  # require at least two data points
+                self.stdev = round(self.states.stdev, self._precision)
+                self.variance = round(self.states.variance, self._precision)
+            else:
+                _LOGGER.debug("%s: less than two data points", self.entity_id)
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(self.states.total, self._precision)
+                self.min = round(self.states.min, self._precision)
+                self.max = round(self.states.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -352,3 +360,133 @@ class StatisticsSensor(Entity):
         self.async_schedule_update_ha_state(True)
 
         _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+
+
+class SampleWindow:
+    """Sliding window of numeric samples with incremental statistics.
+
+    Samples are added at the end and evicted from the start, either when the
+    window is full or by the caller. The mean and variance are kept with
+    Welford's algorithm, min and max with monotonic queues and the median with
+    a sorted list, so no statistic requires a pass over all samples.
+    """
+
+    def __init__(self, maxlen):
+        """Initialize the window."""
+        self.maxlen = maxlen
+        self._samples = deque()
+        self._sorted = []
+        # (index, value) pairs with increasing / decreasing values
+        self._min_queue = deque()
+        self._max_queue = deque()
+        self._first_index = 0
+        self._next_index = 0
+        self._mean = 0.0
+        self._sum_squares = 0.0
+        self._total = 0.0
+        self._evictions = 0
+
+    def __len__(self):
+        """Return the number of samples."""
+        return len(self._samples)
+
+    def __iter__(self):
+        """Iterate the samples from the oldest to the newest."""
+        return iter(self._samples)
+
+    def __getitem__(self, index):
+        """Return a sample by position."""
+        return self._samples[index]
+
+    def append(self, value):
+        """Add a sample, evicting the oldest one if the window is full."""
+        if len(self._samples) == self.maxlen:
+            self.popleft()
+
+        self._samples.append(value)
+        insort(self._sorted, value)
+
+        index = self._next_index
+        self._next_index += 1
+        while self._min_queue and self._min_queue[-1][1] >= value:
+            self._min_queue.pop()
+        self._min_queue.append((index, value))
+        while self._max_queue and self._max_queue[-1][1] <= value:
+            self._max_queue.pop()
+        self._max_queue.append((index, value))
+
+        count = len(self._samples)
+        delta = value - self._mean
+        self._mean += delta / count
+        self._sum_squares += delta * (value - self._mean)
+        self._total += value
+
+    def popleft(self):
+        """Remove and return the oldest sample."""
+        value = self._samples.popleft()
+        del self._sorted[bisect_left(self._sorted, value)]
+
+        index = self._first_index
+        self._first_index += 1
+        if self._min_queue[0][0] == index:
+            self._min_queue.popleft()
+        if self._max_queue[0][0] == index:
+            self._max_queue.popleft()
+
+        count = len(self._samples)
+        self._evictions += 1
+        if not count:
+            self._mean = self._sum_squares = self._total = 0.0
+        elif self._evictions >= self.maxlen:
+            # Recompute from scratch once per window to bound rounding drift
+            self._evictions = 0
+            self._total = math.fsum(self._samples)
+            self._mean = self._total / count
+            self._sum_squares = math.fsum(
+                (sample - self._mean) ** 2 for sample in self._samples
+            )
+        else:
+            old_mean = self._mean
+            self._mean -= (value - old_mean) / count
+            self._sum_squares -= (value - old_mean) * (value - self._mean)
+            self._total -= value
+
+        return value
+
+    @property
+    def mean(self):
+        """Return the mean of the samples."""
+        return self._mean
+
+    @property
+    def median(self):
+        """Return the median of the samples."""
+        middle, odd = divmod(len(self._sorted), 2)
+        if odd:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    @property
+    def variance(self):
+        """Return the sample variance of the samples."""
+        return max(self._sum_squares, 0.0) / (len(self._samples) - 1)
+
+    @property
+    def stdev(self):
+        """Return the sample standard deviation of the samples."""
+        return math.sqrt(self.variance)
+
+    @property
+    def total(self):
+        """Return the sum of the samples."""
+        return self._total
+
+    @property
+    def min(self):
+        """Return the smallest sample."""
+        return self._min_queue[0][1]
+
+    @property
+    def max(self):
+        """Return the largest sample."""
+        return self._max_queue[0][1]
@@ -17,9 +17,11 @@ from .const import (
     ATTR_STREAMS,
     CONF_DURATION,
     CONF_LOOKBACK,
+    CONF_MAX_BUFFER_SIZE,
+    CONF_MAX_LOOKBACK,
     CONF_STREAM_SOURCE,
+    DEFAULT_MAX_BUFFER_SIZE,
     DOMAIN,
-    MAX_SEGMENTS,
     SERVICE_RECORD,
 )
 from .core import PROVIDERS
@@ -27,7 +29,19 @@ from .hls import async_setup_hls
 
 _LOGGER = logging.getLogger(__name__)
 
-CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_MAX_LOOKBACK, default=0): cv.positive_int,
+                vol.Optional(
+                    CONF_MAX_BUFFER_SIZE, default=DEFAULT_MAX_BUFFER_SIZE
+                ): cv.positive_int,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 STREAM_SERVICE_SCHEMA = vol.Schema({vol.Required(CONF_STREAM_SOURCE): cv.string})
 
@@ -92,6 +106,13 @@ async def async_setup(hass, config):
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = {}
 
+    # Segments kept by the outputs for the lookback of recordings
+    conf = config.get(DOMAIN, {})
+    hass.data[DOMAIN][CONF_MAX_LOOKBACK] = conf.get(CONF_MAX_LOOKBACK, 0)
+    hass.data[DOMAIN][CONF_MAX_BUFFER_SIZE] = (
+        conf.get(CONF_MAX_BUFFER_SIZE, DEFAULT_MAX_BUFFER_SIZE) * 1024 * 1024
+    )
+
     # Setup HLS
     hls_endpoint = async_setup_hls(hass)
     hass.data[DOMAIN][ATTR_ENDPOINTS]["hls"] = hls_endpoint
@@ -234,7 +255,6 @@ async def async_handle_record_service(hass, call):
     # Take advantage of lookback
     hls = stream.outputs.get("hls")
     if lookback > 0 and hls:
-        num_segments = min(int(lookback // hls.target_duration), MAX_SEGMENTS)
         # Wait for latest segment, then add the lookback
         await hls.recv()
-        recorder.prepend(list(hls.get_segment())[-num_segments:])
+        recorder.prepend(hls.lookback(lookback))
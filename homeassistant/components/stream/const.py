@@ -4,6 +4,8 @@ DOMAIN = "stream"
 CONF_STREAM_SOURCE = "stream_source"
 CONF_LOOKBACK = "lookback"
 CONF_DURATION = "duration"
+CONF_MAX_BUFFER_SIZE = "max_buffer_size"
+CONF_MAX_LOOKBACK = "max_lookback"
 
 ATTR_ENDPOINTS = "endpoints"
 ATTR_STREAMS = "streams"
@@ -16,6 +18,7 @@ OUTPUT_FORMATS = ["hls"]
 FORMAT_CONTENT_TYPE = {"hls": "application/vnd.apple.mpegurl"}
 
 MAX_SEGMENTS = 3  # Max number of segments to keep around
+DEFAULT_MAX_BUFFER_SIZE = 256  # Megabytes of segments kept for lookback
 MIN_SEGMENT_DURATION = 1.5  # Each segment is at least this many seconds
 
 PACKETS_TO_WAIT_FOR_AUDIO = 20  # Some streams have an audio stream with no audio
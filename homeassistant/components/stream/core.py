@@ -2,7 +2,8 @@
 import asyncio
 from collections import deque
 import io
-from typing import Any, Callable, List
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
 
 from aiohttp import web
 import attr
@@ -12,7 +13,13 @@ from homeassistant.core import callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.decorator import Registry
 
-from .const import ATTR_STREAMS, DOMAIN, MAX_SEGMENTS
+from .const import (
+    ATTR_STREAMS,
+    CONF_MAX_BUFFER_SIZE,
+    CONF_MAX_LOOKBACK,
+    DOMAIN,
+    MAX_SEGMENTS,
+)
 
 PROVIDERS = Registry()
 
@@ -34,6 +41,98 @@ class Segment:
     sequence: int = attr.ib()
     segment: io.BytesIO = attr.ib()
     duration: float = attr.ib()
+    # Views of the content, shared by every request without copying
+    data: memoryview = attr.ib(init=False)
+    init: Optional[memoryview] = attr.ib(default=None, init=False)
+    m4s: Optional[memoryview] = attr.ib(default=None, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Take a view of the content once the segment is written."""
+        self.data = self.segment.getbuffer()
+
+
+class SegmentBuffer:
+    """Segments of an output, kept for a lookback duration within a size limit.
+
+    The latest segments are always kept, older segments are dropped once the
+    newer ones cover the lookback duration or the size limit is reached.
+    """
+
+    def __init__(
+        self, min_segments: int, lookback: float = 0, max_size: Optional[int] = None
+    ) -> None:
+        """Initialize the buffer."""
+        self.min_segments = min_segments
+        self.lookback = lookback
+        self.max_size = max_size
+        self.size = 0
+        self.duration = 0.0
+        self._segments: Deque[Segment] = deque()
+        self._sequences: Dict[int, Segment] = {}
+
+    def __len__(self) -> int:
+        """Return the number of segments."""
+        return len(self._segments)
+
+    def __iter__(self) -> Iterator[Segment]:
+        """Iterate the segments, oldest first."""
+        return iter(self._segments)
+
+    def append(self, segment: Segment) -> None:
+        """Add the latest segment, dropping the segments no longer needed."""
+        self._segments.append(segment)
+        self._sequences[segment.sequence] = segment
+        self.size += len(segment.data)
+        self.duration += float(segment.duration)
+
+        while len(self._segments) > self.min_segments:
+            oldest = self._segments[0]
+            if self.duration - float(oldest.duration) < self.lookback and (
+                self.max_size is None or self.size <= self.max_size
+            ):
+                break
+            self._segments.popleft()
+            del self._sequences[oldest.sequence]
+            self.size -= len(oldest.data)
+            self.duration -= float(oldest.duration)
+
+    def prepend(self, segments: List[Segment]) -> None:
+        """Add older segments before the buffered ones, without dropping any."""
+        for segment in reversed(segments):
+            if segment.sequence in self._sequences:
+                continue
+            self._segments.appendleft(segment)
+            self._sequences[segment.sequence] = segment
+            self.size += len(segment.data)
+            self.duration += float(segment.duration)
+
+    def get(self, sequence: int) -> Optional[Segment]:
+        """Return the segment with a sequence number."""
+        return self._sequences.get(sequence)
+
+    def latest(self, count: int) -> List[Segment]:
+        """Return the latest segments, oldest first."""
+        segments = list(islice(reversed(self._segments), count))
+        segments.reverse()
+        return segments
+
+    def since(self, duration: float) -> List[Segment]:
+        """Return the latest segments covering a duration, oldest first."""
+        segments = []
+        for segment in reversed(self._segments):
+            if duration <= 0:
+                break
+            segments.append(segment)
+            duration -= float(segment.duration)
+        segments.reverse()
+        return segments
+
+    def clear(self) -> None:
+        """Remove all segments."""
+        self._segments.clear()
+        self._sequences.clear()
+        self.size = 0
+        self.duration = 0.0
 
 
 class StreamOutput:
@@ -46,7 +145,12 @@ class StreamOutput:
         self._stream = stream
         self._cursor = None
         self._event = asyncio.Event()
-        self._segments = deque(maxlen=MAX_SEGMENTS)
+        options = stream.hass.data.get(DOMAIN, {})
+        self._segments = SegmentBuffer(
+            MAX_SEGMENTS,
+            options.get(CONF_MAX_LOOKBACK, 0),
+            options.get(CONF_MAX_BUFFER_SIZE),
+        )
         self._unsub = None
 
     @property
@@ -77,15 +181,15 @@ class StreamOutput:
     @property
     def segments(self) -> List[int]:
         """Return current sequence from segments."""
-        return [s.sequence for s in self._segments]
+        return [s.sequence for s in self._segments.latest(MAX_SEGMENTS)]
 
     @property
     def target_duration(self) -> int:
         """Return the max duration of any given segment in seconds."""
-        segment_length = len(self._segments)
-        if not segment_length:
+        segments = self._segments.latest(MAX_SEGMENTS)
+        if not segments:
             return 0
-        durations = [s.duration for s in self._segments]
+        durations = [s.duration for s in segments]
         return round(max(durations)) or 1
 
     def get_segment(self, sequence: int = None) -> Any:
@@ -97,12 +201,13 @@ class StreamOutput:
         self._unsub = async_call_later(self._stream.hass, self.timeout, self._timeout)
 
         if not sequence:
-            return self._segments
+            return self._segments.latest(MAX_SEGMENTS)
 
-        for segment in self._segments:
-            if segment.sequence == sequence:
-                return segment
-        return None
+        return self._segments.get(sequence)
+
+    def lookback(self, duration: float) -> List[Segment]:
+        """Return the latest segments covering a duration in seconds."""
+        return self._segments.since(duration)
 
     async def recv(self) -> Segment:
         """Wait for and retrieve the latest segment."""
@@ -150,7 +255,7 @@ class StreamOutput:
 
     def cleanup(self):
         """Handle cleanup."""
-        self._segments = deque(maxlen=MAX_SEGMENTS)
+        self._segments.clear()
         self._stream.remove_provider(self)
 
 
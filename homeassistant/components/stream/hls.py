@@ -6,7 +6,7 @@ from aiohttp import web
 from homeassistant.core import callback
 
 from .const import FORMAT_CONTENT_TYPE
-from .core import PROVIDERS, StreamOutput, StreamView
+from .core import PROVIDERS, Segment, StreamOutput, StreamView
 from .fmp4utils import get_init, get_m4s
 
 
@@ -54,7 +54,7 @@ class HlsInitView(StreamView):
         if not segments:
             return web.HTTPNotFound()
         headers = {"Content-Type": "video/mp4"}
-        return web.Response(body=get_init(segments[0].segment), headers=headers)
+        return web.Response(body=segments[0].init, headers=headers)
 
 
 class HlsSegmentView(StreamView):
@@ -71,10 +71,7 @@ class HlsSegmentView(StreamView):
         if not segment:
             return web.HTTPNotFound()
         headers = {"Content-Type": "video/iso.segment"}
-        return web.Response(
-            body=get_m4s(segment.segment, int(sequence)),
-            headers=headers,
-        )
+        return web.Response(body=segment.m4s, headers=headers)
 
 
 class M3U8Renderer:
@@ -153,3 +150,11 @@ class HlsStreamOutput(StreamOutput):
             "avoid_negative_ts": "make_non_negative",
             "fragment_index": str(sequence),
         }
+
+    @callback
+    def put(self, segment: Segment) -> None:
+        """Store output, sliced once for all the requests of the segment."""
+        if segment is not None:
+            segment.init = get_init(segment.data)
+            segment.m4s = get_m4s(segment.data, segment.sequence)
+        super().put(segment)
@@ -1,4 +1,5 @@
 """Provide functionality to record stream."""
+import math
 import os
 import threading
 from typing import List
@@ -7,7 +8,8 @@ import av
 
 from homeassistant.core import callback
 
-from .core import PROVIDERS, Segment, StreamOutput
+from .const import MAX_SEGMENTS
+from .core import PROVIDERS, Segment, SegmentBuffer, StreamOutput
 
 
 @callback
@@ -63,7 +65,8 @@ class RecorderOutput(StreamOutput):
         """Initialize recorder output."""
         super().__init__(stream, timeout)
         self.video_path = None
-        self._segments = []
+        # A recording keeps all its segments until it is written
+        self._segments = SegmentBuffer(MAX_SEGMENTS, lookback=math.inf)
 
     @property
     def name(self) -> str:
@@ -85,11 +88,14 @@ class RecorderOutput(StreamOutput):
         """Return desired video codecs."""
         return {"hevc", "h264"}
 
+    @property
+    def segments(self) -> List[int]:
+        """Return the sequences of the recorded segments."""
+        return [s.sequence for s in self._segments]
+
     def prepend(self, segments: List[Segment]) -> None:
         """Prepend segments to existing list."""
-        own_segments = self.segments
-        segments = [s for s in segments if s.sequence not in own_segments]
-        self._segments = segments + self._segments
+        self._segments.prepend(segments)
 
     @callback
     def _timeout(self, _now=None):
@@ -102,9 +108,9 @@ class RecorderOutput(StreamOutput):
         thread = threading.Thread(
             name="recorder_save_worker",
             target=recorder_save_worker,
-            args=(self.video_path, self._segments, self.format),
+            args=(self.video_path, list(self._segments), self.format),
         )
         thread.start()
 
-        self._segments = []
+        self._segments.clear()
         self._stream.remove_provider(self)
@@ -50,6 +50,7 @@ def async_register_command(
 
 async def async_setup(hass, config):
     """Initialize the websocket API."""
+    hass.data[const.DATA_EVENT_MESSAGE_CACHE] = messages.EventMessageCache()
     hass.http.register_view(http.WebsocketAPIView)
     commands.async_register_commands(hass, async_register_command)
     return True
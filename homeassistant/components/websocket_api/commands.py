@@ -6,7 +6,12 @@ import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
 from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
-from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
+    MATCH_ALL,
+)
 from homeassistant.core import DOMAIN as HASS_DOMAIN, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
@@ -42,6 +47,7 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
+    async_reg(hass, handle_event_cache_stats)
 
 
 def pong_message(iden):
@@ -54,6 +60,7 @@ def pong_message(iden):
     {
         vol.Required("type"): "subscribe_events",
         vol.Optional("event_type", default=MATCH_ALL): str,
+        vol.Optional("entity_ids"): cv.entity_ids,
     }
 )
 def handle_subscribe_events(hass, connection, msg):
@@ -67,6 +74,8 @@ def handle_subscribe_events(hass, connection, msg):
     if event_type not in SUBSCRIBE_WHITELIST and not connection.user.is_admin:
         raise Unauthorized
 
+    event_cache = hass.data[const.DATA_EVENT_MESSAGE_CACHE]
+
     if event_type == EVENT_STATE_CHANGED:
 
         @callback
@@ -77,7 +86,7 @@ def handle_subscribe_events(hass, connection, msg):
             ):
                 return
 
-            connection.send_message(messages.event_message(msg["id"], event))
+            connection.send_message(event_cache.event_message(msg["id"], event))
 
     else:
 
@@ -87,11 +96,17 @@ def handle_subscribe_events(hass, connection, msg):
             if event.event_type == EVENT_TIME_CHANGED:
                 return
 
-            connection.send_message(messages.event_message(msg["id"], event.as_dict()))
+            connection.send_message(event_cache.event_message(msg["id"], event))
 
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
-    )
+    if "entity_ids" in msg:
+        # Only events about these entities reach the subscription
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen_indexed(
+            event_type, ATTR_ENTITY_ID, msg["entity_ids"], forward_events
+        )
+    else:
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            event_type, forward_events
+        )
 
     connection.send_message(messages.result_message(msg["id"]))
 
@@ -393,3 +408,12 @@ async def handle_test_condition(hass, connection, msg):
     connection.send_result(
         msg["id"], {"result": check_condition(hass, msg.get("variables"))}
     )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "event_cache/stats"})
+@decorators.require_admin
+def handle_event_cache_stats(hass, connection, msg):
+    """Handle the command returning the event serialization counters."""
+    event_cache = hass.data[const.DATA_EVENT_MESSAGE_CACHE]
+    connection.send_result(msg["id"], event_cache.as_dict())
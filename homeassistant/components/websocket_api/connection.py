@@ -15,11 +15,14 @@ from . import const, messages
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
-    def __init__(self, logger, hass, send_message, user, refresh_token):
+    def __init__(
+        self, logger, hass, send_message, user, refresh_token, wait_writable=None
+    ):
         """Initialize an active connection."""
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        self._wait_writable = wait_writable
         self.user = user
         if refresh_token:
             self.refresh_token_id = refresh_token.id
@@ -48,6 +51,15 @@ class ActiveConnection:
         )
         self.send_message(content)
 
+    async def async_wait_writable(self):
+        """Wait until the client has read enough messages to be sent more.
+
+        Lets handlers sending many messages keep below the pending messages
+        limit, at which the connection is closed.
+        """
+        if self._wait_writable is not None:
+            await self._wait_writable()
+
     @callback
     def send_error(self, msg_id: int, code: str, message: str) -> None:
         """Send a error message."""
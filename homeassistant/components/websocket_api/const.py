@@ -43,5 +43,9 @@ SIGNAL_WEBSOCKET_DISCONNECTED = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS = f"{DOMAIN}.connections"
+DATA_EVENT_MESSAGE_CACHE = f"{DOMAIN}.event_message_cache"
+
+# Number of recently fired events whose JSON is kept to share between connections
+EVENT_MESSAGE_CACHE_SIZE = 128
 
 JSON_DUMP = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
@@ -56,6 +56,9 @@ class WebSocketHandler:
         self.request = request
         self.wsock: Optional[web.WebSocketResponse] = None
         self._to_write: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_MSG)
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._closed = False
         self._handle_task = None
         self._writer_task = None
         self._logger = logging.getLogger("{}.connection.{}".format(__name__, id(self)))
@@ -70,6 +73,9 @@ class WebSocketHandler:
                 if message is None:
                     break
 
+                if self._to_write.qsize() < PENDING_MSG_PEAK:
+                    self._writable.set()
+
                 self._logger.debug("Sending %s", message)
 
                 if isinstance(message, str):
@@ -122,11 +128,21 @@ class WebSocketHandler:
                 self._peak_checker_unsub = None
             return
 
+        if not self._closed:
+            self._writable.clear()
+
         if self._peak_checker_unsub is None:
             self._peak_checker_unsub = async_call_later(
                 self.hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    async def _async_wait_writable(self):
+        """Wait until the client has read enough messages to be sent more.
+
+        Returns right away once the connection is closed.
+        """
+        await self._writable.wait()
+
     @callback
     def _check_write_peak(self, _):
         """Check that we are no longer above the write peak."""
@@ -169,7 +185,13 @@ class WebSocketHandler:
         # event we do not want to block for websocket responses
         self._writer_task = asyncio.create_task(self._writer())
 
-        auth = AuthPhase(self._logger, self.hass, self._send_message, request)
+        auth = AuthPhase(
+            self._logger,
+            self.hass,
+            self._send_message,
+            request,
+            self._async_wait_writable,
+        )
         connection = None
         disconnect_warn = None
 
@@ -238,6 +260,10 @@ class WebSocketHandler:
         finally:
             unsub_stop()
 
+            # Wake up the senders waiting for the client to read
+            self._closed = True
+            self._writable.set()
+
             if connection is not None:
                 connection.async_close()
 
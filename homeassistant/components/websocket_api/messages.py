@@ -1,4 +1,6 @@
 """Message templates for websocket commands."""
+from collections import OrderedDict
+from time import perf_counter
 
 import voluptuous as vol
 
@@ -36,3 +38,60 @@ def error_message(iden, code, message):
 def event_message(iden, event):
     """Return an event message."""
     return {"id": iden, "type": "event", "event": event}
+
+
+class EventMessageCache:
+    """Serialize fired events once and share the JSON between subscriptions.
+
+    Every connection subscribed to an event type receives the same Event
+    object. The event is dumped to JSON the first time it is seen and only the
+    per-subscription envelope is built for the other connections.
+    """
+
+    def __init__(self, maxsize=const.EVENT_MESSAGE_CACHE_SIZE):
+        """Initialize the cache."""
+        self._maxsize = maxsize
+        # Keyed by id(event). Holding on to the event keeps the id unique.
+        self._cache = OrderedDict()
+        self.serializations = 0
+        self.hits = 0
+        self.serialize_time = 0.0
+
+    @property
+    def time_saved(self):
+        """Return the estimated seconds of serialization avoided."""
+        if not self.serializations:
+            return 0.0
+        return self.hits * self.serialize_time / self.serializations
+
+    def as_dict(self):
+        """Return the counters of the cache."""
+        return {
+            "serializations": self.serializations,
+            "hits": self.hits,
+            "serialize_time": round(self.serialize_time, 6),
+            "time_saved": round(self.time_saved, 6),
+        }
+
+    def event_message(self, iden, event):
+        """Return an event message with a shared, pre-serialized payload."""
+        cached = self._cache.get(id(event))
+
+        if cached is not None:
+            self.hits += 1
+            payload = cached[1]
+        else:
+            start = perf_counter()
+            try:
+                payload = const.JSON_DUMP(event)
+            except (ValueError, TypeError):
+                # Let the writer report the unserializable data
+                return event_message(iden, event)
+            self.serialize_time += perf_counter() - start
+            self.serializations += 1
+
+            self._cache[id(event)] = (event, payload)
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+        return f'{{"id": {iden}, "type": "event", "event": {payload}}}'
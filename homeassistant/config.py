@@ -5,6 +5,7 @@ import logging
 import os
 import re
 import shutil
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import Any, Callable, Dict, Optional, Sequence, Set, Tuple, Union
 
@@ -28,6 +29,7 @@ from homeassistant.const import (
     CONF_CUSTOMIZE_DOMAIN,
     CONF_CUSTOMIZE_GLOB,
     CONF_ELEVATION,
+    CONF_EXECUTOR_LANES,
     CONF_EXTERNAL_URL,
     CONF_ID,
     CONF_INTERNAL_URL,
@@ -50,6 +52,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_per_platform, extract_domain_configs
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
+from homeassistant.helpers.storage import Store
 from homeassistant.loader import Integration, IntegrationNotFound
 from homeassistant.requirements import (
     RequirementsNotFound,
@@ -57,7 +60,7 @@ from homeassistant.requirements import (
 )
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
-from homeassistant.util.yaml import SECRET_YAML, load_yaml
+from homeassistant.util.yaml import SECRET_YAML, ConfigSnapshot, load_yaml
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,6 +71,10 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
+DATA_CONFIG_SNAPSHOT = "config_snapshot"
+CONFIG_SNAPSHOT_STORAGE_KEY = "core.config_snapshot"
+CONFIG_SNAPSHOT_STORAGE_VERSION = 1
+CONFIG_SNAPSHOT_SAVE_DELAY = 10
 
 GROUP_CONFIG_PATH = "groups.yaml"
 AUTOMATION_CONFIG_PATH = "automations.yaml"
@@ -192,6 +199,7 @@ CORE_CONFIG_SCHEMA = CUSTOMIZE_CONFIG_SCHEMA.extend(
             cv.ensure_list, [vol.IsDir()]  # pylint: disable=no-value-for-parameter
         ),
         vol.Optional(CONF_ALLOWLIST_EXTERNAL_URLS): vol.All(cv.ensure_list, [cv.url]),
+        vol.Optional(CONF_EXECUTOR_LANES): {cv.slug: cv.positive_int},
         vol.Optional(CONF_PACKAGES, default={}): PACKAGES_CONFIG_SCHEMA,
         vol.Optional(CONF_AUTH_PROVIDERS): vol.All(
             cv.ensure_list,
@@ -308,15 +316,60 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> Dict:
     This function allow a component inside the asyncio loop to reload its
     configuration by itself. Include package merge.
     """
+    if DATA_CONFIG_SNAPSHOT not in hass.data:
+        store = Store(
+            hass,
+            CONFIG_SNAPSHOT_STORAGE_VERSION,
+            CONFIG_SNAPSHOT_STORAGE_KEY,
+            private=True,
+        )
+        try:
+            data = await store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Ignoring invalid config snapshot: %s", err)
+            data = None
+        hass.data.setdefault(DATA_CONFIG_SNAPSHOT, (store, ConfigSnapshot(data)))
+    store, snapshot = hass.data[DATA_CONFIG_SNAPSHOT]
+
     # Not using async_add_executor_job because this is an internal method.
     config = await hass.loop.run_in_executor(
-        None, load_yaml_config_file, hass.config.path(YAML_CONFIG_FILE)
+        None,
+        load_yaml_config_snapshot,
+        snapshot,
+        hass.config.path(YAML_CONFIG_FILE),
     )
+    if snapshot.dirty:
+        # Written after startup instead of delaying it
+        store.async_delay_save(snapshot.as_dict, CONFIG_SNAPSHOT_SAVE_DELAY)
+
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
     return config
 
 
+def load_yaml_config_snapshot(
+    snapshot: ConfigSnapshot, config_path: str
+) -> Dict[Any, Any]:
+    """Parse a YAML configuration file, reusing the snapshot of unchanged files.
+
+    Raises FileNotFoundError or HomeAssistantError.
+
+    This method needs to run in an executor.
+    """
+    start = timer()
+    with snapshot.session() as session:
+        config = load_yaml_config_file(config_path)
+
+    _LOGGER.debug(
+        "Loaded %s in %.3fs, %d files parsed and %d taken from the snapshot",
+        os.path.basename(config_path),
+        timer() - start,
+        session.misses,
+        session.hits,
+    )
+    return config
+
+
 def load_yaml_config_file(config_path: str) -> Dict[Any, Any]:
     """Parse a YAML configuration file.
 
@@ -501,6 +554,7 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: Dict) -> Non
         (CONF_INTERNAL_URL, "internal_url"),
         (CONF_EXTERNAL_URL, "external_url"),
         (CONF_MEDIA_DIRS, "media_dirs"),
+        (CONF_EXECUTOR_LANES, "executor_lanes"),
     ):
         if key in config:
             setattr(hac, attr, config[key])
@@ -5,6 +5,8 @@ Home Assistant is a Home Automation framework for observing the state
 of entities and react to changes.
 """
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import datetime
 import enum
 import functools
@@ -72,6 +74,8 @@ from homeassistant.exceptions import (
 from homeassistant.util import location, network
 from homeassistant.util.async_ import fire_coroutine_threadsafe, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import LaneExecutor
+from homeassistant.util.process import create_process_executor
 from homeassistant.util.thread import fix_threading_exception_logging
 from homeassistant.util.timeout import TimeoutManager
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
@@ -113,6 +117,19 @@ SOURCE_YAML = "yaml"
 # How long to wait until things that run on startup have to finish.
 TIMEOUT_EVENT_START = 15
 
+# Kinds of jobs passed to the job wrapper
+JOB_EXECUTOR = "executor"
+JOB_LISTENER = "listener"
+JOB_TASK = "task"
+
+# Executor lanes, pools of threads kept apart from the default executor
+EXECUTOR_DATABASE = "database"
+EXECUTOR_POLLING = "polling"
+DEFAULT_EXECUTOR_LANE_WORKERS = 4
+EXECUTOR_LANE_WORKERS = {EXECUTOR_DATABASE: 4, EXECUTOR_POLLING: 16}
+# Share of the threads of a lane a single key, like an integration, can use
+EXECUTOR_LANE_KEY_SHARE = 4
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -189,6 +206,15 @@ class HomeAssistant:
         self._stopped: Optional[asyncio.Event] = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        # Worker processes for CPU bound jobs, started by the first job
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+        # Set once stopping shut down the worker processes for good
+        self._process_jobs_closed = False
+        # Thread pools for classes of executor jobs, started by their first job
+        self._executor_lanes: Dict[str, LaneExecutor] = {}
+        # Wraps event listeners, executor jobs and tasks with the kind of the
+        # job, used to profile them
+        self.job_wrapper: Optional[Callable[[str, Any], Any]] = None
 
     @property
     def is_running(self) -> bool:
@@ -335,6 +361,9 @@ class HomeAssistant:
 
         target: target to call.
         """
+        if self.job_wrapper is not None:
+            target = self.job_wrapper(JOB_TASK, target)
+
         task: asyncio.tasks.Task = self.loop.create_task(target)
 
         if self._track_task:
@@ -347,6 +376,9 @@ class HomeAssistant:
         self, target: Callable[..., T], *args: Any
     ) -> Awaitable[T]:
         """Add an executor job from within the event loop."""
+        if self.job_wrapper is not None:
+            target = self.job_wrapper(JOB_EXECUTOR, target)
+
         task = self.loop.run_in_executor(None, target, *args)
 
         # If a task is scheduled
@@ -355,6 +387,93 @@ class HomeAssistant:
 
         return task
 
+    @callback
+    def async_add_lane_executor_job(
+        self,
+        lane: str,
+        target: Callable[..., T],
+        *args: Any,
+        key: Optional[str] = None,
+    ) -> Awaitable[T]:
+        """Add an executor job to a lane from within the event loop.
+
+        A lane is a pool of threads for one class of jobs, like polling devices
+        or querying the database, so jobs that hang can't take the threads of
+        the default executor. Jobs passing a key, like the integration they
+        belong to, can only use a share of the threads of the lane.
+        """
+        executor = self._executor_lanes.get(lane)
+        if executor is None:
+            max_workers = self.config.executor_lanes.get(
+                lane, EXECUTOR_LANE_WORKERS.get(lane, DEFAULT_EXECUTOR_LANE_WORKERS)
+            )
+            executor = self._executor_lanes[lane] = LaneExecutor(
+                lane,
+                max_workers,
+                key_limit=max(1, max_workers // EXECUTOR_LANE_KEY_SHARE),
+            )
+
+        if self.job_wrapper is not None:
+            target = self.job_wrapper(JOB_EXECUTOR, target)
+
+        task = asyncio.wrap_future(
+            executor.submit_keyed(key, target, *args), loop=self.loop
+        )
+
+        # If a task is scheduled
+        if self._track_task:
+            self._pending_tasks.append(task)
+
+        return task
+
+    @callback
+    def async_executor_lane_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the queue depth and wait time of the executor lanes."""
+        return {
+            lane: executor.stats() for lane, executor in self._executor_lanes.items()
+        }
+
+    @callback
+    def async_add_process_job(
+        self, target: Callable[..., T], *args: Any
+    ) -> Awaitable[T]:
+        """Add a CPU bound job to run in a worker process from within the event loop.
+
+        The target and the arguments are pickled to be sent to the worker, so
+        the target has to be a function defined at the top level of a module
+        and the arguments, like the result, have to be picklable. The job does
+        not share any state with Home Assistant.
+        """
+        check_target = target
+        while isinstance(check_target, functools.partial):
+            check_target = check_target.func
+
+        if asyncio.iscoroutinefunction(check_target) or is_callback(check_target):
+            raise ValueError("Process jobs can't run in the event loop")
+        if "<" in getattr(check_target, "__qualname__", ""):
+            raise ValueError(
+                f"Process job {check_target} has to be defined at module level"
+            )
+
+        if self._process_jobs_closed:
+            raise RuntimeError("Process jobs can't be added after stopping")
+        if self._process_executor is None:
+            self._process_executor = create_process_executor()
+        try:
+            task = self.loop.run_in_executor(self._process_executor, target, *args)
+        except BrokenProcessPool:
+            # A worker died abruptly, the pool refuses all jobs from then on
+            _LOGGER.warning("Worker process pool is broken, starting a new one")
+            self._process_executor.shutdown(wait=False)
+            self._process_executor = create_process_executor()
+            task = self.loop.run_in_executor(self._process_executor, target, *args)
+
+        # If a task is scheduled
+        if self._track_task:
+            self._pending_tasks.append(task)
+
+        return task
+
     @callback
     def async_track_tasks(self) -> None:
         """Track tasks so you can wait for all tasks to be done."""
@@ -492,6 +611,17 @@ class HomeAssistant:
                 "Timed out waiting for shutdown stage 3 to complete, the shutdown will continue"
             )
 
+        # Jobs still running in a lane, like a poller stuck in a request,
+        # don't hold up the shutdown
+        for executor in self._executor_lanes.values():
+            executor.shutdown(wait=False)
+
+        # Process jobs submitted after this point are refused, the ones still
+        # running don't hold up the shutdown either
+        self._process_jobs_closed = True
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=False)
+
         # Python 3.9+ and backported in runner.py
         await self.loop.shutdown_default_executor()  # type: ignore
 
@@ -587,6 +717,9 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: Dict[str, List[Callable]] = {}
+        # event_type -> data key -> value of the data key -> listeners
+        self._indexed_listeners: Dict[str, Dict[str, Dict[Any, List[Callable]]]] = {}
+        self._indexed_listener_count: Dict[str, int] = {}
         self._hass = hass
 
     @callback
@@ -595,7 +728,23 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(self._listeners[key]) for key in self._listeners}
+        listeners = {key: len(self._listeners[key]) for key in self._listeners}
+        for key, count in self._indexed_listener_count.items():
+            listeners[key] = listeners.get(key, 0) + count
+        return listeners
+
+    @callback
+    def async_has_listeners(self, event_type: str) -> bool:
+        """Return if an event type has listeners of its own.
+
+        Listeners to all events are not counted.
+
+        This method must be run in the event loop.
+        """
+        return bool(
+            self._listeners.get(event_type)
+            or self._indexed_listener_count.get(event_type)
+        )
 
     @property
     def listeners(self) -> Dict[str, int]:
@@ -628,11 +777,26 @@ class EventBus:
         """
         listeners = self._listeners.get(event_type, [])
 
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
+        # EVENT_HOMEASSISTANT_CLOSE and EVENT_TIME_CHANGED should go only to
+        # their own listeners
+        match_all = event_type not in (EVENT_HOMEASSISTANT_CLOSE, EVENT_TIME_CHANGED)
         match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
+        if match_all_listeners is not None and match_all:
             listeners = match_all_listeners + listeners
 
+        if self._indexed_listeners and event_data:
+            for indexed_type in (event_type, MATCH_ALL) if match_all else (event_type,):
+                for data_key, value_listeners in self._indexed_listeners.get(
+                    indexed_type, {}
+                ).items():
+                    try:
+                        matched = value_listeners.get(event_data.get(data_key))
+                    except TypeError:
+                        # Unhashable value, it can't be indexed
+                        continue
+                    if matched is not None:
+                        listeners = listeners + matched
+
         event = Event(event_type, event_data, origin, None, context)
 
         if event_type != EVENT_TIME_CHANGED:
@@ -641,7 +805,10 @@ class EventBus:
         if not listeners:
             return
 
+        wrapper = self._hass.job_wrapper
         for func in listeners:
+            if wrapper is not None:
+                func = wrapper(JOB_LISTENER, func)
             self._hass.async_add_job(func, event)
 
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
@@ -680,6 +847,67 @@ class EventBus:
 
         return remove_listener
 
+    def listen_indexed(
+        self,
+        event_type: str,
+        data_key: str,
+        values: Iterable[Any],
+        listener: Callable,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a type where data_key holds one of values.
+
+        Returns function to unsubscribe the listener.
+        """
+        async_remove_listener = run_callback_threadsafe(
+            self._hass.loop,
+            self.async_listen_indexed,
+            event_type,
+            data_key,
+            values,
+            listener,
+        ).result()
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            run_callback_threadsafe(self._hass.loop, async_remove_listener).result()
+
+        return remove_listener
+
+    @callback
+    def async_listen_indexed(
+        self,
+        event_type: str,
+        data_key: str,
+        values: Iterable[Any],
+        listener: Callable,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a type where data_key holds one of values.
+
+        The listener is looked up by the value of data_key in the event data
+        when the event is fired, so it is not called for other events of the
+        same type. Useful to listen for the state changes of a few entities
+        with data_key ``entity_id``.
+
+        This method must be run in the event loop.
+        """
+        values = set(values)
+        value_listeners = self._indexed_listeners.setdefault(event_type, {}).setdefault(
+            data_key, {}
+        )
+
+        for value in values:
+            value_listeners.setdefault(value, []).append(listener)
+
+        self._indexed_listener_count[event_type] = (
+            self._indexed_listener_count.get(event_type, 0) + 1
+        )
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_indexed_listener(event_type, data_key, values, listener)
+
+        return remove_listener
+
     def listen_once(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen once for event of a specific type.
 
@@ -743,6 +971,35 @@ class EventBus:
             # ValueError if listener did not exist within event_type
             _LOGGER.warning("Unable to remove unknown listener %s", listener)
 
+    @callback
+    def _async_remove_indexed_listener(
+        self, event_type: str, data_key: str, values: Set[Any], listener: Callable
+    ) -> None:
+        """Remove a listener indexed by the values of a data key.
+
+        This method must be run in the event loop.
+        """
+        try:
+            indexed_listeners = self._indexed_listeners[event_type]
+            value_listeners = indexed_listeners[data_key]
+            for value in values:
+                value_listeners[value].remove(listener)
+                if not value_listeners[value]:
+                    del value_listeners[value]
+        except (KeyError, ValueError):
+            # The listener was already removed
+            _LOGGER.warning("Unable to remove unknown listener %s", listener)
+            return
+
+        if not value_listeners:
+            del indexed_listeners[data_key]
+        if not indexed_listeners:
+            del self._indexed_listeners[event_type]
+
+        self._indexed_listener_count[event_type] -= 1
+        if not self._indexed_listener_count[event_type]:
+            del self._indexed_listener_count[event_type]
+
 
 class State:
     """Object to represent a state within the state machine.
@@ -1393,6 +1650,9 @@ class Config:
         # Dictionary of Media folders that integrations may use
         self.media_dirs: Dict[str, str] = {}
 
+        # Number of threads of the executor lanes
+        self.executor_lanes: Dict[str, int] = {}
+
         # If Home Assistant is running in safe mode
         self.safe_mode: bool = False
 
@@ -1623,7 +1883,12 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Fire next time event."""
         now = dt_util.utcnow()
 
-        hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: now}, context=timer_context)
+        # Time based helpers schedule themselves on the event loop, only
+        # dispatch the event if something listens for it explicitly.
+        if hass.bus.async_has_listeners(EVENT_TIME_CHANGED):
+            hass.bus.async_fire(
+                EVENT_TIME_CHANGED, {ATTR_NOW: now}, context=timer_context
+            )
 
         # If we are more than a second late, a tick was missed
         late = monotonic() - target
@@ -34,6 +34,7 @@ CONNECTION_ZIGBEE = "zigbee"
 
 IDX_CONNECTIONS = "connections"
 IDX_IDENTIFIERS = "identifiers"
+IDX_AREAS = "areas"
 REGISTERED_DEVICE = "registered"
 DELETED_DEVICE = "deleted"
 
@@ -187,8 +188,12 @@ class DeviceRegistry:
     def _clear_index(self):
         """Clear the index."""
         self._devices_index = {
-            REGISTERED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
-            DELETED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
+            REGISTERED_DEVICE: {
+                IDX_IDENTIFIERS: {},
+                IDX_CONNECTIONS: {},
+                IDX_AREAS: {},
+            },
+            DELETED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}, IDX_AREAS: {}},
         }
 
     def _rebuild_index(self):
@@ -531,7 +536,9 @@ async def async_get_registry(hass: HomeAssistantType) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> List[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    # pylint: disable=protected-access
+    areas_index = registry._devices_index[REGISTERED_DEVICE][IDX_AREAS]
+    return [registry.devices[device_id] for device_id in areas_index.get(area_id, {})]
 
 
 @callback
@@ -636,6 +643,10 @@ def _add_device_to_index(
         devices_index[IDX_IDENTIFIERS][identifier] = device.id
     for connection in device.connections:
         devices_index[IDX_CONNECTIONS][connection] = device.id
+    area_id = getattr(device, "area_id", None)
+    if area_id is not None:
+        # Dicts are used as insertion ordered sets of device ids
+        devices_index[IDX_AREAS].setdefault(area_id, {})[device.id] = None
 
 
 def _remove_device_from_index(
@@ -648,3 +659,9 @@ def _remove_device_from_index(
     for connection in device.connections:
         if connection in devices_index[IDX_CONNECTIONS]:
             del devices_index[IDX_CONNECTIONS][connection]
+    area_id = getattr(device, "area_id", None)
+    area_devices = devices_index[IDX_AREAS].get(area_id)
+    if area_devices is not None:
+        area_devices.pop(device.id, None)
+        if not area_devices:
+            del devices_index[IDX_AREAS][area_id]
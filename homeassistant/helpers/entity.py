@@ -24,7 +24,13 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    EXECUTOR_POLLING,
+    Context,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entity_registry import RegistryEntry
@@ -468,7 +474,12 @@ class Entity(ABC):
             if hasattr(self, "async_update"):
                 await self.async_update()  # type: ignore
             elif hasattr(self, "update"):
-                await self.hass.async_add_executor_job(self.update)  # type: ignore
+                # Polling runs in its own lane, limited per integration
+                await self.hass.async_add_lane_executor_job(
+                    EXECUTOR_POLLING,
+                    self.update,  # type: ignore
+                    key=self.platform.platform_name if self.platform else None,
+                )
         finally:
             self._update_staged = False
             if warning:
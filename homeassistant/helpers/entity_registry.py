@@ -125,6 +125,8 @@ class EntityRegistry:
         self.hass = hass
         self.entities: Dict[str, RegistryEntry]
         self._index: Dict[Tuple[str, str, str], str] = {}
+        # Entity ids per device id, dicts are used as insertion ordered sets
+        self._device_index: Dict[str, Dict[str, None]] = {}
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_removed
@@ -490,6 +492,8 @@ class EntityRegistry:
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        if entry.device_id is not None:
+            self._device_index.setdefault(entry.device_id, {})[entry.entity_id] = None
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
@@ -497,9 +501,16 @@ class EntityRegistry:
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        if entry.device_id is None:
+            return
+        device_entities = self._device_index[entry.device_id]
+        device_entities.pop(entry.entity_id, None)
+        if not device_entities:
+            del self._device_index[entry.device_id]
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._device_index = {}
         for entry in self.entities.values():
             self._add_index(entry)
 
@@ -517,9 +528,9 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry for entry in registry.entities.values() if entry.device_id == device_id
-    ]
+    # pylint: disable=protected-access
+    device_entities = registry._device_index.get(device_id, {})
+    return [registry.entities[entity_id] for entity_id in device_entities]
 
 
 @callback
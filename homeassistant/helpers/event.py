@@ -22,10 +22,8 @@ import attr
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
-    ATTR_NOW,
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
@@ -1097,24 +1095,23 @@ def async_track_utc_time_change(
     second: Optional[Any] = None,
     local: bool = False,
 ) -> CALLBACK_TYPE:
-    """Add a listener that will fire if time matches a pattern."""
-    # We do not have to wrap the function with time pattern matching logic
-    # if no pattern given
-    if all(val is None for val in (hour, minute, second)):
-
-        @callback
-        def time_change_listener(event: Event) -> None:
-            """Fire every time event that comes in."""
-            hass.async_run_job(action, event.data[ATTR_NOW])
-
-        return hass.bus.async_listen(EVENT_TIME_CHANGED, time_change_listener)
+    """Add a listener that will fire if time matches a pattern.
 
+    Without a pattern the listener fires every second. It is scheduled on the
+    event loop like any pattern instead of listening to the time_changed
+    event, so the timer does not have to dispatch that event every second.
+    """
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
 
     next_time: datetime = dt_util.utcnow()
 
+    # Without a pattern the first run is at the next second, like the next
+    # time_changed event, instead of right away for the current second.
+    if all(val is None for val in (hour, minute, second)):
+        next_time += timedelta(seconds=1)
+
     def calculate_next(now: datetime) -> None:
         """Calculate and set the next time the trigger should fire."""
         nonlocal next_time
@@ -1,5 +1,7 @@
 """Template helper methods for rendering strings with Home Assistant data."""
+import asyncio
 import base64
+from collections import OrderedDict
 import collections.abc
 from datetime import datetime, timedelta
 from functools import wraps
@@ -9,9 +11,9 @@ import math
 from operator import attrgetter
 import random
 import re
-from typing import Any, Iterable, List, Optional, Union
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Union
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import contextfilter, contextfunction
@@ -59,6 +61,11 @@ _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunctio
 
 _GROUP_DOMAIN_PREFIX = "group."
 
+# Maximum number of compiled templates shared by all environments
+COMPILED_TEMPLATE_CACHE_SIZE = 2048
+# Number of executor jobs compiling the templates of the config at startup
+PRECOMPILE_JOBS = 4
+
 
 @bind_hass
 def attach(hass: HomeAssistantType, obj: Any) -> None:
@@ -230,12 +237,7 @@ class Template:
 
     @property
     def _env(self):
-        if self.hass is None:
-            return _NO_HASS_ENV
-        ret = self.hass.data.get(_ENVIRONMENT)
-        if ret is None:
-            ret = self.hass.data[_ENVIRONMENT] = TemplateEnvironment(self.hass)
-        return ret
+        return _get_environment(self.hass)
 
     def ensure_valid(self):
         """Return if template is valid."""
@@ -1042,7 +1044,6 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__()
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1149,12 +1150,127 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
+        cached = _COMPILED_CACHE.get(source)
 
         if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = super().compile(source)
+            _COMPILED_CACHE.set(source, cached)
 
         return cached
 
 
+class CompiledTemplateCache:
+    """Bounded LRU of compiled template code keyed by the template source.
+
+    The compiled code does not depend on the environment that compiled it,
+    so identical templates share it no matter which Template instance or
+    hass instance they belong to.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache."""
+        self._maxsize = maxsize
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        # Templates are compiled in executor threads at startup
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: str) -> Any:
+        """Return the compiled code of a template or None."""
+        with self._lock:
+            code = self._cache.get(source)
+            if code is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(source)
+            self.hits += 1
+            return code
+
+    def set(self, source: str, code: Any) -> None:
+        """Store the compiled code of a template."""
+        with self._lock:
+            self._cache[source] = code
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all compiled templates and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """Return the counters of the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "maxsize": self._maxsize,
+        }
+
+
+_COMPILED_CACHE = CompiledTemplateCache(COMPILED_TEMPLATE_CACHE_SIZE)
 _NO_HASS_ENV = TemplateEnvironment(None)
+
+
+def _get_environment(hass: Optional[HomeAssistantType]) -> TemplateEnvironment:
+    """Return the template environment of a hass instance."""
+    if hass is None:
+        return _NO_HASS_ENV
+    ret = hass.data.get(_ENVIRONMENT)
+    if ret is None:
+        ret = hass.data[_ENVIRONMENT] = TemplateEnvironment(hass)
+    return ret
+
+
+def compiled_template_cache_info() -> Dict[str, int]:
+    """Return the hits, misses and size of the compiled template cache."""
+    return _COMPILED_CACHE.info()
+
+
+def _template_strings(obj: Any) -> Iterable[str]:
+    """Yield the template strings found in a config structure."""
+    if isinstance(obj, list):
+        for child in obj:
+            yield from _template_strings(child)
+    elif isinstance(obj, collections.abc.Mapping):
+        for child in obj.values():
+            yield from _template_strings(child)
+    elif isinstance(obj, Template):
+        if not obj.is_static:
+            yield obj.template
+    elif isinstance(obj, str) and is_template_string(obj):
+        yield obj
+
+
+def _precompile(env: TemplateEnvironment, sources: List[str]) -> None:
+    """Compile templates into the compiled template cache."""
+    for source in sources:
+        try:
+            env.compile(source)
+        except jinja2.TemplateError:
+            # Reported when the config of the integration is validated
+            pass
+
+
+@bind_hass
+async def async_precompile_templates(hass: HomeAssistantType, config: Any) -> None:
+    """Compile all templates of a config before they are first rendered.
+
+    The templates are compiled in the executor, split over a few jobs, while
+    the integrations are set up.
+    """
+    sources = list(set(_template_strings(config)))
+    if not sources:
+        return
+
+    env = _get_environment(hass)
+    await asyncio.gather(
+        *(
+            hass.async_add_executor_job(_precompile, env, sources[idx::PRECOMPILE_JOBS])
+            for idx in range(min(PRECOMPILE_JOBS, len(sources)))
+        )
+    )
+    _LOGGER.debug("Precompiled %d templates", len(sources))
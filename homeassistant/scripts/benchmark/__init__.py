@@ -323,6 +323,326 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def mqtt_subscription_matching(hass):
+    """Dispatch 100k MQTT messages with a growing number of subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries
+    from homeassistant.components import mqtt
+
+    count = 0
+
+    @core.callback
+    def listener(_):
+        """Handle message."""
+        nonlocal count
+        count += 1
+
+    conf = mqtt.CONFIG_SCHEMA({mqtt.DOMAIN: {mqtt.CONF_BROKER: "localhost"}})[
+        mqtt.DOMAIN
+    ]
+    total = 0
+
+    for subscriptions in (10, 100, 1000, 3000):
+        entry = config_entries.ConfigEntry(
+            1, mqtt.DOMAIN, "benchmark", {}, "user", "local_push", {}
+        )
+        client = mqtt.MQTT(hass, entry, conf)
+        for idx in range(subscriptions):
+            await client.async_subscribe(f"zigbee2mqtt/device{idx}", listener, 0)
+        await client.async_subscribe("tasmota/+/tele/STATE", listener, 0)
+        await client.async_subscribe("homeassistant/#", listener, 0)
+
+        messages = [
+            mqtt.Message(f"zigbee2mqtt/device{idx % subscriptions}", b"{}", 0, False)
+            for idx in range(10 ** 5)
+        ]
+
+        start = timer()
+        for msg in messages:
+            client._mqtt_handle_message(msg)  # pylint: disable=protected-access
+        runtime = timer() - start
+        total += runtime
+
+        print(
+            f"{subscriptions} subscriptions: "
+            f"{len(messages) / runtime:.0f} messages/sec"
+        )
+
+    return total
+
+
+@benchmark
+async def statistics_window(hass):
+    """Compare incremental and full statistics updates on a 10k samples window."""
+    # pylint: disable=import-outside-toplevel
+    import statistics
+
+    from homeassistant.components.statistics.sensor import SampleWindow
+
+    size = 10 ** 4
+    updates = 10 ** 3
+    values = [(idx * 7919) % 1000 / 10 for idx in range(size + updates)]
+
+    window = SampleWindow(size)
+    samples = collections.deque(maxlen=size)
+    for value in values[:size]:
+        window.append(value)
+        samples.append(value)
+
+    start = timer()
+    for value in values[size:]:
+        window.append(value)
+        _ = (window.mean, window.median, window.stdev, window.variance)
+        _ = (window.total, window.min, window.max)
+    incremental = timer() - start
+
+    start = timer()
+    for value in values[size:]:
+        samples.append(value)
+        _ = (
+            statistics.mean(samples),
+            statistics.median(samples),
+            statistics.stdev(samples),
+            statistics.variance(samples),
+        )
+        _ = (sum(samples), min(samples), max(samples))
+    full = timer() - start
+
+    print(
+        f"{updates} updates, incremental: {incremental:.3f}s, "
+        f"full recomputation: {full:.3f}s"
+    )
+    return incremental
+
+
+@benchmark
+async def filter_window(hass):
+    """Compare incremental and full filter updates on a 10k samples window."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+    import statistics
+
+    from homeassistant.components.filter.sensor import OutlierFilter, TimeSMAFilter
+
+    size = 10 ** 4
+    updates = 10 ** 3
+    now = dt_util.utcnow()
+    states = [
+        core.State(
+            "sensor.benchmark",
+            (idx * 7919) % 1000 / 10,
+            last_updated=now + timedelta(seconds=idx),
+        )
+        for idx in range(size + updates)
+    ]
+    values = [float(state.state) for state in states]
+
+    outlier = OutlierFilter(window_size=size, precision=2, entity=None, radius=10)
+    time_sma = TimeSMAFilter(
+        window_size=timedelta(seconds=size), precision=2, entity=None, type="last"
+    )
+    for state in states[:size]:
+        outlier.filter_state(core.State(state.entity_id, state.state))
+        time_sma.filter_state(state)
+
+    start = timer()
+    for state in states[size:]:
+        outlier.filter_state(core.State(state.entity_id, state.state))
+        time_sma.filter_state(state)
+    incremental = timer() - start
+
+    samples = collections.deque(values[:size], maxlen=size)
+    queue = collections.deque(zip(states[:size], values[:size]))
+    window = timedelta(seconds=size)
+    start = timer()
+    for state, value in zip(states[size:], values[size:]):
+        _ = statistics.median(samples)
+        samples.append(value)
+
+        while queue[0][0].last_updated + window <= state.last_updated:
+            last_leak = queue.popleft()
+        queue.append((state, value))
+        moving_sum = 0
+        window_start = state.last_updated - window
+        prev_value = last_leak[1]
+        for queued, queued_value in queue:
+            moving_sum += (
+                queued.last_updated - window_start
+            ).total_seconds() * prev_value
+            window_start = queued.last_updated
+            prev_value = queued_value
+    full = timer() - start
+
+    print(
+        f"{updates} updates, incremental: {incremental:.3f}s, "
+        f"full recomputation: {full:.3f}s"
+    )
+    return incremental
+
+
+@benchmark
+async def entity_service_call(hass):
+    """Measure service calls per second targeting one entity by entity count."""
+    # pylint: disable=import-outside-toplevel
+    from tempfile import TemporaryDirectory
+    from types import SimpleNamespace
+
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.service import entity_service_call as service_call
+
+    class BenchmarkEntity(Entity):
+        """Entity that does nothing when called."""
+
+        should_poll = False
+
+        async def async_benchmark(self):
+            """Handle the service call."""
+
+    calls = 10 ** 3
+    total = 0
+    # The group integration is loaded to expand the targeted entity ids
+    config_dir = TemporaryDirectory()
+    hass.config.config_dir = config_dir.name
+
+    for count in (10, 100, 1000, 10000):
+        entities = {}
+        for idx in range(count):
+            entity = BenchmarkEntity()
+            entity.entity_id = f"light.benchmark_{idx}"
+            entities[entity.entity_id] = entity
+        platform = SimpleNamespace(entities=entities)
+        call = core.ServiceCall(
+            "light", "benchmark", {"entity_id": [f"light.benchmark_{count // 2}"]}
+        )
+
+        start = timer()
+        for _ in range(calls):
+            await service_call(hass, [platform], "async_benchmark", call)
+        elapsed = timer() - start
+        total += elapsed
+
+        print(f"{count} entities: {calls / elapsed:.0f} service calls/s")
+
+    config_dir.cleanup()
+    return total
+
+
+@benchmark
+async def config_snapshot(hass):
+    """Compare loading a 600 file configuration with and without snapshot."""
+    # pylint: disable=import-outside-toplevel
+    import json
+    import os
+    from tempfile import TemporaryDirectory
+
+    from homeassistant.config import load_yaml_config_file, load_yaml_config_snapshot
+    from homeassistant.util.yaml import ConfigSnapshot
+
+    config_dir = TemporaryDirectory()
+    config_path = os.path.join(config_dir.name, "configuration.yaml")
+    with open(config_path, "w") as fil:
+        fil.write(
+            "homeassistant:\n  name: Benchmark\n"
+            "automation: !include_dir_merge_list automations\n"
+            "sensor: !include_dir_merge_list sensors\n"
+        )
+    for directory in ("automations", "sensors"):
+        os.mkdir(os.path.join(config_dir.name, directory))
+        for idx in range(300):
+            with open(
+                os.path.join(config_dir.name, directory, f"{idx}.yaml"), "w"
+            ) as fil:
+                for item in range(5):
+                    fil.write(
+                        f"- id: {directory}_{idx}_{item}\n"
+                        f"  alias: Benchmark {idx} {item}\n"
+                        "  trigger:\n    platform: state\n"
+                        f"    entity_id: sensor.benchmark_{idx}\n"
+                        "  action:\n    - service: light.turn_on\n"
+                        f"      data:\n        brightness: {item}\n"
+                    )
+
+    # Files modified in the last seconds are not stored in the snapshot
+    for root, _, files in os.walk(config_dir.name):
+        for fname in files:
+            os.utime(os.path.join(root, fname), (0, 0))
+
+    def load_all():
+        """Load the configuration in the different ways."""
+        load_yaml_config_file(config_path)
+        start = timer()
+        load_yaml_config_file(config_path)
+        times = {"without snapshot": timer() - start}
+
+        start = timer()
+        snapshot = ConfigSnapshot()
+        load_yaml_config_snapshot(snapshot, config_path)
+        times["cold"] = timer() - start
+
+        # Stored after startup, loaded again by the next start
+        stored = json.dumps(snapshot.as_dict())
+        start = timer()
+        snapshot = ConfigSnapshot(json.loads(stored))
+        load_yaml_config_snapshot(snapshot, config_path)
+        times["warm"] = timer() - start
+
+        changed_path = os.path.join(config_dir.name, "sensors", "0.yaml")
+        with open(changed_path, "a") as fil:
+            fil.write("- id: changed\n")
+        os.utime(changed_path, (1, 1))
+        start = timer()
+        load_yaml_config_snapshot(snapshot, config_path)
+        times["one file changed"] = timer() - start
+        return times
+
+    times = await hass.async_add_executor_job(load_all)
+    config_dir.cleanup()
+
+    print(", ".join(f"{name}: {elapsed:.3f}s" for name, elapsed in times.items()))
+    return times["warm"]
+
+
+@benchmark
+async def process_executor(hass):
+    """Measure event loop latency while CPU bound jobs run in threads or processes."""
+    jobs = 8
+    times = {}
+
+    for name, add_job in (
+        ("threads", hass.async_add_executor_job),
+        ("processes", hass.async_add_process_job),
+    ):
+        # Start the workers before measuring
+        await asyncio.gather(*(add_job(_cpu_bound_job, 1) for _ in range(jobs)))
+
+        start = timer()
+        work = asyncio.gather(
+            *(add_job(_cpu_bound_job, 2 * 10 ** 6) for _ in range(jobs))
+        )
+        delays = []
+        while not work.done():
+            before = timer()
+            await asyncio.sleep(0.001)
+            delays.append(timer() - before - 0.001)
+        await work
+        times[name] = timer() - start
+
+        delays.sort()
+        print(
+            f"{name}: {jobs} jobs done in {times[name]:.2f}s, loop latency "
+            f"median {delays[len(delays) // 2] * 1000:.1f}ms, "
+            f"max {delays[-1] * 1000:.1f}ms"
+        )
+
+    return times["processes"]
+
+
+def _cpu_bound_job(count):
+    """Keep a CPU busy, defined at module level to run in a worker process."""
+    return sum(value * value for value in range(count))
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
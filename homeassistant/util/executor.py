@@ -0,0 +1,156 @@
+"""Pools of threads that keep classes of executor jobs apart."""
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
+import threading
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+_Job = Tuple[Future, float, Optional[str], Callable[..., Any], Tuple[Any, ...]]
+
+
+class LaneStats:
+    """Depth of the queue of a lane and how long its jobs waited for a thread."""
+
+    __slots__ = ("queued", "running", "completed", "wait_total", "wait_max")
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def add(self, other: "LaneStats") -> None:
+        """Add the stats of another key."""
+        self.queued += other.queued
+        self.running += other.running
+        self.completed += other.completed
+        self.wait_total += other.wait_total
+        self.wait_max = max(self.wait_max, other.wait_max)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the stats as a dictionary."""
+        return {
+            "queued": self.queued,
+            "running": self.running,
+            "completed": self.completed,
+            "wait_total": self.wait_total,
+            "wait_max": self.wait_max,
+        }
+
+
+class LaneExecutor(ThreadPoolExecutor):
+    """Thread pool for one class of executor jobs, like polling or database queries.
+
+    Jobs can be submitted with a key, like the integration they belong to. The
+    jobs of a key above the key limit are held back until a job of that key is
+    done, so one key can't take all the threads, even when its jobs hang.
+    """
+
+    def __init__(
+        self, name: str, max_workers: int, key_limit: Optional[int] = None
+    ) -> None:
+        """Initialize the lane."""
+        super().__init__(
+            max_workers=max_workers, thread_name_prefix=f"{name.capitalize()}Worker"
+        )
+        self.name = name
+        self.max_workers = max_workers
+        self.key_limit = key_limit
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats: Dict[Optional[str], LaneStats] = defaultdict(LaneStats)
+        self._held: Dict[Optional[str], Deque[_Job]] = defaultdict(deque)
+
+    def submit(  # type: ignore  # pylint: disable=arguments-differ
+        self, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Future:
+        """Submit a job without a key."""
+        if kwargs:
+            fn = functools.partial(fn, **kwargs)
+        return self.submit_keyed(None, fn, *args)
+
+    def submit_keyed(
+        self, key: Optional[str], fn: Callable[..., Any], *args: Any
+    ) -> Future:
+        """Submit a job, holding it back while its key is at the key limit."""
+        future: Future = Future()
+        job = (future, monotonic(), key, fn, args)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            stats = self._stats[key]
+            if (
+                key is not None
+                and self.key_limit is not None
+                and stats.queued - len(self._held[key]) + stats.running
+                >= self.key_limit
+            ):
+                self._held[key].append(job)
+            else:
+                super().submit(self._run, job)
+            stats.queued += 1
+        return future
+
+    def _run(self, job: _Job) -> None:
+        """Run a job in a worker thread."""
+        future, submitted, key, fn, args = job
+        stats = self._stats[key]
+
+        if not future.set_running_or_notify_cancel():
+            with self._lock:
+                stats.queued -= 1
+                self._release(key)
+            return
+
+        wait = monotonic() - submitted
+        with self._lock:
+            stats.queued -= 1
+            stats.running += 1
+            stats.wait_total += wait
+            if wait > stats.wait_max:
+                stats.wait_max = wait
+
+        try:
+            result = fn(*args)
+        except BaseException as exc:  # pylint: disable=broad-except
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                stats.running -= 1
+                stats.completed += 1
+                self._release(key)
+
+    def _release(self, key: Optional[str]) -> None:
+        """Hand the next held job of a key to the pool, called with the lock held."""
+        held = self._held.get(key)
+        if held and not self._closed:
+            super().submit(self._run, held.popleft())
+
+    def shutdown(self, wait: bool = True, **kwargs: Any) -> None:
+        """Cancel the held jobs and shut down the pool."""
+        with self._lock:
+            self._closed = True
+            for key, held in self._held.items():
+                self._stats[key].queued -= len(held)
+                for job in held:
+                    job[0].cancel()
+                held.clear()
+        super().shutdown(wait, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the stats of the lane and of each key."""
+        total = LaneStats()
+        with self._lock:
+            for stats in self._stats.values():
+                total.add(stats)
+            keys = {
+                key: stats.as_dict()
+                for key, stats in self._stats.items()
+                if key is not None
+            }
+        return {"max_workers": self.max_workers, **total.as_dict(), "keys": keys}
@@ -1,6 +1,10 @@
 """Util to handle processes."""
 
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import signal
 import subprocess
+from typing import Optional
 
 
 def kill_subprocess(process: subprocess.Popen) -> None:
@@ -10,3 +14,21 @@ def kill_subprocess(process: subprocess.Popen) -> None:
     process.wait()
 
     del process
+
+
+def _init_process_worker() -> None:
+    """Leave the handling of interrupts to the main process."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def create_process_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Create a pool of worker processes for CPU bound jobs.
+
+    Workers are spawned instead of forked, a fork would copy the event loop
+    and the locks held by the other threads of the main process.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_process_worker,
+    )
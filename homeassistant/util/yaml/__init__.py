@@ -2,6 +2,7 @@
 from .const import _SECRET_NAMESPACE, SECRET_YAML
 from .dumper import dump, save_yaml
 from .loader import clear_secret_cache, load_yaml, secret_yaml
+from .snapshot import ConfigSnapshot
 
 __all__ = [
     "SECRET_YAML",
@@ -11,4 +12,5 @@ __all__ = [
     "clear_secret_cache",
     "load_yaml",
     "secret_yaml",
+    "ConfigSnapshot",
 ]
@@ -0,0 +1,229 @@
+"""Snapshot of parsed YAML files reused while the files do not change."""
+from collections import OrderedDict
+from contextlib import contextmanager
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .objects import NodeListClass, NodeStrClass
+
+# mypy: allow-untyped-calls
+
+_LOGGER = logging.getLogger(__name__)
+
+DEP_DIR = "dir"
+DEP_FILE = "file"
+# Values that must not be stored, like secrets and environment variables
+DEP_SECRET = "secret"
+
+# Files modified this recently may change again without a visible change
+# of their modification time, so they are not stored
+RACY_WINDOW_NS = 2 * 10 ** 9
+
+TAG_DICT = "d"
+TAG_LIST = "l"
+TAG_STR = "s"
+
+Dependency = Tuple[str, str]
+Fingerprint = Tuple[int, int]
+
+_LOCAL = threading.local()
+
+
+def active_session() -> Optional["SnapshotSession"]:
+    """Return the snapshot session of the current thread, if any."""
+    return getattr(_LOCAL, "session", None)
+
+
+@contextmanager
+def suspend_session() -> Iterator[None]:
+    """Load the files of the current thread without the snapshot."""
+    previous = active_session()
+    _LOCAL.session = None
+    try:
+        yield
+    finally:
+        _LOCAL.session = previous
+
+
+def track(kind: str, name: str) -> None:
+    """Record a dependency of the file parsed by the current thread."""
+    session = active_session()
+    if session is not None:
+        session.track((kind, name))
+
+
+class ConfigSnapshot:
+    """Parse results of YAML files stored with the file they were read from.
+
+    Only files that depend on nothing but their own content are stored, so
+    an entry is reused while the modification time and size of its file are
+    unchanged. Files including other files, or using secrets or environment
+    variables, are parsed every time and take their included files from the
+    snapshot. Nothing read from secrets or environment variables is stored.
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None) -> None:
+        """Initialize the snapshot from the data of as_dict."""
+        self._entries: Dict[str, Tuple[Fingerprint, Any]] = {}
+        self._used: Set[str] = set()
+        self._lock = threading.Lock()
+        self.dirty = False
+
+        if data is not None:
+            self._entries = {
+                fname: (tuple(fingerprint), result)
+                for fname, (fingerprint, result) in data["entries"].items()
+            }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the entries as JSON serializable data.
+
+        Entries of files that were not used by the last session are dropped.
+        """
+        with self._lock:
+            self._entries = {
+                fname: entry
+                for fname, entry in self._entries.items()
+                if fname in self._used
+            }
+            self.dirty = False
+            return {"entries": dict(self._entries)}
+
+    def get(self, fname: str) -> Optional[Tuple[Fingerprint, Any]]:
+        """Return the fingerprint and encoded result stored for a file."""
+        return self._entries.get(fname)
+
+    def store(self, fname: str, fingerprint: Fingerprint, result: Any) -> None:
+        """Store the parse result of a file."""
+        try:
+            data = _encode(result, fname)
+        except ValueError as err:
+            _LOGGER.debug("Not adding %s to the config snapshot: %s", fname, err)
+            return
+
+        with self._lock:
+            self._entries[fname] = (fingerprint, data)
+            self.dirty = True
+
+    def use(self, fname: str) -> None:
+        """Mark the entry of a file as used."""
+        self._used.add(fname)
+
+    @contextmanager
+    def session(self) -> Iterator["SnapshotSession"]:
+        """Use the snapshot for the YAML files loaded by the current thread."""
+        self._used.clear()
+        previous = active_session()
+        session = _LOCAL.session = SnapshotSession(self)
+        try:
+            yield session
+        finally:
+            _LOCAL.session = previous
+
+
+class SnapshotSession:
+    """Load files from a snapshot."""
+
+    def __init__(self, snapshot: ConfigSnapshot) -> None:
+        """Initialize the session."""
+        self.snapshot = snapshot
+        self.hits = 0
+        self.misses = 0
+        # Dependencies besides their own content of the files being parsed
+        self._stack: List[Set[Dependency]] = []
+
+    def load(self, fname: str, parse: Callable[[str], Any]) -> Any:
+        """Return the result of a file, parsing it when it changed."""
+        self.track((DEP_FILE, fname))
+        self.snapshot.use(fname)
+        fingerprint = _fingerprint(fname)
+        entry = self.snapshot.get(fname)
+        if entry is not None and entry[0] == fingerprint:
+            self.hits += 1
+            return _decode(entry[1], fname)
+
+        deps: Set[Dependency] = set()
+        self._stack.append(deps)
+        try:
+            result = parse(fname)
+        finally:
+            self._stack.pop()
+
+        self.misses += 1
+        if not deps and fingerprint is not None:
+            self.snapshot.store(fname, fingerprint, result)
+        return result
+
+    def track(self, dep: Dependency) -> None:
+        """Record a dependency of the file being parsed."""
+        if self._stack:
+            self._stack[-1].add(dep)
+
+
+def _fingerprint(fname: str) -> Optional[Fingerprint]:
+    """Return the modification time and size of a file.
+
+    Returns None if the file can't be read or was modified too recently to
+    tell later changes by its modification time.
+    """
+    try:
+        stat = os.stat(fname)
+    except OSError:
+        return None
+    if time.time_ns() - stat.st_mtime_ns < RACY_WINDOW_NS:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _encode(obj: Any, fname: str) -> Any:
+    """Return the parse result of a file as JSON serializable data.
+
+    Mappings, lists and annotated strings are stored as lists starting with
+    their type and line, the file is the same for all of them. Raises
+    ValueError for values YAML can produce but JSON can't store, like dates.
+    """
+    if obj is None or isinstance(obj, (bool, int, float)):
+        return obj
+    if type(obj) is str:  # pylint: disable=unidiomatic-typecheck
+        return obj
+
+    line = getattr(obj, "__line__", None)
+    if getattr(obj, "__config_file__", fname) != fname:
+        raise ValueError(f"Value from another file {obj.__config_file__}")
+
+    if isinstance(obj, str):
+        return [TAG_STR, line, str(obj)]
+    if isinstance(obj, list):
+        return [TAG_LIST, line, *(_encode(item, fname) for item in obj)]
+    if isinstance(obj, dict):
+        data = [TAG_DICT, line]
+        for key, value in obj.items():
+            if key is not None and not isinstance(key, (str, bool, int, float)):
+                raise ValueError(f"Unsupported key {key!r}")
+            data.append(key)
+            data.append(_encode(value, fname))
+        return data
+    raise ValueError(f"Unsupported value {obj!r}")
+
+
+def _decode(data: Any, fname: str) -> Any:
+    """Return a new parse result from the data of _encode."""
+    if not isinstance(data, list):
+        return data
+
+    tag, line = data[0], data[1]
+    if tag == TAG_STR:
+        obj: Any = NodeStrClass(data[2])
+    elif tag == TAG_LIST:
+        obj = NodeListClass(_decode(item, fname) for item in data[2:])
+    else:
+        obj = OrderedDict(
+            (data[idx], _decode(data[idx + 1], fname)) for idx in range(2, len(data), 2)
+        )
+    if line is not None:
+        setattr(obj, "__config_file__", fname)
+        setattr(obj, "__line__", line)
+    return obj
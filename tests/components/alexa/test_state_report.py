@@ -1,8 +1,24 @@
 """Test report state."""
+import asyncio
+from datetime import timedelta
+
 from homeassistant.components.alexa import state_report
+from homeassistant.util.dt import utcnow
 
 from . import DEFAULT_CONFIG, TEST_URL
 
+from tests.async_mock import patch
+from tests.common import async_fire_time_changed
+
+
+async def _async_report_window(hass):
+    """Let the state changes be collected and the reports sent."""
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=state_report.REPORT_WINDOW)
+    )
+    await hass.async_block_till_done()
+
 
 async def test_report_state(hass, aioclient_mock):
     """Test proactive state reports."""
@@ -22,8 +38,7 @@ async def test_report_state(hass, aioclient_mock):
         {"friendly_name": "Test Contact Sensor", "device_class": "door"},
     )
 
-    # To trigger event listener
-    await hass.async_block_till_done()
+    await _async_report_window(hass)
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -68,8 +83,7 @@ async def test_report_state_instance(hass, aioclient_mock):
         },
     )
 
-    # To trigger event listener
-    await hass.async_block_till_done()
+    await _async_report_window(hass)
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -171,3 +185,92 @@ async def test_doorbell_event(hass, aioclient_mock):
     assert call_json["event"]["header"]["name"] == "DoorbellPress"
     assert call_json["event"]["payload"]["cause"]["type"] == "PHYSICAL_INTERACTION"
     assert call_json["event"]["endpoint"]["endpointId"] == "binary_sensor#test_doorbell"
+
+
+async def test_report_state_coalesced(hass, aioclient_mock):
+    """Test bursts of state changes are coalesced and unchanged reports skipped."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    attributes = {"friendly_name": "Test Contact Sensor", "device_class": "door"}
+
+    hass.states.async_set("binary_sensor.test_contact_1", "on", attributes)
+    hass.states.async_set("binary_sensor.test_contact_2", "on", attributes)
+
+    reporter = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    hass.states.async_set("binary_sensor.test_contact_1", "off", attributes)
+    hass.states.async_set(
+        "binary_sensor.test_contact_1", "off", {**attributes, "extra": True}
+    )
+    hass.states.async_set("binary_sensor.test_contact_2", "off", attributes)
+    await _async_report_window(hass)
+
+    assert len(aioclient_mock.mock_calls) == 2
+    assert {
+        call[2]["event"]["endpoint"]["endpointId"] for call in aioclient_mock.mock_calls
+    } == {
+        "binary_sensor#test_contact_1",
+        "binary_sensor#test_contact_2",
+    }
+    assert reporter.stats == {
+        "sent": 2,
+        "skipped": 0,
+        "coalesced": 1,
+        "superseded": 0,
+        "failed": 0,
+    }
+
+    # The properties Alexa knows about didn't change
+    hass.states.async_set(
+        "binary_sensor.test_contact_1", "off", {**attributes, "extra": False}
+    )
+    await _async_report_window(hass)
+
+    assert len(aioclient_mock.mock_calls) == 2
+    assert reporter.stats["skipped"] == 1
+
+    # Reports are retried while Alexa is unavailable
+    aioclient_mock.clear_requests()
+    aioclient_mock.post(TEST_URL, text="", status=503)
+
+    with patch.object(state_report, "RETRY_DELAY", 0):
+        hass.states.async_set("binary_sensor.test_contact_2", "on", attributes)
+        await _async_report_window(hass)
+
+    assert len(aioclient_mock.mock_calls) == state_report.RETRY_ATTEMPTS
+    assert reporter.stats["failed"] == 1
+
+    reporter.async_stop()
+    hass.states.async_set("binary_sensor.test_contact_2", "off", attributes)
+    await _async_report_window(hass)
+
+    assert len(aioclient_mock.mock_calls) == state_report.RETRY_ATTEMPTS
+
+
+async def test_report_state_superseded(hass):
+    """Test a failed report isn't retried once a newer one exists."""
+    attributes = {"friendly_name": "Test Contact Sensor", "device_class": "door"}
+    hass.states.async_set("binary_sensor.test_contact", "off", attributes)
+    reporter = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+    reported = []
+
+    async def send_changereport(hass, config, alexa_entity, properties):
+        reported.append(alexa_entity.entity.state)
+        if len(reported) > 1:
+            return 202
+        # The state changes again while Alexa is unavailable
+        hass.states.async_set("binary_sensor.test_contact", "off", attributes)
+        await asyncio.sleep(0)
+        return 503
+
+    with patch.object(state_report, "RETRY_DELAY", 0), patch.object(
+        state_report, "async_send_changereport_message", side_effect=send_changereport
+    ):
+        hass.states.async_set("binary_sensor.test_contact", "on", attributes)
+        await _async_report_window(hass)
+        await _async_report_window(hass)
+
+    assert reported == ["on", "off"]
+    assert reporter.stats["superseded"] == 1
+    assert reporter.stats["sent"] == 1
+    assert reporter.stats["failed"] == 0
+    reporter.async_stop()
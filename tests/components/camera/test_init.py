@@ -6,7 +6,11 @@ import io
 import pytest
 
 from homeassistant.components import camera
-from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
+from homeassistant.components.camera.const import (
+    DOMAIN,
+    PREF_FRAME_CACHE_TTL,
+    PREF_PRELOAD_STREAM,
+)
 from homeassistant.components.camera.prefs import CameraEntityPreferences
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
@@ -70,6 +74,96 @@ async def test_get_image_from_camera(hass, image_mock_url):
     assert image.content == b"Test"
 
 
+async def test_get_image_shares_fetch(hass, image_mock_url):
+    """Concurrent image requests share one fetch from the camera."""
+    fetching = asyncio.Event()
+    release = asyncio.Event()
+
+    async def camera_image():
+        fetching.set()
+        await release.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=camera_image,
+    ) as mock_camera:
+        first = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera")
+        )
+        await fetching.wait()
+        second = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera")
+        )
+        await asyncio.sleep(0)
+        release.set()
+        images = await asyncio.gather(first, second)
+
+    assert len(mock_camera.mock_calls) == 1
+    assert images[0].content is images[1].content
+    assert images[0].content == b"Test"
+
+
+async def test_get_image_frame_cache_ttl(hass, image_mock_url):
+    """Images are served from the frame cache for the configured time."""
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ) as mock_camera:
+        await camera.async_get_image(hass, "camera.demo_camera")
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert len(mock_camera.mock_calls) == 2
+
+        common.mock_camera_prefs(hass, "camera.demo_camera", {PREF_FRAME_CACHE_TTL: 60})
+        await camera.async_get_image(hass, "camera.demo_camera")
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert len(mock_camera.mock_calls) == 2
+
+    assert image.content == b"Test"
+
+
+async def test_frame_broker_sequence(hass, image_mock_url):
+    """Test a new frame sequence number is only used for new content."""
+    broker = hass.data[DOMAIN].get_entity("camera.demo_camera").frame_broker
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=[b"Test", b"Test", b"Other", None],
+    ):
+        assert await broker.async_get_frame(0) == (1, b"Test")
+        assert await broker.async_get_frame(0) == (1, b"Test")
+        assert await broker.async_get_frame(0) == (2, b"Other")
+        assert await broker.async_get_frame(0) == (2, None)
+        # A recent frame is reused without fetching
+        assert await broker.async_get_frame(60) == (2, b"Other")
+
+    assert broker.fetches == 4
+
+
+async def test_frame_broker_fetch_timeout(hass, image_mock_url):
+    """Test a camera that does not answer does not block later fetches."""
+    broker = hass.data[DOMAIN].get_entity("camera.demo_camera").frame_broker
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=hang,
+    ), patch(
+        "homeassistant.components.camera.frame_broker.FETCH_TIMEOUT", 0.01
+    ), pytest.raises(
+        asyncio.TimeoutError
+    ):
+        await broker.async_get_frame(0)
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ):
+        assert await broker.async_get_frame(0) == (1, b"Test")
+
+
 async def test_get_stream_source_from_camera(hass, mock_camera):
     """Fetch stream source from camera entity."""
 
@@ -241,6 +335,21 @@ async def test_websocket_update_prefs(
         == setup_camera_prefs[PREF_PRELOAD_STREAM]
     )
 
+    await client.send_json(
+        {
+            "id": 9,
+            "type": "camera/update_prefs",
+            "entity_id": "camera.demo_camera",
+            "frame_cache_ttl": 5,
+        }
+    )
+    response = await client.receive_json()
+
+    assert response["success"]
+    assert response["result"][PREF_FRAME_CACHE_TTL] == 5
+    prefs = hass.data[camera.DATA_CAMERA_PREFS].get("camera.demo_camera")
+    assert prefs.frame_cache_ttl == 5
+
 
 async def test_play_stream_service_no_source(hass, mock_camera, mock_stream):
     """Test camera play_stream service."""
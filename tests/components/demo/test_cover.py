@@ -68,8 +68,8 @@ async def test_close_cover(hass, setup_comp):
     )
     state = hass.states.get(ENTITY_COVER)
     assert state.state == STATE_CLOSING
-    for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(7):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -88,8 +88,8 @@ async def test_open_cover(hass, setup_comp):
     )
     state = hass.states.get(ENTITY_COVER)
     assert state.state == STATE_OPENING
-    for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(7):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -104,8 +104,8 @@ async def test_toggle_cover(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
-    for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(7):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -116,8 +116,8 @@ async def test_toggle_cover(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
-    for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(10):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -128,8 +128,8 @@ async def test_toggle_cover(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
-    for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(10):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -148,8 +148,8 @@ async def test_set_cover_position(hass, setup_comp):
         {ATTR_ENTITY_ID: ENTITY_COVER, ATTR_POSITION: 10},
         blocking=True,
     )
-    for _ in range(6):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(6):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -183,8 +183,8 @@ async def test_close_cover_tilt(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_CLOSE_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
-    for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(7):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -199,8 +199,8 @@ async def test_open_cover_tilt(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
-    for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(7):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -214,8 +214,8 @@ async def test_toggle_cover_tilt(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
-    for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(7):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -225,8 +225,8 @@ async def test_toggle_cover_tilt(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
-    for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(10):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -236,8 +236,8 @@ async def test_toggle_cover_tilt(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
-    for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(10):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -255,8 +255,8 @@ async def test_set_cover_tilt_position(hass, setup_comp):
         {ATTR_ENTITY_ID: ENTITY_COVER, ATTR_TILT_POSITION: 90},
         blocking=True,
     )
-    for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(7):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -843,8 +843,8 @@ async def test_close_cover(hass_hue, hue_client):
     cover_test = hass_hue.states.get(cover_id)
     assert cover_test.state == "closing"
 
-    for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(7):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass_hue, future)
         await hass_hue.async_block_till_done()
 
@@ -859,8 +859,8 @@ async def test_close_cover(hass_hue, hue_client):
     assert cover_result.status == HTTP_OK
     assert "application/json" in cover_result.headers["content-type"]
 
-    for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(7):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass_hue, future)
         await hass_hue.async_block_till_done()
 
@@ -888,8 +888,8 @@ async def test_set_position_cover(hass_hue, hue_client):
     cover_test = hass_hue.states.get(cover_id)
     assert cover_test.state == "closing"
 
-    for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(7):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass_hue, future)
         await hass_hue.async_block_till_done()
 
@@ -913,8 +913,8 @@ async def test_set_position_cover(hass_hue, hue_client):
     assert True, cover_result_json[0]["success"][f"/lights/{cover_number}/state/on"]
     assert cover_result_json[1]["success"][f"/lights/{cover_number}/state/bri"] == level
 
-    for _ in range(100):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(100):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass_hue, future)
         await hass_hue.async_block_till_done()
 
@@ -1,8 +1,14 @@
 """The test for the data filter sensor platform."""
+from collections import deque
 from datetime import timedelta
+import math
 from os import path
+import random
+import statistics
 import unittest
 
+import pytest
+
 from homeassistant import config as hass_config
 from homeassistant.components.filter.sensor import (
     DOMAIN,
@@ -313,6 +319,93 @@ class TestFilterSensor(unittest.TestCase):
         assert 21.5 == filtered.state
 
 
+def _reference_outlier(values, window_size, radius):
+    """Filter values recomputing the median of the whole window."""
+    window = deque(maxlen=window_size)
+    result = []
+    for value in values:
+        filtered = value
+        median = statistics.median(window) if window else 0
+        if len(window) == window.maxlen and abs(value - median) > radius:
+            filtered = median
+        window.append(value)
+        result.append(filtered)
+    return result
+
+
+def _reference_time_sma(samples, window):
+    """Average samples walking the whole queue for each of them."""
+    queue = deque()
+    last_leak = None
+    result = []
+    for timestamp, value in samples:
+        while queue and queue[0][0] + window <= timestamp:
+            last_leak = queue.popleft()
+        queue.append((timestamp, value))
+
+        moving_sum = 0
+        start = timestamp - window
+        prev_value = (last_leak or queue[0])[1]
+        for sample_timestamp, sample_value in queue:
+            moving_sum += (sample_timestamp - start).total_seconds() * prev_value
+            start = sample_timestamp
+            prev_value = sample_value
+        result.append(moving_sum / window.total_seconds())
+    return result
+
+
+@pytest.mark.parametrize("window_size", [1, 2, 5, 50])
+def test_outlier_matches_full_median(window_size):
+    """Test the outlier filter matches the median of the whole window."""
+    rand = random.Random(42)
+    values = [float(rand.randint(0, 20)) for _ in range(500)]
+    # Repeated values and plateaus of outliers
+    values += [100.0] * window_size + [5.0] * window_size
+
+    filt = OutlierFilter(window_size=window_size, precision=2, entity=None, radius=3.0)
+    filtered = [
+        filt.filter_state(ha.State("sensor.test_monitored", value)).state
+        for value in values
+    ]
+    assert filtered == _reference_outlier(values, window_size, 3.0)
+
+
+def test_outlier_nan():
+    """Test NaN states pass the outlier filter and stay out of the median."""
+    filt = OutlierFilter(window_size=3, precision=2, entity=None, radius=4.0)
+    values = [20, "nan", 21, 22, "nan", 40, 21]
+    filtered = [
+        filt.filter_state(ha.State("sensor.test_monitored", value)).state
+        for value in values
+    ]
+    assert math.isnan(filtered[1])
+    assert math.isnan(filtered[4])
+    # Medians of the numbers of the windows 20 nan 21, nan 21 22, 22 nan 40
+    assert filtered[2:4] + filtered[5:] == [21, 22, 21.5, 31]
+
+
+@pytest.mark.parametrize("window_minutes", [1, 5, 30])
+def test_time_sma_matches_full_walk(window_minutes):
+    """Test the time SMA filter matches walking the whole window."""
+    rand = random.Random(42)
+    window = timedelta(minutes=window_minutes)
+    timestamp = dt_util.utcnow()
+    samples = []
+    for _ in range(1000):
+        # Bursts of samples and gaps longer than the window
+        timestamp += timedelta(seconds=rand.choice([1, 5, 30, 90, 3600]))
+        samples.append((timestamp, rand.uniform(-50, 50)))
+
+    filt = TimeSMAFilter(window_size=window, precision=6, entity=None, type="last")
+    filtered = [
+        filt.filter_state(
+            ha.State("sensor.test_monitored", value, last_updated=timestamp)
+        ).state
+        for timestamp, value in samples
+    ]
+    assert filtered == pytest.approx(_reference_time_sma(samples, window), abs=1e-5)
+
+
 async def test_reload(hass):
     """Verify we can reload filter sensors."""
     await hass.async_add_executor_job(
@@ -1,8 +1,10 @@
 """Test Google report state."""
+from datetime import timedelta
+
 from homeassistant.components.google_assistant import error, report_state
 from homeassistant.util.dt import utcnow
 
-from . import BASIC_CONFIG
+from . import BASIC_CONFIG, MockConfig
 
 from tests.async_mock import AsyncMock, patch
 from tests.common import async_fire_time_changed
@@ -16,7 +18,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     with patch.object(
         BASIC_CONFIG, "async_report_state_all", AsyncMock()
     ) as mock_report, patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
-        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+        reporter = report_state.async_enable_report_state(hass, BASIC_CONFIG)
 
         async_fire_time_changed(hass, utcnow())
         await hass.async_block_till_done()
@@ -37,6 +39,10 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
@@ -52,6 +58,10 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
             "light.kitchen", "on", {"irrelevant": "should_be_ignored"}
         )
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
 
@@ -64,16 +74,85 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ):
         hass.states.async_set("light.kitchen", "off")
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
 
-    unsub()
+    reporter.async_stop()
 
     with patch.object(
         BASIC_CONFIG, "async_report_state_all", AsyncMock()
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_batched(hass, legacy_patchable_time):
+    """Test only exposed entities are tracked and their changes reported together."""
+    exposed = {"light.ceiling", "switch.ac"}
+    config = MockConfig(
+        hass=hass, should_expose=lambda state: state.entity_id in exposed
+    )
+    hass.states.async_set("light.ceiling", "off")
+    hass.states.async_set("switch.ac", "on")
+    hass.states.async_set("light.hidden", "off")
+
+    with patch.object(config, "async_report_state_all", AsyncMock()) as mock_report:
+        config.async_enable_report_state()
+        reporter = config._report_state
+        assert set(reporter._unsub_entities) == exposed
+
+        # Changes within the window are coalesced, changing back is not reported
+        hass.states.async_set("light.ceiling", "on")
+        hass.states.async_set("switch.ac", "off")
+        hass.states.async_set("switch.ac", "on")
+        hass.states.async_set("light.hidden", "on")
+        await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {"states": {"light.ceiling": {"on": True, "online": True}}}
+    }
+
+    # Entities exposed later are tracked after a sync
+    exposed.add("light.hidden")
+    with patch.object(
+        config, "_async_request_sync_devices", AsyncMock(return_value=200)
+    ):
+        await config.async_sync_entities("agent")
+    assert set(reporter._unsub_entities) == exposed
+
+    exposed.remove("switch.ac")
+    reporter.async_refresh_entities()
+    assert set(reporter._unsub_entities) == {"light.ceiling", "light.hidden"}
+
+    with patch.object(config, "async_report_state_all", AsyncMock()) as mock_report:
+        hass.states.async_set("light.hidden", "off")
+        hass.states.async_set("switch.ac", "off")
+        await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW * 2)
+        )
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {"states": {"light.hidden": {"on": False, "online": True}}}
+    }
+
+    config.async_disable_report_state()
+    assert reporter._unsub_entities == {}
@@ -903,7 +903,7 @@ async def test_query_disconnect(hass):
     """Test a disconnect message."""
     config = MockConfig(hass=hass)
     config.async_enable_report_state()
-    assert config._unsub_report_state is not None
+    assert config._report_state is not None
     with patch.object(config, "async_disconnect_agent_user") as mock_disconnect:
         result = await sh.async_handle_message(
             hass,
@@ -218,8 +218,8 @@ async def test_open_covers(hass, setup_comp):
         DOMAIN, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
 
-    for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(10):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -239,8 +239,8 @@ async def test_close_covers(hass, setup_comp):
         DOMAIN, SERVICE_CLOSE_COVER, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
 
-    for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(10):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -260,8 +260,8 @@ async def test_toggle_covers(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
-    for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(10):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -272,8 +272,8 @@ async def test_toggle_covers(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
-    for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(10):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -289,8 +289,8 @@ async def test_toggle_covers(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
-    for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(10):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -338,8 +338,8 @@ async def test_set_cover_position(hass, setup_comp):
         {ATTR_ENTITY_ID: COVER_GROUP, ATTR_POSITION: 50},
         blocking=True,
     )
-    for _ in range(4):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(4):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -358,8 +358,8 @@ async def test_open_tilts(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
-    for _ in range(5):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(5):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -378,8 +378,8 @@ async def test_close_tilts(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_CLOSE_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
-    for _ in range(5):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(5):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -397,8 +397,8 @@ async def test_toggle_tilts(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
-    for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(10):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -414,8 +414,8 @@ async def test_toggle_tilts(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
-    for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(10):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -429,8 +429,8 @@ async def test_toggle_tilts(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
-    for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(10):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -476,8 +476,8 @@ async def test_set_tilt_positions(hass, setup_comp):
         {ATTR_ENTITY_ID: COVER_GROUP, ATTR_TILT_POSITION: 80},
         blocking=True,
     )
-    for _ in range(3):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(3):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -499,8 +499,8 @@ async def test_is_opening_closing(hass, setup_comp):
     assert hass.states.get(DEMO_COVER_TILT).state == STATE_OPENING
     assert hass.states.get(COVER_GROUP).state == STATE_OPENING
 
-    for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+    for idx in range(10):
+        future = dt_util.utcnow() + timedelta(seconds=idx + 1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
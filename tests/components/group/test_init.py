@@ -1,6 +1,7 @@
 """The tests for the Group components."""
 # pylint: disable=protected-access
 from collections import OrderedDict
+import random
 import unittest
 
 import homeassistant.components.group as group
@@ -563,3 +564,84 @@ async def test_group_order_with_dynamic_creation(hass):
     await hass.async_block_till_done()
 
     assert hass.states.get("group.new_group2").attributes["order"] == 4
+
+
+async def test_expand_entity_ids_nested_changes(hass):
+    """Test expanding nested groups follows changes of the nested groups."""
+    hass.states.async_set("group.inner", STATE_ON, {"entity_id": ["light.a"]})
+    hass.states.async_set(
+        "group.middle", STATE_ON, {"entity_id": ["group.inner", "light.b"]}
+    )
+    hass.states.async_set(
+        "group.outer", STATE_ON, {"entity_id": ["light.c", "group.middle"]}
+    )
+
+    assert group.expand_entity_ids(hass, ["group.outer", "light.a"]) == [
+        "light.c",
+        "light.a",
+        "light.b",
+    ]
+
+    hass.states.async_set(
+        "group.inner", STATE_ON, {"entity_id": ["light.a", "light.d"]}
+    )
+    assert group.expand_entity_ids(hass, ["group.outer"]) == [
+        "light.c",
+        "light.a",
+        "light.d",
+        "light.b",
+    ]
+
+    hass.states.async_remove("group.inner")
+    assert group.expand_entity_ids(hass, ["group.outer"]) == ["light.c", "light.b"]
+
+    hass.states.async_set(
+        "group.inner", STATE_ON, {"entity_id": ["group.outer", "light.e"]}
+    )
+    assert group.expand_entity_ids(hass, ["group.outer"]) == [
+        "light.c",
+        "light.e",
+        "light.b",
+    ]
+    assert group.expand_entity_ids(hass, ["group.inner"]) == [
+        "light.c",
+        "light.b",
+        "light.e",
+    ]
+
+
+async def test_group_state_follows_members(hass):
+    """Test the group state matches all its members after each change."""
+    rand = random.Random(42)
+    members = [f"light.light_{idx}" for idx in range(20)]
+    for entity_id in members:
+        hass.states.async_set(entity_id, STATE_OFF)
+
+    any_group = await group.Group.async_create_group(hass, "any_group", members)
+    all_group = await group.Group.async_create_group(
+        hass, "all_group", members, mode=True
+    )
+
+    for _ in range(300):
+        entity_id = rand.choice(members)
+        if rand.random() < 0.1:
+            hass.states.async_remove(entity_id)
+        else:
+            hass.states.async_set(
+                entity_id,
+                rand.choice([STATE_ON, STATE_OFF, STATE_UNKNOWN]),
+                {ATTR_ASSUMED_STATE: rand.random() < 0.5},
+            )
+        await hass.async_block_till_done()
+
+        states = [hass.states.get(member) for member in members]
+        states = [state for state in states if state is not None]
+        for grp, mode in ((any_group, any), (all_group, all)):
+            group_state = hass.states.get(grp.entity_id)
+            expected = (
+                STATE_ON if mode(s.state == STATE_ON for s in states) else STATE_OFF
+            )
+            assert group_state.state == expected
+            assert group_state.attributes.get(ATTR_ASSUMED_STATE, False) == mode(
+                s.attributes.get(ATTR_ASSUMED_STATE, False) for s in states
+            )
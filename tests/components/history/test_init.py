@@ -1,11 +1,16 @@
 """The tests the History component."""
 # pylint: disable=protected-access,invalid-name
+import asyncio
 from copy import copy
 from datetime import timedelta
 import json
 import unittest
 
+import aiohttp
+import pytest
+
 from homeassistant.components import history, recorder
+from homeassistant.components.recorder import statistics
 from homeassistant.components.recorder.models import process_timestamp
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
@@ -18,7 +23,7 @@ from tests.common import (
     init_recorder_component,
     mock_state_change_event,
 )
-from tests.components.recorder.common import wait_recording_done
+from tests.components.recorder.common import trigger_db_commit, wait_recording_done
 
 
 class TestComponentHistory(unittest.TestCase):
@@ -823,3 +828,160 @@ async def test_fetch_period_api_with_include_order(hass, hass_client):
         params={"filter_entity_id": "non.existing,something.else"},
     )
     assert response.status == 200
+
+
+async def test_fetch_stream_api(hass, hass_client):
+    """Test the history stream view returns columnar chunks."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 200})
+    hass.states.async_set("light.kitchen", "off", {"brightness": 200})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 200})
+    hass.states.async_set("sensor.temperature", "20", {"unit": "C"})
+    await hass.async_add_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    with patch.object(history, "STREAM_CHUNK_SIZE", 2):
+        response = await client.get(
+            f"/api/history/stream/{start.isoformat()}",
+            params={"significant_changes_only": "0"},
+        )
+        assert response.status == 200
+        assert response.content_type == "application/x-ndjson"
+        body = await response.text()
+
+    chunks = [json.loads(line) for line in body.splitlines()]
+    assert [chunk["entity_id"] for chunk in chunks] == [
+        "light.kitchen",
+        "light.kitchen",
+        "sensor.temperature",
+    ]
+    assert chunks[0]["states"] == ["on", "on"]
+    assert chunks[0]["attributes"] == [
+        [0, {"brightness": 100}],
+        [1, {"brightness": 200}],
+    ]
+    # Attributes did not change, they are not repeated in the next chunk
+    assert chunks[1]["states"] == ["off", "on"]
+    assert chunks[1]["attributes"] == []
+    assert chunks[2]["states"] == ["20"]
+    assert chunks[2]["attributes"] == [[0, {"unit": "C"}]]
+
+    timestamps = chunks[0]["timestamps"] + chunks[1]["timestamps"]
+    assert timestamps == sorted(timestamps)
+    assert timestamps[0] >= start.timestamp()
+
+
+async def test_fetch_stream_api_initial_state(hass, hass_client):
+    """Test the history stream view starts with the state at start time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+
+    hass.states.async_set("sensor.temperature", "20")
+    await hass.async_add_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.humidity", "50")
+    await hass.async_add_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/stream/{start.isoformat()}",
+        params={"filter_entity_id": "sensor.temperature,sensor.humidity"},
+    )
+    assert response.status == 200
+
+    chunks = {
+        chunk["entity_id"]: chunk
+        for chunk in map(json.loads, (await response.text()).splitlines())
+    }
+    assert chunks["sensor.temperature"]["states"] == ["20"]
+    assert chunks["sensor.temperature"]["timestamps"] == [start.timestamp()]
+    assert chunks["sensor.humidity"]["states"] == ["50"]
+
+
+async def test_fetch_stream_api_write_timeout(hass, hass_client, caplog):
+    """Test the history stream drops a client that stopped reading."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.temperature", "20")
+    await hass.async_add_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    async def stalled_write(data):
+        await asyncio.sleep(10)
+
+    client = await hass_client()
+    with patch.object(history, "STREAM_WRITE_TIMEOUT", 0.01), patch.object(
+        history.web.StreamResponse, "write", side_effect=stalled_write
+    ):
+        response = await client.get(f"/api/history/stream/{start.isoformat()}")
+        with pytest.raises(aiohttp.ClientError):
+            await response.text()
+
+    assert "Client stopped reading the history stream" in caplog.text
+    # The stream used the share of the database lane of its key
+    assert "history" in hass.async_executor_lane_stats()["database"]["keys"]
+
+
+async def test_fetch_stream_api_invalid_datetime(hass, hass_client):
+    """Test the history stream view rejects an invalid datetime."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    client = await hass_client()
+    response = await client.get("/api/history/stream/not-a-date")
+    assert response.status == 400
+
+
+async def test_fetch_statistics_api(hass, hass_client):
+    """Test the statistics view returns the compiled statistics."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    start = statistics.period_start(statistics.PERIOD_HOUR, dt_util.utcnow())
+
+    with recorder.session_scope(hass=hass) as session:
+        session.add(
+            recorder.models.Statistics(
+                statistic_id="sensor.temperature",
+                start=start,
+                mean=20.5,
+                min=19,
+                max=22,
+                last=21,
+            )
+        )
+    await hass.async_add_job(instance.block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/statistics/{start.isoformat()}",
+        params={"filter_entity_id": "sensor.temperature"},
+    )
+    assert response.status == 200
+    assert await response.json() == {
+        "sensor.temperature": [
+            {
+                "start": start.isoformat(),
+                "mean": 20.5,
+                "min": 19,
+                "max": 22,
+                "last": 21,
+            }
+        ]
+    }
+
+    response = await client.get(
+        "/api/history/statistics", params={"period": "fortnight"}
+    )
+    assert response.status == 400
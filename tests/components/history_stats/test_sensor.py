@@ -1,5 +1,6 @@
 """The test for the History Statistics sensor platform."""
 # pylint: disable=protected-access
+import asyncio
 from datetime import datetime, timedelta
 from os import path
 import unittest
@@ -141,11 +142,10 @@ class TestHistoryStatsSensor(unittest.TestCase):
             "homeassistant.components.history.state_changes_during_period",
             return_value=fake_states,
         ):
-            with patch("homeassistant.components.history.get_state", return_value=None):
-                sensor1.update()
-                sensor2.update()
-                sensor3.update()
-                sensor4.update()
+            for sensor in (sensor1, sensor2, sensor3, sensor4):
+                asyncio.run_coroutine_threadsafe(
+                    sensor.async_update(), self.hass.loop
+                ).result()
 
         assert sensor1.state == 0.5
         assert sensor2.state is None
@@ -313,3 +313,52 @@ async def test_reload(hass):
 
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
+
+
+async def test_measure_incremental(hass):
+    """Test the history is loaded once and followed by state changes."""
+    hass.states.async_set("binary_sensor.test_id", "off")
+    t0 = dt_util.utcnow() - timedelta(minutes=40)
+    fake_states = {
+        "binary_sensor.test_id": [
+            ha.State("binary_sensor.test_id", "on", last_changed=t0),
+            ha.State(
+                "binary_sensor.test_id", "off", last_changed=t0 + timedelta(minutes=20)
+            ),
+        ]
+    }
+
+    start = Template("{{ as_timestamp(now()) - 3600 }}", hass)
+    end = Template("{{ now() }}", hass)
+    sensor = HistoryStatsSensor(
+        hass, "binary_sensor.test_id", "on", start, end, None, "count", "Test"
+    )
+    sensor.entity_id = "sensor.test"
+    await sensor.async_added_to_hass()
+
+    with patch(
+        "homeassistant.components.history.state_changes_during_period",
+        return_value=fake_states,
+    ) as mock_history:
+        await sensor.async_update()
+        assert sensor.state == 1
+
+        hass.states.async_set("binary_sensor.test_id", "on")
+        hass.states.async_set("binary_sensor.test_id", "on", {"attribute": 1})
+        await hass.async_block_till_done()
+        await sensor.async_update()
+        assert sensor.state == 2
+        assert sensor.value == pytest.approx(1 / 3, abs=0.01)
+
+        # The start of the period moves forward past the first change
+        sensor._start = Template("{{ as_timestamp(now()) - 900 }}", hass)
+        await sensor.async_update()
+        assert sensor.state == 1
+        assert len(sensor._history) == 2
+
+        assert len(mock_history.mock_calls) == 1
+
+        # The start of the period moves back before the loaded history
+        sensor._start = Template("{{ as_timestamp(now()) - 7200 }}", hass)
+        await sensor.async_update()
+        assert len(mock_history.mock_calls) == 2
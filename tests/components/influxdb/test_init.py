@@ -1,6 +1,8 @@
 """The tests for the InfluxDB component."""
+import asyncio
 from dataclasses import dataclass
 import datetime
+import gzip
 
 import pytest
 
@@ -14,6 +16,7 @@ from homeassistant.const import (
     STATE_STANDBY,
 )
 from homeassistant.core import split_entity_id
+from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.setup import async_setup_component
 
 from tests.async_mock import MagicMock, Mock, call, patch
@@ -1577,3 +1580,147 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+async def _setup_exporter(hass, config_ext):
+    """Set up the integration with the asynchronous exporter."""
+    config = {
+        "influxdb": {
+            "host": "host",
+            "exporter": "async",
+            "exclude": {
+                "entities": ["fake.excluded"],
+                "entity_globs": ["sensor.influxdb_exporter_*"],
+            },
+        }
+    }
+    config["influxdb"].update(config_ext)
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+    return hass.data[influxdb.DOMAIN]
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, url, params, headers",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            {"username": "user", "password": "pass", "precision": "us"},
+            "http://host:8086/write",
+            {"db": "home_assistant", "precision": "u"},
+            {"Authorization": "Basic dXNlcjpwYXNz"},
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            "https://host/api/v2/write",
+            {"org": "org", "bucket": DEFAULT_BUCKET},
+            {"Authorization": "Token token"},
+        ),
+    ],
+    indirect=["mock_client"],
+)
+async def test_exporter_writes_line_protocol(
+    hass, aioclient_mock, mock_client, config_ext, url, params, headers
+):
+    """Test the exporter writes compressed line protocol batches."""
+    aioclient_mock.post(url, params=params, status=204)
+    exporter = await _setup_exporter(hass, config_ext)
+
+    hass.states.async_set("sensor.power", "12.5", {"unit_of_measurement": "W"})
+    hass.states.async_set("switch.heater", STATE_ON, {"friendly_name": "Heater 1"})
+    hass.states.async_set("fake.excluded", "unknown")
+    await hass.async_block_till_done()
+    assert exporter.buffered == 2
+
+    await exporter.async_stop()
+
+    assert aioclient_mock.call_count == 1
+    _, request_url, data, request_headers = aioclient_mock.mock_calls[0]
+    assert request_url.query == params
+    assert request_headers["Content-Encoding"] == "gzip"
+    for key, value in headers.items():
+        assert request_headers[key] == value
+
+    lines = gzip.decompress(data).decode().splitlines()
+    assert [line.rsplit(" ", 1)[0] for line in lines] == [
+        "W,domain=sensor,entity_id=power value=12.5",
+        'switch.heater,domain=switch,entity_id=heater friendly_name_str="Heater 1",'
+        'state="on",value=1.0',
+    ]
+    assert exporter.written == 2
+    assert exporter.dropped == 0
+
+
+@pytest.mark.parametrize("mock_client", [influxdb.DEFAULT_API_VERSION], indirect=True)
+async def test_exporter_buffer_drops_oldest(hass, aioclient_mock, mock_client):
+    """Test the oldest lines are dropped when the buffer is full."""
+    aioclient_mock.post("http://host:8086/write", status=204)
+    exporter = await _setup_exporter(hass, {"buffer_size": 2})
+
+    for value in range(3):
+        hass.states.async_set("sensor.power", value)
+    await hass.async_block_till_done()
+    assert exporter.buffered == 2
+    assert exporter.dropped == 1
+    assert exporter.lag >= 0
+
+    await exporter.async_stop()
+
+    lines = gzip.decompress(aioclient_mock.mock_calls[0][2]).decode().splitlines()
+    assert [line.split(" ")[1] for line in lines] == ["value=1.0", "value=2.0"]
+    assert exporter.written == 2
+    assert exporter.buffered == 0
+    assert exporter.lag == 0
+
+    await async_update_entity(hass, "sensor.influxdb_exporter_dropped_lines")
+    assert hass.states.get("sensor.influxdb_exporter_dropped_lines").state == "1"
+
+
+@pytest.mark.parametrize(
+    "mock_client, status, write_errors",
+    [
+        (influxdb.DEFAULT_API_VERSION, 400, 0),
+        (influxdb.DEFAULT_API_VERSION, 500, 1),
+    ],
+    indirect=["mock_client"],
+)
+async def test_exporter_write_error(
+    hass, aioclient_mock, mock_client, status, write_errors, caplog
+):
+    """Test lines that could not be written are counted as dropped."""
+    aioclient_mock.post("http://host:8086/write", status=status, text="error")
+    exporter = await _setup_exporter(hass, {})
+
+    hass.states.async_set("sensor.power", "1")
+    await hass.async_block_till_done()
+    await exporter.async_stop()
+
+    assert exporter.written == 0
+    assert exporter.dropped == 1
+    assert exporter.write_errors == write_errors
+    assert "error" in caplog.text
+
+
+@pytest.mark.parametrize("mock_client", [influxdb.DEFAULT_API_VERSION], indirect=True)
+async def test_exporter_stop_timeout(hass, aioclient_mock, mock_client, caplog):
+    """Test lines not written in time when stopping are dropped."""
+
+    async def hang(method, url, data):
+        await asyncio.sleep(10)
+
+    aioclient_mock.post("http://host:8086/write", side_effect=hang)
+    exporter = await _setup_exporter(hass, {})
+
+    hass.states.async_set("sensor.power", "1")
+    hass.states.async_set("sensor.power", "2")
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.components.influxdb.exporter.EXPORTER_STOP_TIMEOUT", 0.01
+    ):
+        await exporter.async_stop()
+
+    assert exporter.written == 0
+    assert exporter.dropped == 2
+    assert "Dropped 2 lines that could not be written before stopping" in caplog.text
@@ -12,7 +12,11 @@ import voluptuous as vol
 from homeassistant.components import logbook, recorder, sun
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
-from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
+from homeassistant.components.recorder.models import (
+    States,
+    process_timestamp_to_utc_isoformat,
+)
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.const import (
     ATTR_DOMAIN,
@@ -2228,6 +2232,230 @@ async def test_icon_and_state(hass, hass_client):
     assert response_json[2]["state"] == STATE_OFF
 
 
+async def test_filter_continuous_sensor_values_legacy_rows(hass):
+    """Test continuous sensors recorded without the unit flag are filtered."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.power", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.power", "2", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.mode", "eco")
+    hass.states.async_set("sensor.mode", "comfort")
+
+    await hass.async_add_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    def clear_unit_flags():
+        """Make the states look like they were recorded before the flag existed."""
+        with session_scope(hass=hass) as session:
+            session.query(States).update(
+                {States.has_unit_of_measurement: None}, synchronize_session=False
+            )
+
+    for prepare in (None, clear_unit_flags):
+        if prepare:
+            await hass.async_add_executor_job(prepare)
+        entries = await hass.async_add_executor_job(
+            logbook._get_events, hass, start, dt_util.utcnow()
+        )
+        assert [entry["entity_id"] for entry in entries] == ["sensor.mode"]
+
+
+def test_context_lookup_bounded():
+    """Test the context lookup only keeps the most recent contexts."""
+    lookup = logbook.ContextLookup(size=2)
+    lookup.add("a", 1)
+    lookup.add("a", 2)
+    lookup.add(None, 3)
+    assert lookup.get("a") == 1
+    assert lookup.get(None) is None
+
+    lookup.add("b", 4)
+    lookup.add("c", 5)
+    assert lookup.get("a") is None
+    assert lookup.get("b") == 4
+    assert lookup.get("c") == 5
+
+
+async def test_logbook_stream_view(hass, hass_client):
+    """Test the logbook stream view sends the entries in chunks."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("switch.test", STATE_OFF)
+    hass.states.async_set("switch.test", STATE_ON)
+    hass.states.async_set("switch.test", STATE_OFF)
+
+    await hass.async_add_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day)
+
+    with patch.object(logbook, "STREAM_CHUNK_SIZE", 1):
+        response = await client.get(f"/api/logbook/stream/{start_date.isoformat()}")
+        assert response.status == 200
+        assert response.headers["Content-Type"] == "application/x-ndjson"
+        lines = (await response.text()).splitlines()
+
+    entries = [json.loads(line) for line in lines]
+    assert [entry["message"] for entry in entries] == ["turned on", "turned off"]
+    assert entries[0]["entity_id"] == "switch.test"
+
+    response = await client.get("/api/logbook/stream?entity=invalid")
+    assert response.status == 400
+
+
+async def test_logbook_stream_view_live(hass, hass_client):
+    """Test the logbook stream view continues with live events."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("switch.test", STATE_OFF)
+    hass.states.async_set("switch.test", STATE_ON)
+
+    await hass.async_add_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day)
+
+    response = await client.get(f"/api/logbook/stream/{start_date.isoformat()}?live")
+    assert response.status == 200
+
+    entry = json.loads(await response.content.readline())
+    assert entry["entity_id"] == "switch.test"
+    assert entry["message"] == "turned on"
+
+    hass.states.async_set("switch.test", STATE_OFF)
+    hass.states.async_set("sensor.power", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.power", "2", {"unit_of_measurement": "W"})
+    hass.states.async_set("switch.test", STATE_ON)
+
+    entry = json.loads(await response.content.readline())
+    assert entry["entity_id"] == "switch.test"
+    assert entry["message"] == "turned off"
+
+    entry = json.loads(await response.content.readline())
+    assert entry["entity_id"] == "switch.test"
+    assert entry["message"] == "turned on"
+
+    response.close()
+
+
+async def test_logbook_event_stream_websocket(hass, hass_ws_client):
+    """Test streaming past and live logbook entries over the websocket."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.kitchen", STATE_ON)
+
+    await hass.async_add_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client(hass)
+
+    # A period in the past ends the stream after the past entries
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": start.isoformat(),
+            "end_time": dt_util.utcnow().isoformat(),
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+
+    msg = await client.receive_json()
+    assert msg["event"]["partial"]
+    assert [entry["message"] for entry in msg["event"]["events"]] == ["turned on"]
+
+    msg = await client.receive_json()
+    assert msg["event"] == {"events": [], "partial": False}
+
+    # Without end time the stream continues with live entries
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "logbook/event_stream",
+            "start_time": start.isoformat(),
+            "entity_id": "light.kitchen",
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+
+    msg = await client.receive_json()
+    assert msg["event"]["partial"]
+    assert len(msg["event"]["events"]) == 1
+
+    msg = await client.receive_json()
+    assert msg["event"] == {"events": [], "partial": False}
+
+    hass.states.async_set("light.living_room", STATE_OFF)
+    hass.states.async_set("light.living_room", STATE_ON)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+
+    msg = await client.receive_json()
+    assert msg["id"] == 2
+    assert not msg["event"]["partial"]
+    entry = msg["event"]["events"][0]
+    assert entry["entity_id"] == "light.kitchen"
+    assert entry["message"] == "turned off"
+
+    await client.send_json({"id": 3, "type": "unsubscribe_events", "subscription": 2})
+    msg = await client.receive_json()
+    assert msg["success"]
+
+    await client.send_json(
+        {"id": 4, "type": "logbook/event_stream", "start_time": "invalid"}
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "invalid_start_time"
+
+
+async def test_logbook_event_stream_unsubscribe(hass):
+    """Test unsubscribing stops reading the entries of the past."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow()
+    for state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("switch.test", state)
+
+    await hass.async_add_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    stream = logbook.LogbookEventStream(hass, None, None, None, False)
+    chunks = []
+
+    async def send(entries):
+        chunks.append(entries)
+        stream.async_unsubscribe()
+
+    with patch.object(logbook, "STREAM_CHUNK_SIZE", 1):
+        await stream.async_stream_past(start, dt_util.utcnow(), send)
+
+    assert len(chunks) == 1
+
+
 class MockLazyEventPartialState(ha.Event):
     """Minimal mock of a Lazy event."""
 
@@ -18,6 +18,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
 )
 from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry
 from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
@@ -575,6 +576,38 @@ async def test_subscribe_special_characters(hass, mqtt_mock, calls, record_calls
     assert calls[0][0].payload == payload
 
 
+async def test_subscribe_overlapping_topic_filters(
+    hass, mqtt_mock, calls, record_calls
+):
+    """Test overlapping topic filters are matched and removed independently."""
+    unsub_exact = await mqtt.async_subscribe(hass, "home/kitchen/temp", record_calls)
+    unsub_level = await mqtt.async_subscribe(hass, "home/+/temp", record_calls)
+    unsub_subtree = await mqtt.async_subscribe(hass, "home/#", record_calls)
+
+    async_fire_mqtt_message(hass, "home/kitchen/temp", "21")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert {call[0].subscribed_topic for call in calls} == {
+        "home/kitchen/temp",
+        "home/+/temp",
+        "home/#",
+    }
+
+    unsub_level()
+    async_fire_mqtt_message(hass, "home/kitchen/temp", "22")
+    await hass.async_block_till_done()
+    assert len(calls) == 5
+
+    unsub_exact()
+    unsub_subtree()
+    async_fire_mqtt_message(hass, "home/kitchen/temp", "23")
+    await hass.async_block_till_done()
+    assert len(calls) == 5
+
+    with pytest.raises(HomeAssistantError):
+        unsub_exact()
+
+
 async def test_subscribe_same_topic(hass, mqtt_client_mock, mqtt_mock):
     """
     Test subscring to same topic twice and simulate retained messages.
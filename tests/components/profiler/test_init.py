@@ -0,0 +1,127 @@
+"""Tests for the Profiler integration."""
+import os
+import time
+
+from homeassistant.components.profiler.const import DATA_MONITOR, DOMAIN
+from homeassistant.core import callback
+from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.setup import async_setup_component
+
+
+def _executor_job():
+    """Run in the executor."""
+    return 42
+
+
+async def test_stats(hass, hass_ws_client):
+    """Test the time spent in listeners, jobs and tasks is measured."""
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    await hass.async_block_till_done()
+
+    @callback
+    def listener(event):
+        """Handle an event in the loop."""
+
+    async def async_listener(event):
+        """Handle an event in a task."""
+
+    hass.bus.async_listen("test_event", listener)
+    hass.bus.async_listen("test_event", async_listener)
+    for _ in range(3):
+        hass.bus.async_fire("test_event")
+    assert await hass.async_add_executor_job(_executor_job) == 42
+    hass.async_create_task(async_listener(None))
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "profiler/stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+
+    listeners = {stats["listener"]: stats for stats in result["listeners"]}
+    assert listeners[f"{__name__}.test_stats.<locals>.listener"]["count"] == 3
+    assert listeners[f"{__name__}.test_stats.<locals>.async_listener"]["count"] == 3
+    assert result["executor"]["tests"]["count"] >= 1
+    assert result["tasks"]["created"]["tests"] == 1
+    assert result["tasks"]["running"] >= 1
+    assert result["slow_callbacks"] == 0
+
+
+async def test_slow_callback(hass, caplog):
+    """Test callbacks blocking the loop are logged and counted."""
+    assert await async_setup_component(
+        hass, DOMAIN, {DOMAIN: {"slow_callback_duration": 0.01}}
+    )
+    await hass.async_block_till_done()
+
+    @callback
+    def slow_listener(event):
+        """Block the loop."""
+        time.sleep(0.02)
+
+    hass.bus.async_listen("test_event", slow_listener)
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+
+    await async_update_entity(hass, "sensor.slow_callbacks")
+    assert hass.states.get("sensor.slow_callbacks").state == "1"
+    assert "slow_listener blocked the event loop" in caplog.text
+
+
+async def test_loop_lag_sensors(hass):
+    """Test the loop lag percentiles."""
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    await hass.async_block_till_done()
+
+    monitor = hass.data[DOMAIN][DATA_MONITOR]
+    monitor.lag.clear()
+    monitor.lag.extend([0.001 * value for value in range(1, 101)])
+
+    for percentile, expected in (("p50", "51.0"), ("p95", "96.0"), ("p99", "100.0")):
+        entity_id = f"sensor.event_loop_lag_{percentile}"
+        await async_update_entity(hass, entity_id)
+        state = hass.states.get(entity_id)
+        assert state.state == expected
+        assert state.attributes["unit_of_measurement"] == "ms"
+
+
+async def test_profile(hass, hass_ws_client, tmp_path):
+    """Test starting and stopping the profiler over the websocket API."""
+    hass.config.config_dir = str(tmp_path)
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "profiler/stop"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_running"
+
+    await client.send_json({"id": 2, "type": "profiler/start"})
+    response = await client.receive_json()
+    assert response["success"]
+
+    await client.send_json({"id": 3, "type": "profiler/start"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "already_running"
+
+    await client.send_json({"id": 4, "type": "profiler/stop"})
+    response = await client.receive_json()
+    assert response["success"]
+    filename = response["result"]["filename"]
+    assert os.path.dirname(filename) == str(tmp_path)
+    assert os.path.getsize(filename) > 0
+
+
+async def test_requires_admin(hass, hass_ws_client, hass_admin_user):
+    """Test the commands are only available to admins."""
+    hass_admin_user.groups = []
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "profiler/stats"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "unauthorized"
@@ -21,8 +21,6 @@ from homeassistant.util import dt as dt_util
 
 import tests.async_mock as mock
 
-PROMETHEUS_PATH = "homeassistant.components.prometheus"
-
 
 @dataclass
 class FilterTest:
@@ -202,14 +200,32 @@ async def test_view(hass, hass_client):
     )
 
 
-@pytest.fixture(name="mock_client")
-def mock_client_fixture():
-    """Mock the prometheus client."""
-    with mock.patch(f"{PROMETHEUS_PATH}.prometheus_client") as client:
-        counter_client = mock.MagicMock()
-        client.Counter = mock.MagicMock(return_value=counter_client)
-        setattr(counter_client, "labels", mock.MagicMock(return_value=mock.MagicMock()))
-        yield counter_client
+async def test_view_openmetrics_gzip(hass, hass_client):
+    """Test the view negotiating OpenMetrics and gzip."""
+    client = await prometheus_client(hass, hass_client)
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={
+            "Accept": "application/openmetrics-text; version=0.0.1,text/plain;q=0.5",
+            "Accept-Encoding": "gzip",
+        },
+    )
+
+    assert resp.status == 200
+    assert resp.headers["content-type"].startswith("application/openmetrics-text")
+    assert resp.headers["content-encoding"] == "gzip"
+    body = await resp.text()
+
+    assert body.endswith("# EOF\n")
+    assert body.count("# EOF") == 1
+    lines = body.split("\n")
+    assert "# HELP python_info Python platform information" in lines
+    assert "# TYPE state_change counter" in lines
+    assert (
+        'state_change_total{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0' in lines
+    )
 
 
 @pytest.fixture
@@ -219,7 +235,7 @@ def mock_bus(hass):
 
 
 @pytest.mark.usefixtures("mock_bus")
-async def test_minimal_config(hass, mock_client):
+async def test_minimal_config(hass):
     """Test the minimal config and defaults of component."""
     config = {prometheus.DOMAIN: {}}
     assert await async_setup_component(hass, prometheus.DOMAIN, config)
@@ -229,7 +245,7 @@ async def test_minimal_config(hass, mock_client):
 
 
 @pytest.mark.usefixtures("mock_bus")
-async def test_full_config(hass, mock_client):
+async def test_full_config(hass):
     """Test the full config of component."""
     config = {
         prometheus.DOMAIN: {
@@ -277,7 +293,7 @@ async def _setup(hass, filter_config):
 
 
 @pytest.mark.usefixtures("mock_bus")
-async def test_allowlist(hass, mock_client):
+async def test_allowlist(hass):
     """Test an allowlist only config."""
     handler_method = await _setup(
         hass,
@@ -301,13 +317,12 @@ async def test_allowlist(hass, mock_client):
         event = make_event(test.id)
         handler_method(event)
 
-        was_called = mock_client.labels.call_count == 1
+        was_called = f'entity="{test.id}"' in handler_method.__self__.render()
         assert test.should_pass == was_called
-        mock_client.labels.reset_mock()
 
 
 @pytest.mark.usefixtures("mock_bus")
-async def test_denylist(hass, mock_client):
+async def test_denylist(hass):
     """Test a denylist only config."""
     handler_method = await _setup(
         hass,
@@ -331,13 +346,12 @@ async def test_denylist(hass, mock_client):
         event = make_event(test.id)
         handler_method(event)
 
-        was_called = mock_client.labels.call_count == 1
+        was_called = f'entity="{test.id}"' in handler_method.__self__.render()
         assert test.should_pass == was_called
-        mock_client.labels.reset_mock()
 
 
 @pytest.mark.usefixtures("mock_bus")
-async def test_filtered_denylist(hass, mock_client):
+async def test_filtered_denylist(hass):
     """Test a denylist config with a filtering allowlist."""
     handler_method = await _setup(
         hass,
@@ -362,6 +376,33 @@ async def test_filtered_denylist(hass, mock_client):
         event = make_event(test.id)
         handler_method(event)
 
-        was_called = mock_client.labels.call_count == 1
+        was_called = f'entity="{test.id}"' in handler_method.__self__.render()
         assert test.should_pass == was_called
-        mock_client.labels.reset_mock()
+
+
+@pytest.mark.usefixtures("mock_bus")
+async def test_render_changed_entities(hass):
+    """Test only the entities that changed are formatted again."""
+    handler_method = await _setup(hass, {})
+    metrics = handler_method.__self__
+    handler_method(make_event("fake.first"))
+    handler_method(make_event("fake.second"))
+    first = metrics.render()
+
+    update = prometheus.MetricFamily.update
+    with mock.patch.object(
+        prometheus.MetricFamily, "update", autospec=True, side_effect=update
+    ) as mock_update:
+        assert metrics.render() == first
+        assert not mock_update.called
+
+        handler_method(make_event("fake.second"))
+        body = metrics.render()
+
+    assert mock_update.called
+    assert {call[0][1] for call in mock_update.call_args_list} == {"fake.second"}
+    assert 'state_change_total{domain="fake",entity="fake.first"' in body
+    assert (
+        'state_change_total{domain="fake",entity="fake.second",'
+        'friendly_name="None"} 2.0' in body
+    )
@@ -2,14 +2,12 @@
 
 from homeassistant.components import recorder
 from homeassistant.util import dt as dt_util
-
-from tests.common import fire_time_changed
-
-DB_COMMIT_INTERVAL = 50
+from homeassistant.util.async_ import run_callback_threadsafe
 
 
 def wait_recording_done(hass):
     """Block till recording is done."""
+    hass.block_till_done()
     trigger_db_commit(hass)
     hass.block_till_done()
     hass.data[recorder.DATA_INSTANCE].block_till_done()
@@ -18,6 +16,6 @@ def wait_recording_done(hass):
 
 def trigger_db_commit(hass):
     """Force the recorder to commit."""
-    for _ in range(DB_COMMIT_INTERVAL):
-        # We only commit on time change
-        fire_time_changed(hass, dt_util.utcnow())
+    run_callback_threadsafe(
+        hass.loop, hass.data[recorder.DATA_INSTANCE]._async_commit, dt_util.utcnow()
+    ).result()
@@ -357,6 +357,31 @@ def test_auto_purge(hass_recorder):
     dt_util.set_default_time_zone(original_tz)
 
 
+def test_commit_interval(hass_recorder):
+    """Test events are committed once per commit interval."""
+    hass = hass_recorder({"commit_interval": 5})
+    instance = hass.data[DATA_INSTANCE]
+
+    with patch.object(
+        instance, "_commit_event_session_or_retry"
+    ) as commit, patch.object(instance, "_send_keep_alive") as keep_alive:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        hass.block_till_done()
+        instance.block_till_done()
+        assert commit.call_count == 0
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=6))
+        hass.block_till_done()
+        instance.block_till_done()
+        assert commit.call_count == 1
+        assert keep_alive.call_count == 0
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+        hass.block_till_done()
+        instance.block_till_done()
+        assert keep_alive.call_count == 1
+
+
 def test_saving_sets_old_state(hass_recorder):
     """Test saving sets old state."""
     hass = hass_recorder()
@@ -406,6 +431,128 @@ def test_saving_state_with_serializable_data(hass_recorder, caplog):
     assert "State is not JSON serializable" in caplog.text
 
 
+def test_batch_writes_sets_old_state(hass_recorder):
+    """Test batched writes link events and old states within one commit."""
+    hass = hass_recorder({"batch_writes": True})
+
+    hass.states.set("test.one", "on", {})
+    hass.states.set("test.two", "on", {})
+    hass.states.set("test.one", "off", {})
+    wait_recording_done(hass)
+    hass.states.set("test.two", "off", {})
+    hass.states.async_remove("test.one")
+    hass.bus.fire("custom_event", {"some": "data"})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States).filter(States.domain == "test"))
+        assert len(states) == 6
+        assert [state.entity_id for state in states] == [
+            "test.one",
+            "test.two",
+            "test.one",
+            "test.two",
+            "test.one",
+            "test.one",
+        ]
+        assert [state.state for state in states] == [
+            "on",
+            "on",
+            "off",
+            "off",
+            None,
+            "on",
+        ]
+
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id is None
+        assert states[2].old_state_id == states[0].state_id
+        assert states[3].old_state_id == states[1].state_id
+        assert states[4].old_state_id == states[2].state_id
+        assert states[5].old_state_id is None
+
+        assert len({state.event_id for state in states}) == 6
+        for state in states:
+            event = session.query(Events).get(state.event_id)
+            assert event.event_type == "state_changed"
+
+        events = list(session.query(Events).filter_by(event_type="custom_event"))
+        assert len(events) == 1
+        assert events[0].event_data == '{"some": "data"}'
+
+    assert hass.data[DATA_INSTANCE].last_batch_size == 1
+
+
+def test_batch_writes_serializable_data(hass_recorder, caplog):
+    """Test batched writes skip states that cannot be serialized."""
+    hass = hass_recorder({"batch_writes": True})
+
+    hass.states.set("test.one", "on", {"fail": CannotSerializeMe()})
+    hass.states.set("test.two", "on", {})
+    hass.states.set("test.two", "off", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States).filter(States.domain == "test"))
+        assert len(states) == 2
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id == states[0].state_id
+
+    assert "State is not JSON serializable" in caplog.text
+
+
+def test_batch_writes_drop_bad_rows(hass_recorder, caplog):
+    """Test a batch that fails to insert only loses the rows that fail."""
+    hass = hass_recorder({"batch_writes": True})
+    from_event = Events.from_event
+
+    def bad_from_event(event, event_data=None):
+        """Return a row that can't be inserted for the bad events."""
+        dbevent = from_event(event, event_data)
+        if event.event_type == "bad_event":
+            dbevent.time_fired = "not a datetime"
+        return dbevent
+
+    with patch.object(Events, "from_event", side_effect=bad_from_event):
+        hass.states.set("test.one", "on", {})
+        hass.bus.fire("bad_event", {})
+        hass.states.set("test.one", "off", {})
+        wait_recording_done(hass)
+
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States).filter(States.domain == "test"))
+        assert [state.state for state in states] == ["on", "off", "on"]
+        assert states[1].old_state_id == states[0].state_id
+        assert states[2].old_state_id == states[1].state_id
+        assert not list(session.query(Events).filter_by(event_type="bad_event"))
+
+    assert hass.data[DATA_INSTANCE]._pending_batch == []
+    assert "Dropped 1 events that could not be saved" in caplog.text
+
+
+def test_batch_writes_sensors(hass_recorder):
+    """Test the recorder reports its queue depth and batch size."""
+    hass = hass_recorder({"batch_writes": True})
+    hass.block_till_done()
+
+    hass.states.set("test.one", "on", {})
+    hass.states.set("test.two", "on", {})
+    wait_recording_done(hass)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    hass.block_till_done()
+
+    state = hass.states.get("sensor.recorder_batch_size")
+    assert state.attributes["unit_of_measurement"] == "events"
+    assert int(state.state) > 0
+    assert hass.states.get("sensor.recorder_queue_depth") is not None
+
+
 def test_run_information(hass_recorder):
     """Ensure run_information returns expected data."""
     before_start_recording = dt_util.utcnow()
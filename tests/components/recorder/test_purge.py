@@ -135,14 +135,6 @@ class TestRecorderPurge(unittest.TestCase):
             assert states.count() == 6
 
             # run purge_old_data()
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
-            assert states.count() == 4
-
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
-            assert states.count() == 2
-
             finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
             assert finished
             assert states.count() == 2
@@ -157,17 +149,50 @@ class TestRecorderPurge(unittest.TestCase):
 
             # run purge_old_data()
             finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
-            assert events.count() == 4
-
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
+            assert finished
+            # we should only have 2 events left
             assert events.count() == 2
 
-            # we should only have 2 events left
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
+    def test_purge_in_batches(self):
+        """Test a purge pass stops after its time budget."""
+        self._add_test_states()
+        self._add_test_events()
+
+        with session_scope(hass=self.hass) as session, patch(
+            "homeassistant.components.recorder.purge.MAX_ROWS_TO_PURGE", 1
+        ), patch("homeassistant.components.recorder.purge.PURGE_TIME_BUDGET", 0):
+            states = session.query(States)
+            events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+
+            # One batch per pass, states first
+            for remaining in (5, 4, 3, 2):
+                with self.assertLogs(
+                    "homeassistant.components.recorder.purge", "INFO"
+                ) as logs:
+                    finished = purge_old_data(
+                        self.hass.data[DATA_INSTANCE], 4, repack=False
+                    )
+                assert not finished
+                assert states.count() == remaining
+                assert events.count() == 6
+                assert f"{remaining - 2 + 4} rows remaining" in logs.output[-1]
+
+            for remaining in (5, 4, 3, 2):
+                finished = purge_old_data(
+                    self.hass.data[DATA_INSTANCE], 4, repack=False
+                )
+                assert not finished
+                assert states.count() == 2
+                assert events.count() == remaining
+
+            with self.assertLogs(
+                "homeassistant.components.recorder.purge", "INFO"
+            ) as logs:
+                finished = purge_old_data(
+                    self.hass.data[DATA_INSTANCE], 4, repack=False
+                )
             assert finished
-            assert events.count() == 2
+            assert "no rows remaining" in logs.output[-1]
 
     def test_purge_method(self):
         """Test purge method."""
@@ -233,6 +258,6 @@ class TestRecorderPurge(unittest.TestCase):
                 self.hass.data[DATA_INSTANCE].block_till_done()
                 wait_recording_done(self.hass)
                 assert (
-                    mock_logger.debug.mock_calls[5][1][0]
+                    mock_logger.debug.mock_calls[-1][1][0]
                     == "Vacuuming SQL DB to free space"
                 )
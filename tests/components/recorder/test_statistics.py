@@ -0,0 +1,205 @@
+"""The tests for the recorder statistics."""
+from datetime import timedelta
+
+import pytest
+
+from homeassistant.components.recorder import statistics
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.models import (
+    States,
+    Statistics,
+    StatisticsShortTerm,
+)
+from homeassistant.components.recorder.util import session_scope
+import homeassistant.util.dt as dt_util
+
+from tests.async_mock import patch
+from tests.common import get_test_home_assistant, init_recorder_component
+
+
+@pytest.fixture
+def hass_recorder():
+    """Home Assistant fixture with in-memory recorder."""
+    hass = get_test_home_assistant()
+
+    def setup_recorder(config=None):
+        """Set up with params."""
+        init_recorder_component(hass, config)
+        hass.start()
+        hass.block_till_done()
+        hass.data[DATA_INSTANCE].block_till_done()
+        return hass
+
+    yield setup_recorder
+    hass.stop()
+
+
+def _add_states(hass, states):
+    """Add (entity_id, state, last_updated) rows to the states table."""
+    with session_scope(hass=hass) as session:
+        for entity_id, state, last_updated in states:
+            session.add(
+                States(
+                    entity_id=entity_id,
+                    domain=entity_id.split(".")[0],
+                    state=state,
+                    attributes="{}",
+                    last_changed=last_updated,
+                    last_updated=last_updated,
+                )
+            )
+
+
+def test_compile_hourly_statistics(hass_recorder):
+    """Test compiling the hourly statistics of numeric sensors."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=3
+    )
+
+    _add_states(
+        hass,
+        [
+            ("sensor.temperature", "10", start),
+            ("sensor.temperature", "20", start + timedelta(minutes=30)),
+            ("sensor.temperature", "unavailable", start + timedelta(minutes=45)),
+            ("sensor.humidity", "50", start + timedelta(minutes=10)),
+            ("sensor.mode", "eco", start + timedelta(minutes=10)),
+            ("light.kitchen", "5", start + timedelta(minutes=10)),
+        ],
+    )
+
+    statistics.compile_statistics(instance, statistics.PERIOD_HOUR, start)
+
+    stats = statistics.statistics_during_period(hass, start)
+    assert set(stats) == {"sensor.temperature", "sensor.humidity"}
+
+    temperature = stats["sensor.temperature"]
+    assert len(temperature) == 1
+    # Unavailable for the last 15 minutes, which do not count
+    assert temperature[0]["mean"] == pytest.approx((10 * 30 + 20 * 15) / 45)
+    assert temperature[0]["min"] == 10
+    assert temperature[0]["max"] == 20
+    assert temperature[0]["last"] is None
+    assert dt_util.parse_datetime(temperature[0]["start"]) == start
+
+    assert stats["sensor.humidity"] == [
+        {
+            "start": temperature[0]["start"],
+            "mean": 50,
+            "min": 50,
+            "max": 50,
+            "last": 50,
+        }
+    ]
+
+    # Compiling a period again does not add duplicates
+    statistics.compile_statistics(instance, statistics.PERIOD_HOUR, start)
+    with session_scope(hass=hass) as session:
+        assert session.query(Statistics).count() == 2
+
+    # Sensors that did not change keep their last numeric value, as long as
+    # they still have a numeric state
+    hass.states.set("sensor.humidity", "50")
+    hass.states.set("sensor.temperature", "30")
+    next_start = start + timedelta(hours=1)
+    _add_states(hass, [("sensor.temperature", "30", next_start)])
+    statistics.compile_statistics(instance, statistics.PERIOD_HOUR, next_start)
+
+    stats = statistics.statistics_during_period(
+        hass, next_start, statistic_ids=["sensor.temperature", "sensor.humidity"]
+    )
+    assert stats["sensor.humidity"][0]["mean"] == 50
+    assert stats["sensor.humidity"][0]["last"] == 50
+    assert stats["sensor.temperature"][0]["mean"] == 30
+    assert stats["sensor.temperature"][0]["last"] == 30
+
+    # Removed sensors are not carried forward
+    hass.states.remove("sensor.humidity")
+    last_start = next_start + timedelta(hours=1)
+    statistics.compile_statistics(instance, statistics.PERIOD_HOUR, last_start)
+
+    stats = statistics.statistics_during_period(hass, last_start)
+    assert set(stats) == {"sensor.temperature"}
+
+
+def test_compile_missed_statistics(hass_recorder):
+    """Test periods missed since the last compiled one are compiled too."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=4
+    )
+
+    hass.states.set("sensor.humidity", "50")
+    _add_states(hass, [("sensor.humidity", "50", start)])
+    assert statistics.compile_statistics(instance, statistics.PERIOD_HOUR, start)
+
+    last_start = start + timedelta(hours=3)
+    _add_states(hass, [("sensor.temperature", "20", last_start)])
+    # A run stops once its time budget is spent, the next run continues
+    with patch.object(statistics, "COMPILE_TIME_BUDGET", 0):
+        for _ in range(2):
+            assert not statistics.compile_statistics(
+                instance, statistics.PERIOD_HOUR, last_start
+            )
+        assert statistics.compile_statistics(
+            instance, statistics.PERIOD_HOUR, last_start
+        )
+
+    stats = statistics.statistics_during_period(hass, start)
+    assert [row["last"] for row in stats["sensor.humidity"]] == [50, 50, 50, 50]
+    assert [
+        dt_util.parse_datetime(row["start"]) for row in stats["sensor.humidity"]
+    ] == [start + timedelta(hours=hours) for hours in range(4)]
+    assert len(stats["sensor.temperature"]) == 1
+
+    # Periods before the last compiled one are not compiled again
+    statistics.compile_statistics(instance, statistics.PERIOD_HOUR, start)
+    with session_scope(hass=hass) as session:
+        assert session.query(Statistics).count() == 5
+
+
+def test_compile_short_term_statistics(hass_recorder):
+    """Test five minute statistics are stored in their own table."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    start = statistics.period_start(statistics.PERIOD_5MINUTE, dt_util.utcnow())
+
+    _add_states(
+        hass,
+        [
+            ("sensor.power", "100", start),
+            ("sensor.power", "300", start + timedelta(minutes=4)),
+        ],
+    )
+
+    statistics.compile_statistics(instance, statistics.PERIOD_5MINUTE, start)
+
+    stats = statistics.statistics_during_period(
+        hass, start, period=statistics.PERIOD_5MINUTE
+    )
+    assert stats["sensor.power"][0]["mean"] == pytest.approx(140)
+    assert stats["sensor.power"][0]["max"] == 300
+    assert statistics.statistics_during_period(hass, start) == {}
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsShortTerm).count() == 1
+        assert (
+            statistics.purge_statistics(
+                session, statistics.PERIOD_5MINUTE, start + timedelta(minutes=5)
+            )
+            == 1
+        )
+
+
+def test_period_start():
+    """Test the start of the last ended period."""
+    now = dt_util.parse_datetime("2020-10-17 12:07:10+00:00")
+    assert statistics.period_start(
+        statistics.PERIOD_HOUR, now
+    ) == dt_util.parse_datetime("2020-10-17 11:00:00+00:00")
+    assert statistics.period_start(
+        statistics.PERIOD_5MINUTE, now
+    ) == dt_util.parse_datetime("2020-10-17 12:00:00+00:00")
@@ -1,6 +1,8 @@
 """The test for the statistics sensor platform."""
+from collections import deque
 from datetime import datetime, timedelta
 from os import path
+import random
 import statistics
 import unittest
 
@@ -8,7 +10,11 @@ import pytest
 
 from homeassistant import config as hass_config
 from homeassistant.components import recorder
-from homeassistant.components.statistics.sensor import DOMAIN, StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    DOMAIN,
+    SampleWindow,
+    StatisticsSensor,
+)
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     SERVICE_RELOAD,
@@ -234,6 +240,56 @@ class TestStatisticsSensor(unittest.TestCase):
         assert 6 == state.attributes.get("min_value")
         assert 14 == state.attributes.get("max_value")
 
+    def test_non_finite_values(self):
+        """Test NaN and infinity are not added to the samples."""
+        now = dt_util.utcnow()
+        mock_data = {
+            "return_time": datetime(now.year + 1, 8, 2, 12, 23, tzinfo=dt_util.UTC)
+        }
+
+        def mock_now():
+            return mock_data["return_time"]
+
+        with patch(
+            "homeassistant.components.statistics.sensor.dt_util.utcnow", new=mock_now
+        ):
+            assert setup_component(
+                self.hass,
+                "sensor",
+                {
+                    "sensor": {
+                        "platform": "statistics",
+                        "name": "test",
+                        "entity_id": "sensor.test_monitored",
+                        "max_age": {"minutes": 3},
+                    }
+                },
+            )
+
+            self.hass.block_till_done()
+            self.hass.start()
+            self.hass.block_till_done()
+
+            for value in [3, "nan", 5, "inf", 1, "-inf", 7, "nan", 9]:
+                self.hass.states.set(
+                    "sensor.test_monitored",
+                    value,
+                    {ATTR_UNIT_OF_MEASUREMENT: TEMP_CELSIUS},
+                )
+                self.hass.block_till_done()
+                # insert the next value one minute later
+                mock_data["return_time"] += timedelta(minutes=1)
+
+            state = self.hass.states.get("sensor.test")
+
+        # Samples older than max_age were evicted, only 7 and 9 are left
+        assert state.attributes.get("count") == 2
+        assert state.attributes.get("min_value") == 7
+        assert state.attributes.get("max_value") == 9
+        assert state.attributes.get("median") == 8
+        assert float(state.state) == 8
+        assert state.attributes.get("variance") == 2
+
     def test_max_age_without_sensor_change(self):
         """Test value deprecation."""
         now = dt_util.utcnow()
@@ -500,3 +556,32 @@ async def test_reload(hass):
 
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
+
+
+def test_sample_window_matches_statistics():
+    """Test the incremental statistics match a full recomputation."""
+    rand = random.Random(42)
+    window = SampleWindow(50)
+    reference = deque(maxlen=50)
+
+    for step in range(2000):
+        value = round(rand.uniform(-100, 100), rand.choice([0, 1, 3]))
+        window.append(value)
+        reference.append(value)
+        if step % 7 == 0 and len(reference) > 1:
+            # Evict like max_age purging does
+            assert window.popleft() == reference.popleft()
+
+        assert list(window) == list(reference)
+        assert window.mean == pytest.approx(statistics.mean(reference))
+        assert window.median == statistics.median(reference)
+        assert window.total == pytest.approx(sum(reference))
+        assert window.min == min(reference)
+        assert window.max == max(reference)
+        if len(reference) > 1:
+            assert window.variance == pytest.approx(statistics.variance(reference))
+            assert window.stdev == pytest.approx(statistics.stdev(reference))
+
+    while reference:
+        assert window.popleft() == reference.popleft()
+    assert len(window) == 0
@@ -1,11 +1,13 @@
 """The tests for hls streams."""
 from datetime import timedelta
+import io
 from urllib.parse import urlparse
 
 import av
 import pytest
 
 from homeassistant.components.stream import request_stream
+from homeassistant.components.stream.core import Segment
 from homeassistant.const import HTTP_NOT_FOUND
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -158,3 +160,55 @@ async def test_stream_keepalive(hass):
 
     # Stop stream, if it hasn't quit already
     stream.stop()
+
+
+def make_segment(sequence, duration=2):
+    """Make a fragmented mp4 segment with empty boxes."""
+    boxes = [b"ftyp", b"moov", b"moof", b"mdat", b"mfra"]
+    content = b"".join(
+        (16).to_bytes(4, byteorder="big") + box + sequence.to_bytes(8, "big")
+        for box in boxes
+    )
+    return Segment(sequence, io.BytesIO(content), duration)
+
+
+async def test_stream_segment_buffer(hass, hass_client):
+    """Test hls segments are kept for the lookback and served from views."""
+    await async_setup_component(hass, "stream", {"stream": {"max_lookback": 10}})
+
+    stream = preload_stream(hass, "test_stream_segment_buffer_source")
+    stream.access_token = "abcdef"
+    track = stream.add_provider("hls")
+    for sequence in range(1, 11):
+        track.put(make_segment(sequence))
+
+    # The playlist only lists the latest segments
+    assert track.segments == [8, 9, 10]
+    assert track.target_duration == 2
+    assert [segment.sequence for segment in track.lookback(10)] == [6, 7, 8, 9, 10]
+    assert [segment.sequence for segment in track.lookback(3)] == [9, 10]
+    assert track.get_segment(5) is None
+    assert track.get_segment(6).sequence == 6
+
+    http_client = await hass_client()
+    with patch.object(stream, "start"):
+        resp = await http_client.get("/api/hls/abcdef/segment/6.m4s")
+        assert resp.status == 200
+        body = await resp.read()
+        assert body[4:8] == b"moof"
+        assert body[20:24] == b"mdat"
+        assert len(body) == 32
+
+        resp = await http_client.get("/api/hls/abcdef/init.mp4")
+        assert resp.status == 200
+        body = await resp.read()
+        assert body[4:8] == b"ftyp"
+        assert body[20:24] == b"moov"
+        assert len(body) == 32
+
+        resp = await http_client.get("/api/hls/abcdef/segment/5.m4s")
+        assert resp.status == HTTP_NOT_FOUND
+
+    stream.keepalive = True
+    track.cleanup()
+    assert not track.get_segment()
@@ -6,11 +6,14 @@ import av
 import pytest
 
 from homeassistant.components.stream.core import Segment
-from homeassistant.components.stream.recorder import recorder_save_worker
+from homeassistant.components.stream.recorder import (
+    RecorderOutput,
+    recorder_save_worker,
+)
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
-from tests.async_mock import patch
+from tests.async_mock import MagicMock, patch
 from tests.common import async_fire_time_changed
 from tests.components.stream.common import generate_h264_video, preload_stream
 
@@ -118,3 +121,24 @@ async def test_record_stream_audio(hass, hass_client):
             assert len(result.streams.audio) == expected_audio_streams
             result.close()
             stream.stop()
+
+
+async def test_recorder_segments(hass):
+    """Test the recorder keeps all its segments."""
+    stream = MagicMock(hass=hass, keepalive=False)
+    recorder = RecorderOutput(stream)
+    for sequence in range(2, 7):
+        recorder.put(Segment(sequence, BytesIO(b"x"), 2))
+    recorder.prepend([Segment(1, BytesIO(b"x"), 3), Segment(2, BytesIO(b"x"), 2)])
+
+    assert recorder.segments == [1, 2, 3, 4, 5, 6]
+    assert recorder.get_segment(1).duration == 3
+    assert recorder.get_segment(7) is None
+    assert [s.sequence for s in recorder.lookback(3)] == [5, 6]
+    assert [s.sequence for s in recorder.lookback(60)] == [1, 2, 3, 4, 5, 6]
+
+    with patch("homeassistant.components.stream.recorder.threading.Thread") as thread:
+        recorder.cleanup()
+    assert [s.sequence for s in thread.call_args[1]["args"][1]] == [1, 2, 3, 4, 5, 6]
+    assert recorder.segments == []
+    recorder._unsub()
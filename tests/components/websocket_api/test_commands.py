@@ -397,6 +397,86 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_events_entity_ids(hass, websocket_client):
+    """Test subscribing to the events of specific entities."""
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_events",
+            "event_type": "state_changed",
+            "entity_ids": ["light.kitchen"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+
+    hass.states.async_set("light.hallway", "on")
+    hass.states.async_set("light.kitchen", "on")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"]["data"]["entity_id"] == "light.kitchen"
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+    assert hass.bus.async_listeners().get("state_changed") is None
+
+
+async def test_subscribe_events_share_serialized_event(hass, websocket_client):
+    """Test an event is serialized once for all subscriptions."""
+    for iden in (7, 8):
+        await websocket_client.send_json(
+            {"id": iden, "type": "subscribe_events", "event_type": "state_changed"}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == iden
+        assert msg["success"]
+
+    event_cache = hass.data[const.DATA_EVENT_MESSAGE_CACHE]
+    assert event_cache.serializations == 0
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 128})
+
+    idens = set()
+    for _ in range(2):
+        msg = await websocket_client.receive_json()
+        idens.add(msg["id"])
+        assert msg["type"] == "event"
+        assert msg["event"]["event_type"] == "state_changed"
+        assert msg["event"]["data"]["entity_id"] == "light.kitchen"
+        assert msg["event"]["data"]["new_state"]["attributes"] == {"brightness": 128}
+
+    assert idens == {7, 8}
+    assert event_cache.serializations == 1
+    assert event_cache.hits == 1
+    assert event_cache.time_saved > 0
+
+    await websocket_client.send_json({"id": 9, "type": "event_cache/stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["success"]
+    assert msg["result"]["serializations"] == 1
+    assert msg["result"]["hits"] == 1
+
+
+async def test_event_cache_stats_requires_admin(websocket_client, hass_admin_user):
+    """Test reading the event serialization counters without being admin."""
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 5, "type": "event_cache/stats"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_render_template_renders_template(
     hass, websocket_client, hass_admin_user
 ):
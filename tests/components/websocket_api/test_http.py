@@ -1,4 +1,5 @@
 """Test Websocket API http module."""
+import asyncio
 from datetime import timedelta
 
 from aiohttp import WSMsgType
@@ -66,6 +67,39 @@ async def test_pending_msg_peak(hass, mock_low_peak, hass_ws_client, caplog):
     assert "Client unable to keep up with pending messages" in caplog.text
 
 
+async def test_wait_writable(hass, mock_low_peak, hass_ws_client):
+    """Test waiting for the client to read pending messages."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    await instance._async_wait_writable()
+
+    # Stop the writer task and fill the queue up to the peak
+    instance._to_write.put_nowait(None)
+    await asyncio.sleep(0)
+    for _ in range(5):
+        instance._send_message({})
+
+    wait = hass.async_create_task(instance._async_wait_writable())
+    await asyncio.sleep(0)
+    assert not wait.done()
+
+    # Waiting ends when the connection is closed
+    await websocket_client.close()
+    await asyncio.wait_for(wait, 1)
+
+
 async def test_non_json_message(hass, websocket_client, caplog):
     """Test trying to serialze non JSON objects."""
     bad_data = object()
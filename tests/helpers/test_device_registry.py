@@ -370,6 +370,40 @@ async def test_deleted_device_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_for_area(registry):
+    """Test the devices of an area follow area changes and removals."""
+    entry = registry.async_get_or_create(
+        config_entry_id="123",
+        identifiers={("bridgeid", "0123")},
+        manufacturer="manufacturer",
+        model="model",
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="123",
+        identifiers={("bridgeid", "4567")},
+        manufacturer="manufacturer",
+        model="model",
+    )
+    assert device_registry.async_entries_for_area(registry, "12345A") == []
+
+    entry = registry.async_update_device(entry.id, area_id="12345A")
+    entry2 = registry.async_update_device(entry2.id, area_id="12345A")
+    assert device_registry.async_entries_for_area(registry, "12345A") == [
+        entry,
+        entry2,
+    ]
+
+    entry = registry.async_update_device(entry.id, area_id="67890B")
+    assert device_registry.async_entries_for_area(registry, "12345A") == [entry2]
+    assert device_registry.async_entries_for_area(registry, "67890B") == [entry]
+
+    registry.async_clear_area_id("67890B")
+    assert device_registry.async_entries_for_area(registry, "67890B") == []
+
+    registry.async_remove_device(entry2.id)
+    assert device_registry.async_entries_for_area(registry, "12345A") == []
+
+
 async def test_specifying_via_device_create(registry):
     """Test specifying a via_device and updating."""
     via = registry.async_get_or_create(
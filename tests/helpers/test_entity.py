@@ -7,10 +7,10 @@ import threading
 import pytest
 
 from homeassistant.const import ATTR_DEVICE_CLASS, STATE_UNAVAILABLE
-from homeassistant.core import Context
+from homeassistant.core import EXECUTOR_POLLING, Context
 from homeassistant.helpers import entity, entity_registry
 
-from tests.async_mock import MagicMock, PropertyMock, patch
+from tests.async_mock import MagicMock, Mock, PropertyMock, patch
 from tests.common import (
     MockConfigEntry,
     MockEntity,
@@ -725,3 +725,51 @@ async def test_setup_source(hass):
     await platform.async_reset()
 
     assert entity.entity_sources(hass) == {}
+
+
+async def test_sync_update_polling_lane(hass):
+    """Test sync updates of an integration can't take all the polling threads."""
+    hass.config.executor_lanes = {EXECUTOR_POLLING: 4}
+    test_lock = threading.Event()
+    updates = []
+
+    class SyncEntity(entity.Entity):
+        """Test entity."""
+
+        def __init__(self, entity_id, integration, hang):
+            """Initialize sync test entity."""
+            self.entity_id = entity_id
+            self.hass = hass
+            self.platform = Mock(platform_name=integration)
+            self._hang = hang
+
+        def update(self):
+            """Test update."""
+            updates.append(self.entity_id)
+            if self._hang:
+                test_lock.wait(timeout=5)
+
+    slow_1 = SyncEntity("sensor.slow_1", "slow", True)
+    slow_2 = SyncEntity("sensor.slow_2", "slow", True)
+    fast = SyncEntity("sensor.fast", "fast", False)
+
+    try:
+        slow_updates = [
+            hass.async_create_task(slow_1.async_device_update(warning=False)),
+            hass.async_create_task(slow_2.async_device_update(warning=False)),
+        ]
+        await fast.async_device_update(warning=False)
+        while "sensor.slow_1" not in updates:
+            await asyncio.sleep(0.01)
+
+        stats = hass.async_executor_lane_stats()[EXECUTOR_POLLING]
+        assert stats["max_workers"] == 4
+        assert stats["keys"]["fast"]["completed"] == 1
+        assert stats["keys"]["slow"]["running"] == 1
+        assert stats["keys"]["slow"]["queued"] == 1
+        assert "sensor.slow_2" not in updates
+    finally:
+        test_lock.set()
+
+    await asyncio.gather(*slow_updates)
+    assert sorted(updates) == ["sensor.fast", "sensor.slow_1", "sensor.slow_2"]
@@ -487,6 +487,33 @@ async def test_update_entity(registry):
         entry = updated_entry
 
 
+async def test_entries_for_device(registry):
+    """Test the entities of a device follow device changes and removals."""
+    entry = registry.async_get_or_create(
+        "light", "hue", "1234", device_id="mock-dev-id"
+    )
+    entry2 = registry.async_get_or_create(
+        "light", "hue", "5678", device_id="mock-dev-id"
+    )
+    registry.async_get_or_create("light", "hue", "9012")
+    assert entity_registry.async_entries_for_device(registry, "mock-dev-id") == [
+        entry,
+        entry2,
+    ]
+
+    entry = registry.async_update_entity(entry.entity_id, new_entity_id="light.renamed")
+    entry2 = registry.async_get_or_create(
+        "light", "hue", "5678", device_id="other-mock-dev-id"
+    )
+    assert entity_registry.async_entries_for_device(registry, "mock-dev-id") == [entry]
+    assert entity_registry.async_entries_for_device(registry, "other-mock-dev-id") == [
+        entry2
+    ]
+
+    registry.async_remove(entry.entity_id)
+    assert entity_registry.async_entries_for_device(registry, "mock-dev-id") == []
+
+
 async def test_disabled_by(registry):
     """Test that we can disable an entry when we create it."""
     entry = registry.async_get_or_create("light", "hue", "5678", disabled_by="hass")
@@ -1799,6 +1799,22 @@ async def test_async_track_time_change(hass):
     assert len(wildcard_runs) == 3
 
 
+async def test_async_track_utc_time_change_every_second(hass):
+    """Test tracking every second starts at the next second."""
+    runs = []
+
+    unsub = async_track_utc_time_change(hass, callback(lambda x: runs.append(x)))
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+    assert runs == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+
+    unsub()
+
+
 async def test_periodic_task_minute(hass):
     """Test periodic tasks per minute."""
     specific_runs = []
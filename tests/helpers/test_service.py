@@ -558,6 +558,34 @@ async def test_call_no_context_target_specific(
     assert mock_handle_entity_call.mock_calls[0][1][1].entity_id == "light.kitchen"
 
 
+async def test_call_target_specific_multiple_platforms(
+    hass, mock_handle_entity_call, mock_entities, caplog
+):
+    """Check targeted entities are looked up in every platform."""
+    other_entities = {
+        "light.garage": MockEntity(
+            entity_id="light.garage", available=True, should_poll=False
+        )
+    }
+    await service.entity_service_call(
+        hass,
+        [Mock(entities=mock_entities), Mock(entities=other_entities)],
+        Mock(),
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.garage", "light.bedroom", "light.non-existing"]},
+        ),
+    )
+
+    assert len(mock_handle_entity_call.mock_calls) == 2
+    assert {call[1][1].entity_id for call in mock_handle_entity_call.mock_calls} == {
+        "light.garage",
+        "light.bedroom",
+    }
+    assert "Unable to find referenced entities light.non-existing" in caplog.text
+
+
 async def test_call_with_match_all(
     hass, mock_handle_entity_call, mock_entities, caplog
 ):
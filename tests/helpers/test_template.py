@@ -2327,35 +2327,73 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_template_cache():
+    """Test compiled templates are shared and survive garbage collection."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
+    template._COMPILED_CACHE.clear()  # pylint: disable=protected-access
+
+    tpl = template.Template(template_string)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert template.compiled_template_cache_info() == {
+        "hits": 0,
+        "misses": 1,
+        "size": 1,
+        "maxsize": template.COMPILED_TEMPLATE_CACHE_SIZE,
+    }
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert tpl2._compiled_code is tpl._compiled_code  # pylint: disable=protected-access
 
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    tpl3 = template.Template(template_string)
+    tpl3.ensure_valid()
+    info = template.compiled_template_cache_info()
+    assert info["hits"] == 2
+    assert info["misses"] == 1
+
+
+def test_compiled_template_cache_is_bounded():
+    """Test the least recently used compiled template is dropped."""
+    cache = template.CompiledTemplateCache(2)
+    cache.set("one", 1)
+    cache.set("two", 2)
+    assert cache.get("one") == 1
+    cache.set("three", 3)
+
+    assert cache.get("two") is None
+    assert cache.get("one") == 1
+    assert cache.get("three") == 3
+    assert cache.info() == {"hits": 3, "misses": 1, "size": 2, "maxsize": 2}
+
+
+async def test_precompile_templates(hass):
+    """Test the templates of a config are compiled ahead of rendering."""
+    template._COMPILED_CACHE.clear()  # pylint: disable=protected-access
+    config = {
+        "sensor": [
+            {
+                "platform": "template",
+                "sensors": {
+                    "kitchen": {"value_template": "{{ states('sensor.one') }}"},
+                    "hallway": {"value_template": "{{ 1 + 1 }}"},
+                },
+            }
+        ],
+        "automation": [{"alias": "Not a template"}, {"broken": "{{ 1 + }}"}],
+        "script": {"greet": template.Template("{{ 'hello' }}")},
+    }
+
+    await template.async_precompile_templates(hass, config)
+
+    assert template.compiled_template_cache_info()["size"] == 3
+
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    assert tpl.async_render() == "2"
+    assert template.compiled_template_cache_info()["hits"] == 1
 
 
 def test_is_template_string():
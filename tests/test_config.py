@@ -2,6 +2,7 @@
 # pylint: disable=protected-access
 from collections import OrderedDict
 import copy
+from datetime import timedelta
 import os
 from unittest import mock
 
@@ -32,10 +33,10 @@ import homeassistant.helpers.check_config as check_config
 from homeassistant.helpers.entity import Entity
 from homeassistant.loader import async_get_integration
 from homeassistant.util import dt as dt_util
-from homeassistant.util.yaml import SECRET_YAML
+from homeassistant.util.yaml import SECRET_YAML, loader as yaml_loader
 
 from tests.async_mock import AsyncMock, Mock, patch
-from tests.common import get_test_config_dir, patch_yaml_files
+from tests.common import async_fire_time_changed, get_test_config_dir, patch_yaml_files
 
 CONFIG_DIR = get_test_config_dir()
 YAML_PATH = os.path.join(CONFIG_DIR, config_util.YAML_CONFIG_FILE)
@@ -580,6 +581,39 @@ async def test_async_hass_config_yaml_merge(merge_log_err, hass):
     assert len(conf["light"]) == 1
 
 
+async def test_async_hass_config_yaml_snapshot(hass, hass_storage, tmp_path):
+    """Test unchanged included files are stored in the config snapshot."""
+    hass.config.config_dir = str(tmp_path)
+    included = tmp_path / "lights.yaml"
+    included.write_text("- platform: test\n")
+    config = tmp_path / config_util.YAML_CONFIG_FILE
+    config.write_text("light: !include lights.yaml\n")
+    for path in (included, config):
+        os.utime(path, (1, 1))
+
+    conf = await config_util.async_hass_config_yaml(hass)
+    assert conf["light"] == [{"platform": "test"}]
+
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow()
+        + timedelta(seconds=config_util.CONFIG_SNAPSHOT_SAVE_DELAY + 1),
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[config_util.CONFIG_SNAPSHOT_STORAGE_KEY]["data"]
+    assert list(stored["entries"]) == [str(included)]
+
+    # The next start reads the included file from the snapshot
+    hass.data.pop(config_util.DATA_CONFIG_SNAPSHOT)
+    with patch(
+        "homeassistant.util.yaml.loader._load_yaml",
+        wraps=yaml_loader._load_yaml,
+    ) as mock_load:
+        conf = await config_util.async_hass_config_yaml(hass)
+    assert conf["light"] == [{"platform": "test"}]
+    assert mock_load.call_count == 1
+
+
 # pylint: disable=redefined-outer-name
 @pytest.fixture
 def merge_log_err(hass):
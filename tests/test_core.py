@@ -1,11 +1,13 @@
 """Test to verify that Home Assistant core works."""
 # pylint: disable=protected-access
 import asyncio
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 import functools
 import logging
 import os
 from tempfile import TemporaryDirectory
+import threading
 import unittest
 
 import pytest
@@ -38,7 +40,11 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
 from tests.async_mock import MagicMock, Mock, PropertyMock, patch
-from tests.common import async_mock_service, get_test_home_assistant
+from tests.common import (
+    async_capture_events,
+    async_mock_service,
+    get_test_home_assistant,
+)
 
 PST = pytz.timezone("America/Los_Angeles")
 
@@ -114,7 +120,7 @@ def test_async_add_job_add_threaded_job_to_pool():
 
 def test_async_create_task_schedule_coroutine(loop):
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=loop))
+    hass = MagicMock(loop=MagicMock(wraps=loop), job_wrapper=None)
 
     async def job():
         pass
@@ -455,6 +461,58 @@ class TestEventBus(unittest.TestCase):
         self.hass.block_till_done()
         assert len(coroutine_calls) == 1
 
+    def test_listen_indexed(self):
+        """Test listeners indexed by a value of the event data."""
+        calls = []
+
+        @ha.callback
+        def listener(event):
+            calls.append(event)
+
+        old_count = self.bus.listeners.get("test_indexed", 0)
+        unsub = self.bus.listen_indexed(
+            "test_indexed", "entity_id", ["light.kitchen", "light.bed"], listener
+        )
+        assert self.bus.listeners["test_indexed"] == old_count + 1
+
+        self.bus.fire("test_indexed", {"entity_id": "light.kitchen"})
+        self.bus.fire("test_indexed", {"entity_id": "light.hallway"})
+        self.bus.fire("test_indexed", {"entity_id": ["light.bed"]})
+        self.bus.fire("test_indexed")
+        self.bus.fire("other_event", {"entity_id": "light.bed"})
+        self.hass.block_till_done()
+
+        assert len(calls) == 1
+        assert calls[0].data["entity_id"] == "light.kitchen"
+
+        unsub()
+        assert self.bus.listeners.get("test_indexed", 0) == old_count
+
+        self.bus.fire("test_indexed", {"entity_id": "light.kitchen"})
+        self.hass.block_till_done()
+        assert len(calls) == 1
+
+        # Should do nothing now
+        unsub()
+
+    def test_listen_indexed_match_all(self):
+        """Test indexed listeners for all events."""
+        calls = []
+
+        @ha.callback
+        def listener(event):
+            calls.append(event)
+
+        self.bus.listen_indexed(MATCH_ALL, "entity_id", ["light.kitchen"], listener)
+
+        self.bus.fire("test_one", {"entity_id": "light.kitchen"})
+        self.bus.fire("test_two", {"entity_id": "light.kitchen"})
+        self.bus.fire("test_two", {"entity_id": "light.hallway"})
+        self.bus.fire(EVENT_TIME_CHANGED, {"entity_id": "light.kitchen"})
+        self.hass.block_till_done()
+
+        assert [event.event_type for event in calls] == ["test_one", "test_two"]
+
 
 def test_state_init():
     """Test state.init."""
@@ -1039,6 +1097,66 @@ def test_create_timer(mock_monotonic, loop):
     assert event_data[ATTR_NOW] == datetime(2018, 12, 31, 3, 4, 6, 100000)
 
 
+@patch("homeassistant.core.monotonic")
+def test_timer_without_time_changed_listeners(mock_monotonic, loop):
+    """Test the timer only fires time changed when it has listeners."""
+    hass = MagicMock()
+    hass.bus.async_has_listeners.return_value = False
+
+    mock_monotonic.side_effect = 10.2, 10.8, 11.3
+
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 5, 333333),
+    ):
+        ha._async_create_timer(hass)
+
+    delay, callback, target = hass.loop.call_later.mock_calls[0][1]
+
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 6, 100000),
+    ):
+        callback(target)
+
+    assert len(hass.bus.async_fire.mock_calls) == 0
+    assert len(hass.loop.call_later.mock_calls) == 2
+
+
+async def test_bus_has_listeners(hass):
+    """Test checking if an event type has listeners of its own."""
+    assert not hass.bus.async_has_listeners("test_event")
+
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, ha.callback(lambda e: None))
+    assert not hass.bus.async_has_listeners("test_event")
+
+    unsub = hass.bus.async_listen("test_event", ha.callback(lambda e: None))
+    assert hass.bus.async_has_listeners("test_event")
+    unsub()
+    assert not hass.bus.async_has_listeners("test_event")
+
+    unsub = hass.bus.async_listen_indexed(
+        "test_event", "entity_id", ["light.kitchen"], ha.callback(lambda e: None)
+    )
+    assert hass.bus.async_has_listeners("test_event")
+    unsub()
+    assert not hass.bus.async_has_listeners("test_event")
+
+    unsub_match_all()
+
+
+async def test_time_changed_not_sent_to_match_all(hass):
+    """Test time changed events only go to their own listeners."""
+    match_all_events = async_capture_events(hass, MATCH_ALL)
+    time_changed_events = async_capture_events(hass, EVENT_TIME_CHANGED)
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow()})
+    await hass.async_block_till_done()
+
+    assert len(time_changed_events) == 1
+    assert match_all_events == []
+
+
 @patch("homeassistant.core.monotonic")
 def test_timer_out_of_sync(mock_monotonic, loop):
     """Test create timer."""
@@ -1146,6 +1264,69 @@ async def test_track_task_functions(loop):
         await hass.async_stop()
 
 
+def _join_new_threads(threads_before):
+    """Wait for the threads started since threads_before to end."""
+    for thread in set(threading.enumerate()) - threads_before:
+        thread.join(10)
+
+
+async def test_async_add_process_job(loop):
+    """Test running jobs in worker processes until hass stops."""
+    threads_before = set(threading.enumerate())
+    hass = ha.HomeAssistant()
+    try:
+        assert await hass.async_add_process_job(divmod, 85, 2) == (42, 1)
+        assert await hass.async_add_process_job(os.getpid) != os.getpid()
+
+        async def job():
+            pass
+
+        with pytest.raises(ValueError):
+            hass.async_add_process_job(lambda: None)
+        with pytest.raises(ValueError):
+            hass.async_add_process_job(job)
+    finally:
+        await hass.async_stop(force=True)
+        # Stopping doesn't wait for the worker pool, the test does
+        _join_new_threads(threads_before)
+
+    with pytest.raises(RuntimeError):
+        hass.async_add_process_job(os.getpid)
+
+
+async def test_async_add_process_job_after_stop(loop):
+    """Test no worker pool is started once hass stopped."""
+    hass = ha.HomeAssistant()
+    await hass.async_stop(force=True)
+
+    with pytest.raises(RuntimeError):
+        hass.async_add_process_job(os.getpid)
+    assert hass._process_executor is None
+
+
+async def test_async_stop_stuck_process_job(loop):
+    """Test stopping hass doesn't wait for running process jobs."""
+    hass = ha.HomeAssistant()
+    hass._process_executor = executor = MagicMock()
+    await hass.async_stop(force=True)
+    executor.shutdown.assert_called_once_with(wait=False)
+
+
+async def test_async_add_process_job_broken_pool(loop):
+    """Test a new worker pool is started when a worker died."""
+    threads_before = set(threading.enumerate())
+    hass = ha.HomeAssistant()
+    try:
+        with pytest.raises(BrokenProcessPool):
+            await hass.async_add_process_job(os._exit, 1)
+
+        assert await hass.async_add_process_job(divmod, 85, 2) == (42, 1)
+    finally:
+        await hass.async_stop(force=True)
+        # Stopping doesn't wait for the worker pool, the test does
+        _join_new_threads(threads_before)
+
+
 async def test_service_executed_with_subservices(hass):
     """Test we block correctly till all services done."""
     calls = async_mock_service(hass, "test", "inner")
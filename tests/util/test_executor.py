@@ -0,0 +1,85 @@
+"""Test Home Assistant executor lanes."""
+import threading
+
+import pytest
+
+from homeassistant.util.executor import LaneExecutor
+
+
+def test_lane_executor_runs_jobs():
+    """Test jobs run in the lane and report how long they waited."""
+    executor = LaneExecutor("test", 2)
+    try:
+        assert executor.submit(divmod, 85, 2).result(timeout=5) == (42, 1)
+        with pytest.raises(ZeroDivisionError):
+            executor.submit(divmod, 1, 0).result(timeout=5)
+        assert (
+            executor.submit(threading.current_thread)
+            .result(timeout=5)
+            .name.startswith("TestWorker")
+        )
+    finally:
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert stats["max_workers"] == 2
+    assert stats["queued"] == 0
+    assert stats["running"] == 0
+    assert stats["completed"] == 3
+    assert stats["wait_max"] >= 0
+    assert stats["keys"] == {}
+
+    with pytest.raises(RuntimeError):
+        executor.submit(divmod, 85, 2)
+
+
+def test_lane_executor_key_limit():
+    """Test a key with hanging jobs can't take all the threads of the lane."""
+    executor = LaneExecutor("test", 4, key_limit=2)
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    def hang():
+        started.release()
+        return release.wait(5)
+
+    try:
+        hung = [executor.submit_keyed("slow", hang) for _ in range(4)]
+        assert started.acquire(timeout=5) and started.acquire(timeout=5)
+        # The other keys still get a thread
+        assert executor.submit_keyed("fast", divmod, 85, 2).result(timeout=5) == (
+            42,
+            1,
+        )
+        assert executor.submit(divmod, 85, 2).result(timeout=5) == (42, 1)
+
+        stats = executor.stats()
+        assert stats["keys"]["slow"]["running"] == 2
+        assert stats["keys"]["slow"]["queued"] == 2
+        assert stats["keys"]["fast"]["completed"] == 1
+        assert stats["queued"] == 2
+
+        release.set()
+        assert all(future.result(timeout=5) for future in hung)
+    finally:
+        release.set()
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert stats["keys"]["slow"]["completed"] == 4
+    assert stats["completed"] == 6
+    assert stats["queued"] == 0
+
+
+def test_lane_executor_shutdown_cancels_held_jobs():
+    """Test jobs held back by the key limit are cancelled on shutdown."""
+    executor = LaneExecutor("test", 2, key_limit=1)
+    release = threading.Event()
+    running = executor.submit_keyed("slow", release.wait, 5)
+    held = executor.submit_keyed("slow", release.wait, 5)
+
+    executor.shutdown(wait=False)
+    assert held.cancelled()
+    release.set()
+    assert running.result(timeout=5)
+    assert executor.stats()["queued"] == 0
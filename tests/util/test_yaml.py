@@ -1,5 +1,6 @@
 """Test Home Assistant yaml loader."""
 import io
+import json
 import logging
 import os
 import unittest
@@ -461,3 +462,87 @@ def test_duplicate_key(caplog):
     with patch_yaml_files(files):
         load_yaml_config_file(YAML_CONFIG_FILE)
     assert "contains duplicate key" in caplog.text
+
+
+def _write_old(path, content):
+    """Write a file with a modification time the snapshot can rely on."""
+    path.write_text(content)
+    os.utime(path, (1, len(content)))
+
+
+def _load_with_snapshot(snapshot, fname):
+    """Load a YAML file using the snapshot and restore it like a restart."""
+    with snapshot.session() as session:
+        data = yaml.load_yaml(fname)
+    return (
+        data,
+        session,
+        yaml.ConfigSnapshot(json.loads(json.dumps(snapshot.as_dict()))),
+    )
+
+
+def test_snapshot_reuses_unchanged_files(tmp_path):
+    """Test only changed files are parsed again."""
+    packages = tmp_path / "packages"
+    packages.mkdir()
+    _write_old(packages / "one.yaml", "one:\n  value: 1\n")
+    _write_old(packages / "two.yaml", "two:\n  value: 2\n  name: !env_var HOME\n")
+    _write_old(packages / "three.yaml", "three:\n  - 3\n")
+    config = tmp_path / YAML_CONFIG_FILE
+    _write_old(config, "name: Home\npackages: !include_dir_merge_named packages\n")
+
+    data, session, snapshot = _load_with_snapshot(yaml.ConfigSnapshot(), str(config))
+    assert (session.hits, session.misses) == (0, 4)
+
+    # Files including other files or using environment variables are parsed
+    data, session, snapshot = _load_with_snapshot(snapshot, str(config))
+    assert (session.hits, session.misses) == (2, 2)
+    assert data["packages"]["one"] == {"value": 1}
+    assert data["packages"]["one"].__config_file__ == str(packages / "one.yaml")
+    assert data["packages"]["one"].__line__ == 1
+    assert data["packages"]["three"] == [3]
+    assert data["packages"]["three"].__line__ == 1
+    assert data["packages"].__line__ == 1
+
+    # Results are not shared between loads
+    data["packages"]["one"]["value"] = 3
+    data, session, snapshot = _load_with_snapshot(snapshot, str(config))
+    assert data["packages"]["one"] == {"value": 1}
+
+    _write_old(packages / "one.yaml", "one:\n  value: 11\n")
+    data, session, snapshot = _load_with_snapshot(snapshot, str(config))
+    assert (session.hits, session.misses) == (1, 3)
+    assert data["packages"]["one"] == {"value": 11}
+
+    # Recently modified files are not stored
+    (packages / "three.yaml").write_text("three:\n  - 33\n")
+    for _ in range(2):
+        data, session, snapshot = _load_with_snapshot(snapshot, str(config))
+        assert (session.hits, session.misses) == (1, 3)
+        assert data["packages"]["three"] == [33]
+
+
+def test_snapshot_skips_secrets(tmp_path):
+    """Test nothing read from secrets is stored."""
+    _write_old(tmp_path / yaml.SECRET_YAML, "password: secret\n")
+    _write_old(tmp_path / "included.yaml", "password: !secret password\n")
+    config = tmp_path / YAML_CONFIG_FILE
+    _write_old(config, "included: !include included.yaml\n")
+    snapshot = yaml.ConfigSnapshot()
+
+    for _ in range(2):
+        data, session, snapshot = _load_with_snapshot(snapshot, str(config))
+        assert data["included"]["password"] == "secret"
+        assert session.misses == 2
+
+    assert "secret" not in json.dumps(snapshot.as_dict())
+    yaml.clear_secret_cache()
+
+    with patch.object(
+        yaml_loader, "keyring", FakeKeyring({"keyring_password": "keyring"})
+    ), patch.object(yaml_loader, "credstash", None):
+        _write_old(config, "password: !secret keyring_password\n")
+        data, session, snapshot = _load_with_snapshot(snapshot, str(config))
+        assert data["password"] == "keyring"
+
+    assert "keyring" not in json.dumps(snapshot.as_dict())